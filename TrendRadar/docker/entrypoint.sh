@@ -15,6 +15,18 @@ case "${RUN_MODE:-cron}" in
     echo "🔄 单次执行"
     exec /usr/local/bin/python -m trendradar
     ;;
+"daemon")
+    # 常驻进程模式：内部定时执行，复用连接与已加载的配置，配置文件修改后自动重新加载
+    echo "♻️ 守护进程模式，运行间隔 ${DAEMON_INTERVAL:-30} 分钟"
+
+    # 启动 Web 服务器（如果配置了）
+    if [ "${ENABLE_WEBSERVER:-false}" = "true" ]; then
+        echo "🌐 启动 Web 服务器..."
+        /usr/local/bin/python manage.py start_webserver
+    fi
+
+    exec /usr/local/bin/python -m trendradar --daemon
+    ;;
 "cron")
     # 生成 crontab
     echo "${CRON_SCHEDULE:-*/30 * * * *} cd /app && /usr/local/bin/python -m trendradar" > /tmp/crontab
@@ -2,21 +2,39 @@
 数据解析服务
 
 v2.0.0: 仅支持 SQLite 数据库，移除 TXT 文件支持
-新存储结构：output/{type}/{date}.db
+新存储结构：output/{type}/{date}.db（已归档的日期为 output/{type}/{date}.db.xz，读取时解压到 output/.archive_cache/）
+启用数据仓库时，跨日期查询优先读取 output/warehouse.db
 """
 
+import os
 import re
-import sqlite3
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from datetime import datetime
+from sys import intern
+from typing import Dict, Iterator, List, Tuple, Optional
+from datetime import datetime, timedelta
 
 import yaml
 
+from trendradar.storage.archive import resolve_database
+from trendradar.storage.connection import SQLiteConnectionPool
+from trendradar.storage.warehouse import get_warehouse_path
+
 from ..utils.errors import FileParseError, DataNotFoundError
 from .cache_service import get_cache
 
 
+# 全局只读连接池：各工具的 ParserService 共享，跨请求复用连接
+# 多日查询会依次打开多个日期的数据库，上限按一个月的 news + rss 估算
+_db_pool = SQLiteConnectionPool(max_connections=64, readonly=True)
+
+
+def _init_warehouse_connection(conn) -> None:
+    """数据仓库连接打开时注册 py_lower（Python 的 lower()，SQLite 的 lower 只处理 ASCII）"""
+    conn.create_function("py_lower", 1, str.lower, deterministic=True)
+
+
 class ParserService:
     """数据解析服务类"""
 
@@ -34,6 +52,7 @@ class ParserService:
             self.project_root = Path(project_root)
 
         self.cache = get_cache()
+        self._warehouse_enabled: Optional[bool] = None
 
     @staticmethod
     def clean_title(title: str) -> str:
@@ -61,6 +80,7 @@ class ParserService:
         获取数据库文件路径
 
         新结构：output/{type}/{date}.db
+        已归档的日期（{date}.db.xz）解压到 output/.archive_cache/ 后返回解压后的路径
 
         Args:
             date: 日期对象，默认为今天
@@ -70,10 +90,8 @@ class ParserService:
             数据库文件路径，如果不存在则返回 None
         """
         date_str = self.get_date_folder_name(date)
-        db_path = self.project_root / "output" / db_type / f"{date_str}.db"
-        if db_path.exists():
-            return db_path
-        return None
+        output_dir = self.project_root / "output"
+        return resolve_database(output_dir / db_type / f"{date_str}.db", output_dir / ".archive_cache")
 
     def _read_from_sqlite(
         self,
@@ -101,21 +119,19 @@ class ParserService:
         all_timestamps = {}
 
         try:
-            conn = sqlite3.connect(str(db_path))
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            if db_type == "news":
-                return self._read_news_from_sqlite(cursor, platform_ids, all_titles, id_to_name, all_timestamps)
-            elif db_type == "rss":
-                return self._read_rss_from_sqlite(cursor, platform_ids, all_titles, id_to_name, all_timestamps)
+            with _db_pool.connection(db_path) as conn:
+                cursor = conn.cursor()
+                try:
+                    if db_type == "news":
+                        return self._read_news_from_sqlite(cursor, platform_ids, all_titles, id_to_name, all_timestamps)
+                    elif db_type == "rss":
+                        return self._read_rss_from_sqlite(cursor, platform_ids, all_titles, id_to_name, all_timestamps)
+                finally:
+                    cursor.close()
 
         except Exception as e:
             print(f"Warning: 从 SQLite 读取数据失败: {e}")
             return None
-        finally:
-            if 'conn' in locals():
-                conn.close()
 
     def _read_news_from_sqlite(
         self,
@@ -135,50 +151,46 @@ class ParserService:
             return None
 
         # 构建查询
+        platform_filter = ""
         if platform_ids:
             placeholders = ','.join(['?' for _ in platform_ids])
-            query = f"""
-                SELECT n.id, n.platform_id, p.name as platform_name, n.title,
-                       n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
-                FROM news_items n
-                LEFT JOIN platforms p ON n.platform_id = p.id
-                WHERE n.platform_id IN ({placeholders})
-            """
-            cursor.execute(query, platform_ids)
-        else:
-            cursor.execute("""
-                SELECT n.id, n.platform_id, p.name as platform_name, n.title,
-                       n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
-                FROM news_items n
-                LEFT JOIN platforms p ON n.platform_id = p.id
-            """)
+            platform_filter = f"WHERE n.platform_id IN ({placeholders})"
+        params = list(platform_ids) if platform_ids else []
+
+        cursor.execute(f"""
+            SELECT n.id, n.platform_id, p.name as platform_name, n.title,
+                   n.rank, n.url, n.mobile_url,
+                   n.first_crawl_time, n.last_crawl_time, n.crawl_count
+            FROM news_items n
+            LEFT JOIN platforms p ON n.platform_id = p.id
+            {platform_filter}
+        """, params)
 
         rows = cursor.fetchall()
 
-        # 收集所有 news_item_id 用于查询历史排名
-        news_ids = [row['id'] for row in rows]
+        # 通过 JOIN 按 (news_item_id, crawl_time) 顺序流式读取历史排名，
+        # 避免为每个新闻条目拼接一个 IN 参数（条目多时超出 SQLite 参数上限）；
+        # 按平台过滤时改用子查询，排名历史仍沿 idx_rank_history_news_time 读取，无需临时排序
         rank_history_map = {}
 
-        if news_ids:
-            placeholders = ",".join("?" * len(news_ids))
+        if rows:
+            if platform_filter:
+                rank_source = f"WHERE rh.news_item_id IN (SELECT n.id FROM news_items n {platform_filter})"
+            else:
+                rank_source = "JOIN news_items n ON n.id = rh.news_item_id"
             cursor.execute(f"""
-                SELECT news_item_id, rank FROM rank_history
-                WHERE news_item_id IN ({placeholders})
-                ORDER BY news_item_id, crawl_time
-            """, news_ids)
-
-            for rh_row in cursor.fetchall():
-                news_id = rh_row['news_item_id']
-                rank = rh_row['rank']
-                if news_id not in rank_history_map:
-                    rank_history_map[news_id] = []
-                rank_history_map[news_id].append(rank)
+                SELECT rh.news_item_id, rh.rank
+                FROM rank_history rh
+                {rank_source}
+                ORDER BY rh.news_item_id, rh.crawl_time
+            """, params)
+
+            for news_id, group in groupby(cursor, key=itemgetter(0)):
+                rank_history_map[news_id] = [rh_row[1] for rh_row in group]
 
         for row in rows:
             news_id = row['id']
-            platform_id = row['platform_id']
+            platform_id = intern(row['platform_id'])
             platform_name = row['platform_name'] or platform_id
             title = row['title']
 
@@ -194,8 +206,9 @@ class ParserService:
                 "ranks": ranks,
                 "url": row['url'] or "",
                 "mobileUrl": row['mobile_url'] or "",
-                "first_time": row['first_crawl_time'] or "",
-                "last_time": row['last_crawl_time'] or "",
+                # 抓取时间在多日数据中大量重复，驻留后共享同一字符串
+                "first_time": intern(row['first_crawl_time'] or ""),
+                "last_time": intern(row['last_crawl_time'] or ""),
                 "count": row['crawl_count'] or 1,
             }
 
@@ -261,7 +274,7 @@ class ParserService:
         rows = cursor.fetchall()
 
         for row in rows:
-            feed_id = row['feed_id']
+            feed_id = intern(row['feed_id'])
             feed_name = row['feed_name'] or feed_id
             title = row['title']
 
@@ -276,8 +289,8 @@ class ParserService:
                 "published_at": row['published_at'] or "",
                 "summary": row['summary'] or "",
                 "author": row['author'] or "",
-                "first_time": row['first_crawl_time'] or "",
-                "last_time": row['last_crawl_time'] or "",
+                "first_time": intern(row['first_crawl_time'] or ""),
+                "last_time": intern(row['last_crawl_time'] or ""),
                 "count": row['crawl_count'] or 1,
             }
 
@@ -341,6 +354,146 @@ class ParserService:
             suggestion="请先运行爬虫或检查日期是否正确"
         )
 
+    def _get_warehouse_path(self) -> Optional[Path]:
+        """
+        获取可用的数据仓库路径
+
+        需在配置中启用（storage.warehouse.enabled 或环境变量 WAREHOUSE_ENABLED），
+        未启用时抓取程序不再更新数据仓库，其中的数据可能已过期。
+
+        Returns:
+            数据仓库路径，未启用或文件不存在时返回 None
+        """
+        if self._warehouse_enabled is None:
+            env_value = os.environ.get("WAREHOUSE_ENABLED", "").strip().lower()
+            if env_value:
+                self._warehouse_enabled = env_value in ("true", "1")
+            else:
+                try:
+                    storage_config = self.parse_yaml_config().get("storage", {}) or {}
+                    self._warehouse_enabled = bool((storage_config.get("warehouse") or {}).get("enabled", False))
+                except FileParseError:
+                    self._warehouse_enabled = False
+
+        if not self._warehouse_enabled:
+            return None
+
+        warehouse_path = get_warehouse_path(self.project_root / "output")
+        return warehouse_path if warehouse_path.exists() else None
+
+    def _query_warehouse(
+        self,
+        conn,
+        start_str: str,
+        end_str: str,
+        platform_ids: Optional[List[str]],
+        keyword: Optional[str],
+    ):
+        """
+        在数据仓库中查询日期范围内的标题（一条 SQL）
+
+        范围内已汇总的日期与磁盘上的日期数据库不一致时（如尚未导入、已被清理）返回 None，
+        由调用方回退到逐日读取。
+
+        Returns:
+            按 (日期, 平台首次出现顺序, 标题首次出现顺序) 排列的游标，或 None
+        """
+        available = {d for d in self.get_available_dates("news") if start_str <= d <= end_str}
+        covered = {row[0] for row in conn.execute(
+            "SELECT date FROM sources WHERE date BETWEEN ? AND ?", (start_str, end_str)
+        )}
+        if covered != available:
+            return None
+
+        conditions = ["date BETWEEN ? AND ?"]
+        params: List = [start_str, end_str]
+        if platform_ids:
+            conditions.append(f"platform_id IN ({','.join('?' for _ in platform_ids)})")
+            params.extend(platform_ids)
+        if keyword:
+            # 使用 Python 的 lower()，与逐日读取时的大小写不敏感匹配一致
+            conditions.append("instr(py_lower(title), ?) > 0")
+            params.append(keyword.lower())
+
+        return conn.execute(f"""
+            SELECT date, platform_id, platform_name, title, ranks, url, mobile_url,
+                   first_crawl_time, last_crawl_time, crawl_count
+            FROM titles
+            WHERE {' AND '.join(conditions)}
+            ORDER BY date, platform_seq, item_seq
+        """, params)
+
+    def iter_titles_for_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        platform_ids: Optional[List[str]] = None,
+        keyword: Optional[str] = None,
+    ) -> Iterator[Tuple[str, str, str, str, Dict]]:
+        """
+        按日期顺序遍历日期范围内的热榜标题
+
+        启用数据仓库且覆盖整个范围时用一条 SQL 读取，否则逐日调用 read_all_titles_for_date。
+        两种方式返回的标题及其信息一致。
+
+        Args:
+            start_date: 开始日期
+            end_date: 结束日期（包含）
+            platform_ids: 平台ID列表，None表示所有平台
+            keyword: 只返回包含该关键词的标题（不区分大小写）
+
+        Yields:
+            (日期字符串, 平台ID, 平台名称, 标题, 标题信息) 元组，
+            标题信息与 read_all_titles_for_date 中的字段相同（ranks / url / mobileUrl / first_time / last_time / count）
+        """
+        start_str = self.get_date_folder_name(start_date)
+        end_str = self.get_date_folder_name(end_date)
+
+        warehouse_path = self._get_warehouse_path()
+        if warehouse_path is not None:
+            # 先读出全部结果再归还连接，避免调用方处理期间长时间占用共享连接
+            rows = None
+            with _db_pool.connection(warehouse_path, on_open=_init_warehouse_connection) as conn:
+                try:
+                    cursor = self._query_warehouse(conn, start_str, end_str, platform_ids, keyword)
+                    if cursor is not None:
+                        rows = cursor.fetchall()
+                except Exception as e:
+                    print(f"Warning: 从数据仓库读取数据失败: {e}")
+
+            if rows is not None:
+                for row in rows:
+                    yield row[0], intern(row[1]), row[2], row[3], {
+                        "ranks": [int(rank) for rank in row[4].split(",")],
+                        "url": row[5],
+                        "mobileUrl": row[6],
+                        "first_time": intern(row[7]),
+                        "last_time": intern(row[8]),
+                        "count": row[9],
+                    }
+                return
+
+        keyword_lower = keyword.lower() if keyword else None
+        current_date = start_date
+        while current_date <= end_date:
+            date_str = self.get_date_folder_name(current_date)
+            try:
+                all_titles, id_to_name, _ = self.read_all_titles_for_date(
+                    date=current_date,
+                    platform_ids=platform_ids
+                )
+            except DataNotFoundError:
+                all_titles, id_to_name = {}, {}
+
+            for platform_id, titles in all_titles.items():
+                platform_name = id_to_name.get(platform_id, platform_id)
+                for title, info in titles.items():
+                    if keyword_lower and keyword_lower not in title.lower():
+                        continue
+                    yield date_str, platform_id, platform_name, title, info
+
+            current_date += timedelta(days=1)
+
     def parse_yaml_config(self, config_path: str = None) -> dict:
         """
         解析YAML配置文件
@@ -422,11 +575,12 @@ class ParserService:
         if not db_dir.exists():
             return []
 
-        dates = []
-        for db_file in db_dir.glob("*.db"):
-            date_match = re.match(r'(\d{4}-\d{2}-\d{2})\.db$', db_file.name)
+        dates = set()
+        for db_file in db_dir.glob("*.db*"):
+            # 包含已归档的日期（{date}.db.xz）
+            date_match = re.match(r'(\d{4}-\d{2}-\d{2})\.db(?:\.xz)?$', db_file.name)
             if date_match:
-                dates.append(date_match.group(1))
+                dates.add(date_match.group(1))
 
         return sorted(dates, reverse=True)
 
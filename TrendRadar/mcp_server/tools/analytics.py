@@ -307,38 +307,24 @@ class AnalyticsTools:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=6)
 
-            # 收集趋势数据
+            # 一次读取整个日期范围内包含话题的标题
+            matched_by_date = defaultdict(list)
+            for date_str, _, _, title, _ in self.data_service.parser.iter_titles_for_range(
+                start_date, end_date, keyword=topic
+            ):
+                matched_by_date[date_str].append(title)
+
+            # 收集趋势数据（没有数据的日期计为 0）
             trend_data = []
             current_date = start_date
 
             while current_date <= end_date:
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    # 统计该时间点的话题出现次数
-                    count = 0
-                    matched_titles = []
-
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
-                                matched_titles.append(title)
-
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": count,
-                        "sample_titles": matched_titles[:3]  # 只保留前3个样本
-                    })
-
-                except DataNotFoundError:
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": 0,
-                        "sample_titles": []
-                    })
+                matched_titles = matched_by_date.get(current_date.strftime("%Y-%m-%d"), [])
+                trend_data.append({
+                    "date": current_date.strftime("%Y-%m-%d"),
+                    "count": len(matched_titles),
+                    "sample_titles": matched_titles[:3]  # 只保留前3个样本
+                })
 
                 # 按天增加时间
                 current_date += timedelta(days=1)
@@ -2427,44 +2413,27 @@ class AnalyticsTools:
         all_keywords = Counter()
         platform_stats = Counter()
 
-        current_date = start_date
-        while current_date <= end_date:
-            try:
-                all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                    date=current_date,
-                    platform_ids=platforms
-                )
-
-                for platform_id, titles in all_titles.items():
-                    platform_name = id_to_name.get(platform_id, platform_id)
-
-                    for title, info in titles.items():
-                        # 如果指定了话题，过滤不相关的新闻
-                        if topic and topic.lower() not in title.lower():
-                            continue
-
-                        news_item = {
-                            "title": title,
-                            "platform": platform_id,
-                            "platform_name": platform_name,
-                            "date": current_date.strftime("%Y-%m-%d"),
-                            "ranks": info.get("ranks", []),
-                            "rank": info["ranks"][0] if info["ranks"] else 999
-                        }
-                        news_item["weight"] = calculate_news_weight(news_item)
-                        all_news.append(news_item)
-
-                        # 统计平台
-                        platform_stats[platform_name] += 1
-
-                        # 提取关键词
-                        keywords = self._extract_keywords(title)
-                        all_keywords.update(keywords)
+        # 一次读取整个时期的数据，指定话题时只返回相关新闻
+        for date_str, platform_id, platform_name, title, info in self.data_service.parser.iter_titles_for_range(
+            start_date, end_date, platform_ids=platforms, keyword=topic
+        ):
+            news_item = {
+                "title": title,
+                "platform": platform_id,
+                "platform_name": platform_name,
+                "date": date_str,
+                "ranks": info.get("ranks", []),
+                "rank": info["ranks"][0] if info["ranks"] else 999
+            }
+            news_item["weight"] = calculate_news_weight(news_item)
+            all_news.append(news_item)
 
-            except DataNotFoundError:
-                pass
+            # 统计平台
+            platform_stats[platform_name] += 1
 
-            current_date += timedelta(days=1)
+            # 提取关键词
+            keywords = self._extract_keywords(title)
+            all_keywords.update(keywords)
 
         return {
             "news": all_news,
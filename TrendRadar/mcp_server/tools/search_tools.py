@@ -609,62 +609,44 @@ class SearchTools:
 
             # 收集所有相关新闻
             all_related_news = []
-            current_date = search_start
 
-            while current_date <= search_end:
-                try:
-                    # 读取该日期的数据
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(current_date)
-
-                    # 搜索相关新闻
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
+            for date_str, platform_id, platform_name, title, info in self.data_service.parser.iter_titles_for_range(
+                search_start, search_end
+            ):
+                # 计算标题相似度
+                title_similarity = self._calculate_similarity(reference_title, title)
 
-                        for title, info in titles.items():
-                            # 计算标题相似度
-                            title_similarity = self._calculate_similarity(reference_title, title)
-
-                            # 提取标题关键词
-                            title_keywords = self._extract_keywords(title)
+                # 提取标题关键词
+                title_keywords = self._extract_keywords(title)
 
-                            # 计算关键词重合度
-                            keyword_overlap = self._calculate_keyword_overlap(
-                                reference_keywords,
-                                title_keywords
-                            )
-
-                            # 综合相似度 (70% 关键词重合 + 30% 文本相似度)
-                            combined_score = keyword_overlap * 0.7 + title_similarity * 0.3
+                # 计算关键词重合度
+                keyword_overlap = self._calculate_keyword_overlap(
+                    reference_keywords,
+                    title_keywords
+                )
 
-                            if combined_score >= threshold:
-                                news_item = {
-                                    "title": title,
-                                    "platform": platform_id,
-                                    "platform_name": platform_name,
-                                    "date": current_date.strftime("%Y-%m-%d"),
-                                    "similarity_score": round(combined_score, 4),
-                                    "keyword_overlap": round(keyword_overlap, 4),
-                                    "text_similarity": round(title_similarity, 4),
-                                    "common_keywords": list(set(reference_keywords) & set(title_keywords)),
-                                    "rank": info["ranks"][0] if info["ranks"] else 0
-                                }
+                # 综合相似度 (70% 关键词重合 + 30% 文本相似度)
+                combined_score = keyword_overlap * 0.7 + title_similarity * 0.3
 
-                                # 条件性添加 URL 字段
-                                if include_url:
-                                    news_item["url"] = info.get("url", "")
-                                    news_item["mobileUrl"] = info.get("mobileUrl", "")
-
-                                all_related_news.append(news_item)
+                if combined_score >= threshold:
+                    news_item = {
+                        "title": title,
+                        "platform": platform_id,
+                        "platform_name": platform_name,
+                        "date": date_str,
+                        "similarity_score": round(combined_score, 4),
+                        "keyword_overlap": round(keyword_overlap, 4),
+                        "text_similarity": round(title_similarity, 4),
+                        "common_keywords": list(set(reference_keywords) & set(title_keywords)),
+                        "rank": info["ranks"][0] if info["ranks"] else 0
+                    }
 
-                except DataNotFoundError:
-                    # 该日期没有数据，继续下一天
-                    pass
-                except Exception as e:
-                    # 记录错误但继续处理其他日期
-                    print(f"Warning: 处理日期 {current_date.strftime('%Y-%m-%d')} 时出错: {e}")
+                    # 条件性添加 URL 字段
+                    if include_url:
+                        news_item["url"] = info.get("url", "")
+                        news_item["mobileUrl"] = info.get("mobileUrl", "")
 
-                # 移动到下一天
-                current_date += timedelta(days=1)
+                    all_related_news.append(news_item)
 
             if not all_related_news:
                 return {
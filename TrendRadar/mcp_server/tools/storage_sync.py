@@ -34,6 +34,7 @@ class StorageSyncTools:
 
         self._config = None
         self._remote_backend = None
+        self._warehouse = None
 
     def _load_config(self) -> dict:
         """加载配置文件"""
@@ -64,6 +65,7 @@ class StorageSyncTools:
             "access_key_id": remote_config.get("access_key_id") or os.environ.get("S3_ACCESS_KEY_ID", ""),
             "secret_access_key": remote_config.get("secret_access_key") or os.environ.get("S3_SECRET_ACCESS_KEY", ""),
             "region": remote_config.get("region") or os.environ.get("S3_REGION", ""),
+            "max_workers": remote_config.get("max_workers", 8),
         }
 
     def _has_remote_config(self) -> bool:
@@ -98,6 +100,8 @@ class StorageSyncTools:
                 endpoint_url=remote_config["endpoint_url"],
                 region=remote_config.get("region", ""),
                 timezone=timezone,
+                max_workers=remote_config.get("max_workers", 8),
+                warehouse=self._get_warehouse(),
             )
             return self._remote_backend
         except ImportError:
@@ -107,6 +111,58 @@ class StorageSyncTools:
             print(f"[存储同步] 创建远程后端失败: {e}")
             return None
 
+    def _get_warehouse(self):
+        """
+        获取数据仓库（启用时拉取到的热榜数据同步更新到数据仓库，未启用时返回 None）
+
+        首次获取时导入历史数据，之后复用同一实例，在 cleanup 中关闭。
+        """
+        if self._warehouse is not None:
+            return self._warehouse
+
+        env_value = os.environ.get("WAREHOUSE_ENABLED", "").strip().lower()
+        if env_value:
+            enabled = env_value in ("true", "1")
+        else:
+            enabled = bool((self._get_storage_config().get("warehouse") or {}).get("enabled", False))
+        if not enabled:
+            return None
+
+        from trendradar.storage.warehouse import NewsWarehouse, get_warehouse_path
+
+        # 保留天数与主程序一致：取本地 / 远程中已配置的较长者（环境变量优先）
+        storage_config = self._get_storage_config()
+        retention_days = 0
+        for scope in ("local", "remote"):
+            env_value = os.environ.get(f"{scope.upper()}_RETENTION_DAYS", "").strip()
+            value = env_value if env_value.isdigit() else (storage_config.get(scope) or {}).get("retention_days", 0)
+            retention_days = max(retention_days, int(value or 0))
+
+        local_dir = self._get_local_data_dir()
+        self._warehouse = NewsWarehouse(get_warehouse_path(local_dir), retention_days=retention_days)
+        try:
+            self._warehouse.backfill(local_dir / "news")
+        except Exception as e:
+            print(f"[存储同步] 数据仓库导入历史数据失败: {e}")
+        return self._warehouse
+
+    def cleanup(self) -> None:
+        """清理资源（关闭远程后端和数据仓库）"""
+        if self._remote_backend is not None:
+            self._remote_backend.cleanup()
+            self._remote_backend = None
+        if self._warehouse is not None:
+            self._warehouse.close()
+            self._warehouse = None
+
+    def __del__(self):
+        """析构函数，确保关闭连接"""
+        try:
+            self.cleanup()
+        except Exception:
+            # Python 关闭时可能会出错，忽略即可
+            pass
+
     def _get_local_data_dir(self) -> Path:
         """获取本地数据目录"""
         storage_config = self._get_storage_config()
@@ -152,7 +208,7 @@ class StorageSyncTools:
         """
         获取本地可用的日期列表
 
-        存储结构: output/{db_type}/{date}.db
+        存储结构: output/{db_type}/{date}.db（已归档为 {date}.db.xz）
         例如: output/news/2025-12-30.db, output/rss/2025-12-30.db
 
         Args:
@@ -167,13 +223,13 @@ class StorageSyncTools:
         if not local_dir.exists():
             return []
 
-        # 扫描 output/{db_type}/{date}.db 文件
+        # 扫描 output/{db_type}/{date}.db 及归档的 {date}.db.xz 文件
         type_dir = local_dir / db_type
         if type_dir.exists():
             for item in type_dir.iterdir():
-                if item.is_file() and item.suffix == ".db":
+                if item.is_file() and item.name.endswith((".db", ".db.xz")):
                     # 从文件名解析日期 (2025-12-30.db -> 2025-12-30)
-                    date_str = item.stem  # 去除 .db 后缀
+                    date_str = item.name.split(".", 1)[0]
                     folder_date = self._parse_date_folder_name(date_str)
                     if folder_date:
                         dates.add(folder_date.strftime("%Y-%m-%d"))
@@ -248,53 +304,38 @@ class StorageSyncTools:
             local_dir = self._get_local_data_dir()
             local_dir.mkdir(parents=True, exist_ok=True)
 
-            # 获取远程可用日期
-            remote_dates = remote_backend.list_remote_dates()
-
-            # 获取本地已有日期
-            local_dates = set(self._get_local_dates())
-
             # 计算需要拉取的日期（最近 N 天）
             from trendradar.utils.time import get_configured_time
             config = self._load_config()
             timezone = config.get("app", {}).get("timezone", "Asia/Shanghai")
             now = get_configured_time(timezone)
+            target_dates = [(now - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days)]
+
+            # 并行拉取 news / rss 数据库（对比本地拉取清单，跳过未变化的文件）
+            results = remote_backend.pull_dates(target_dates, str(local_dir))
 
-            target_dates = []
-            for i in range(days):
-                date = now - timedelta(days=i)
-                date_str = date.strftime("%Y-%m-%d")
-                if date_str in remote_dates:
-                    target_dates.append(date_str)
+            # 按日期汇总：任一类型有下载即为已同步，有失败即为失败，远程都不存在的日期不计入
+            statuses: Dict[str, List[Dict]] = {}
+            for result in results:
+                statuses.setdefault(result["date"], []).append(result)
 
-            # 执行拉取
             synced_dates = []
             skipped_dates = []
             failed_dates = []
 
             for date_str in target_dates:
-                # 检查本地是否已存在
-                if date_str in local_dates:
-                    skipped_dates.append(date_str)
-                    continue
-
-                # 拉取单个日期
-                try:
-                    local_date_dir = local_dir / date_str
-                    local_db_path = local_date_dir / "news.db"
-                    remote_key = f"news/{date_str}.db"
-
-                    local_date_dir.mkdir(parents=True, exist_ok=True)
-                    remote_backend.s3_client.download_file(
-                        remote_backend.bucket_name,
-                        remote_key,
-                        str(local_db_path)
-                    )
+                date_results = statuses.get(date_str, [])
+                failed = [r for r in date_results if r["status"] == "failed"]
+                if failed:
+                    failed_dates.append({
+                        "date": date_str,
+                        "error": "; ".join(f"{r['key']}: {r['error']}" for r in failed)
+                    })
+                elif any(r["status"] == "pulled" for r in date_results):
                     synced_dates.append(date_str)
                     print(f"[存储同步] 已拉取: {date_str}")
-                except Exception as e:
-                    failed_dates.append({"date": date_str, "error": str(e)})
-                    print(f"[存储同步] 拉取失败 ({date_str}): {e}")
+                elif any(r["status"] == "skipped" for r in date_results):
+                    skipped_dates.append(date_str)
 
             return {
                 "success": True,
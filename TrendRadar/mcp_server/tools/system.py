@@ -161,7 +161,8 @@ class SystemManagementTools:
             # 执行爬取
             results, id_to_name, failed_ids = fetcher.crawl_websites(
                 ids_list=ids,
-                request_interval=request_interval
+                request_interval=request_interval,
+                max_workers=crawler_config.get("max_workers", 1),
             )
 
             # 获取当前时间（统一使用 trendradar 的时间工具）
@@ -0,0 +1,105 @@
+# coding=utf-8
+"""
+自适应调度沿用平台的存储回归测试
+
+沿用上次结果的平台不重复写入排名历史，但仍需出现在 current 模式的当前榜单中，
+并且脱榜检测按各平台自己的上一次抓取时间进行。
+"""
+
+import pytest
+
+from trendradar.core.analyzer import count_word_frequency
+from trendradar.core.data import read_all_today_titles_from_storage
+from trendradar.storage import convert_crawl_results_to_news_data
+from trendradar.storage.local import LocalStorageBackend
+
+DATE = "2000-01-01"
+ID_TO_NAME = {"a": "平台A", "b": "平台B"}
+SHOW_ALL_GROUPS = [{"required": [], "normal": [], "group_key": "全部新闻"}]
+
+
+def _titles(*titles):
+    return {
+        title: {"ranks": [rank], "url": f"https://example.com/{title}", "mobileUrl": ""}
+        for rank, title in enumerate(titles, 1)
+    }
+
+
+class _Manager:
+    """read_all_today_titles_from_storage 所需的最小存储管理器接口"""
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    def get_today_all_data(self):
+        return self.backend.get_today_all_data(DATE)
+
+
+@pytest.fixture
+def backend(tmp_path):
+    backend = LocalStorageBackend(data_dir=str(tmp_path), enable_txt=False, enable_html=False)
+    yield backend
+    backend.cleanup()
+
+
+def _save(backend, results, crawl_time, carried=None):
+    names = {pid: ID_TO_NAME[pid] for pid in results}
+    news_data = convert_crawl_results_to_news_data(
+        results, names, [], crawl_time, DATE, carried_ids=carried
+    )
+    assert backend.save_news_data(news_data)
+
+
+def _history(backend, title):
+    conn = backend._get_connection(DATE)
+    rows = conn.execute("""
+        SELECT rh.rank, rh.crawl_time FROM rank_history rh
+        JOIN news_items n ON n.id = rh.news_item_id
+        WHERE n.title = ? ORDER BY rh.crawl_time
+    """, (title,)).fetchall()
+    return [tuple(row) for row in rows]
+
+
+def test_carried_platform_stays_in_current_report(backend):
+    _save(backend, {"a": _titles("a1", "a2"), "b": _titles("b1", "b2")}, "10-00")
+    # b 未到期，沿用上次结果
+    _save(backend, {"a": _titles("a1", "a3")}, "10-30", carried=["b"])
+
+    all_results, id_to_name, title_info = read_all_today_titles_from_storage(
+        _Manager(backend), ["a", "b"]
+    )
+    stats, total = count_word_frequency(
+        all_results, SHOW_ALL_GROUPS, [], id_to_name, title_info,
+        mode="current", is_first_crawl_func=lambda: False,
+        convert_time_func=lambda t: t, quiet=True,
+    )
+
+    titles = {item["title"] for stat in stats for item in stat["titles"]}
+    assert titles == {"a1", "a3", "b1", "b2"}
+    assert total == 4
+
+    # 沿用不写排名历史、不增加抓取次数
+    assert _history(backend, "b1") == [(1, "10-00")]
+    conn = backend._get_connection(DATE)
+    assert conn.execute(
+        "SELECT crawl_count FROM news_items WHERE title = 'b1'"
+    ).fetchone()[0] == 1
+
+
+def test_off_list_uses_each_platform_previous_crawl(backend):
+    _save(backend, {"a": _titles("a1"), "b": _titles("b1", "b2")}, "10-00")
+    # 10:30 只抓取了 a（b 不在本次抓取中，也未沿用）
+    _save(backend, {"a": _titles("a1")}, "10-30")
+    # 11:00 b 的上一次抓取是 10:00，b2 应记为脱榜
+    _save(backend, {"a": _titles("a1"), "b": _titles("b1")}, "11-00")
+
+    assert _history(backend, "b2") == [(2, "10-00"), (0, "11-00")]
+    assert _history(backend, "b1") == [(1, "10-00"), (1, "11-00")]
+
+
+def test_off_list_after_carried_run(backend):
+    _save(backend, {"a": _titles("a1"), "b": _titles("b1", "b2")}, "10-00")
+    _save(backend, {"a": _titles("a1")}, "10-30", carried=["b"])
+    _save(backend, {"a": _titles("a1"), "b": _titles("b1")}, "11-00")
+
+    assert _history(backend, "b2") == [(2, "10-00"), (0, "11-00")]
@@ -0,0 +1,106 @@
+# coding=utf-8
+"""
+历史数据归档与解压缓存测试
+"""
+
+import os
+
+import pytest
+
+from trendradar.storage import convert_crawl_results_to_news_data
+from trendradar.storage.archive import (
+    archive_database,
+    get_archive_path,
+    get_cached_path,
+    prune_archive_cache,
+    temporary_database,
+)
+from trendradar.storage.local import LocalStorageBackend
+from trendradar.storage.warehouse import NewsWarehouse
+
+DATE = "2000-01-01"
+
+
+@pytest.fixture
+def backend(tmp_path):
+    backend = LocalStorageBackend(data_dir=str(tmp_path), enable_txt=False, enable_html=False)
+    yield backend
+    backend.cleanup()
+
+
+def _archive_day(backend, date=DATE):
+    """写入一天的热榜数据并归档，返回数据库路径（归档后已不存在）"""
+    results = {"a": {"标题": {"ranks": [1], "url": "https://example.com/1", "mobileUrl": ""}}}
+    news_data = convert_crawl_results_to_news_data(results, {"a": "平台A"}, [], "10-00", date)
+    assert backend.save_news_data(news_data)
+
+    db_path = backend._get_db_path(date, "news")
+    backend._db_pool.close(db_path)
+    archive_database(db_path)
+    return db_path
+
+
+def test_retention_removes_archive_and_cached_extract(backend, tmp_path):
+    db_path = _archive_day(backend)
+
+    # 读取已归档的日期会解压到缓存目录
+    assert backend.get_today_all_data(DATE) is not None
+    cached_path = get_cached_path(db_path, tmp_path / ".archive_cache")
+    assert cached_path.exists()
+
+    assert backend.cleanup_old_data(retention_days=1) == 1
+    assert not get_archive_path(db_path).exists()
+    assert not cached_path.exists()
+
+
+def test_retention_removes_orphan_cached_extract(backend, tmp_path):
+    db_path = _archive_day(backend)
+    assert backend.get_today_all_data(DATE) is not None
+    get_archive_path(db_path).unlink()
+
+    backend.cleanup_old_data(retention_days=1)
+    assert not get_cached_path(db_path, tmp_path / ".archive_cache").exists()
+
+
+def test_prune_archive_cache_evicts_least_recently_used(tmp_path):
+    cache_dir = tmp_path / "cache"
+    (cache_dir / "news").mkdir(parents=True)
+    paths = []
+    for i in range(3):
+        path = cache_dir / "news" / f"2000-01-0{i + 1}.db"
+        path.write_bytes(b"x" * 100)
+        os.utime(path, ns=(i * 10**9, i * 10**9))
+        paths.append(path)
+
+    assert prune_archive_cache(cache_dir, max_bytes=200) == 1
+    assert [path.exists() for path in paths] == [False, True, True]
+
+    # keep 指定的文件即使最旧也不淘汰
+    assert prune_archive_cache(cache_dir, max_bytes=0, keep=paths[1]) == 1
+    assert [path.exists() for path in paths] == [False, True, False]
+
+
+def test_warehouse_backfill_uses_temporary_extract(backend, tmp_path):
+    db_path = _archive_day(backend)
+
+    warehouse = NewsWarehouse(tmp_path / "warehouse.db")
+    try:
+        assert warehouse.backfill(tmp_path / "news") == 1
+        assert warehouse.get_dates() == [DATE]
+    finally:
+        warehouse.close()
+
+    assert not (tmp_path / ".archive_cache").exists()
+    assert sorted(p.name for p in db_path.parent.iterdir()) == [get_archive_path(db_path).name]
+
+
+def test_temporary_database_passes_through_plain_database(tmp_path):
+    db_path = tmp_path / "news" / f"{DATE}.db"
+    with temporary_database(db_path) as path:
+        assert path is None
+
+    db_path.parent.mkdir()
+    db_path.write_bytes(b"")
+    with temporary_database(db_path) as path:
+        assert path == db_path
+    assert db_path.exists()
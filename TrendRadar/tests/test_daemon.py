@@ -0,0 +1,67 @@
+# coding=utf-8
+"""
+守护进程模式测试
+"""
+
+import sys
+
+import pytest
+
+from trendradar.__main__ import _parse_args
+from trendradar.daemon import CrawlDaemon
+
+
+class _Context:
+    def format_date(self):
+        return "2000-01-01"
+
+
+class _FailingAnalyzer:
+    """DEBUG 模式下 run_cycle 会重新抛出异常"""
+
+    def __init__(self):
+        self.ctx = _Context()
+        self.cycles = 0
+
+    def run_cycle(self):
+        self.cycles += 1
+        raise RuntimeError("抓取失败")
+
+
+def test_cycle_error_does_not_stop_daemon(capsys):
+    daemon = CrawlDaemon(analyzer_factory=lambda config: None)
+    daemon.analyzer = _FailingAnalyzer()
+
+    daemon._run_cycle()
+    daemon._run_cycle()
+
+    assert daemon.analyzer.cycles == 2
+    captured = capsys.readouterr()
+    assert "本周期执行出错" in captured.out
+    assert "RuntimeError: 抓取失败" in captured.err
+
+
+def _parse(monkeypatch, *argv):
+    monkeypatch.setattr(sys, "argv", ["trendradar", *argv])
+    return _parse_args()
+
+
+def test_interval_from_env_only_in_daemon_mode(monkeypatch):
+    monkeypatch.setenv("DAEMON_INTERVAL", "abc")
+    assert _parse(monkeypatch).interval is None
+
+    with pytest.raises(SystemExit):
+        _parse(monkeypatch, "--daemon")
+
+    monkeypatch.setenv("DAEMON_INTERVAL", "15")
+    assert _parse(monkeypatch, "--daemon").interval == 15
+
+    monkeypatch.setenv("DAEMON_INTERVAL", "")
+    assert _parse(monkeypatch, "--daemon").interval == 30
+
+
+def test_interval_argument_is_validated(monkeypatch, capsys):
+    assert _parse(monkeypatch, "--daemon", "--interval", "5").interval == 5
+    with pytest.raises(SystemExit):
+        _parse(monkeypatch, "--daemon", "--interval", "0")
+    assert "运行间隔必须大于 0" in capsys.readouterr().err
@@ -0,0 +1,78 @@
+# coding=utf-8
+"""
+数据库结构迁移测试
+"""
+
+import sqlite3
+
+import pytest
+
+from trendradar.storage import convert_crawl_results_to_news_data
+from trendradar.storage.local import LocalStorageBackend
+from trendradar.storage.migrations import get_latest_version, get_schema_version
+
+DATE = "2000-01-01"
+
+
+def _backend(data_dir):
+    return LocalStorageBackend(data_dir=str(data_dir), enable_txt=False, enable_html=False)
+
+
+def _save(backend, ranks, crawl_time):
+    results = {
+        "a": {
+            title: {"ranks": [rank], "url": f"https://example.com/{title}", "mobileUrl": ""}
+            for title, rank in ranks.items()
+        }
+    }
+    news_data = convert_crawl_results_to_news_data(results, {"a": "平台A"}, [], crawl_time, DATE)
+    assert backend.save_news_data(news_data)
+
+
+@pytest.fixture
+def legacy_db(tmp_path):
+    """排名聚合表出现之前的数据库：有 rank_history，没有 news_item_stats 记录，结构版本 v1"""
+    backend = _backend(tmp_path)
+    _save(backend, {"x": 3, "y": 1}, "10-00")
+    _save(backend, {"x": 1}, "10-30")
+    _save(backend, {"x": 3}, "11-00")
+    expected = {item.title: (item.ranks, item.rank_timeline)
+                for item in backend.get_today_all_data(DATE).items["a"]}
+    backend.cleanup()
+
+    db_path = tmp_path / "news" / f"{DATE}.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("DELETE FROM news_item_stats")
+    conn.execute("PRAGMA user_version = 1")
+    conn.commit()
+    conn.close()
+    return tmp_path, expected
+
+
+def test_migration_rebuilds_rank_stats(legacy_db):
+    data_dir, expected = legacy_db
+    backend = _backend(data_dir)
+    try:
+        conn = backend._get_connection(DATE)
+        assert get_schema_version(conn) == get_latest_version("news")
+        assert conn.execute("SELECT COUNT(*) FROM news_item_stats").fetchone()[0] == 2
+
+        items = backend.get_today_all_data(DATE).items["a"]
+        assert {item.title: (item.ranks, item.rank_timeline) for item in items} == expected
+        assert expected["x"][0] == [3, 1]
+    finally:
+        backend.cleanup()
+
+
+def test_reads_do_not_write(legacy_db):
+    data_dir, _ = legacy_db
+    backend = _backend(data_dir)
+    try:
+        conn = backend._get_connection(DATE)
+        before = conn.total_changes
+        assert backend.get_today_all_data(DATE) is not None
+        assert backend.get_latest_crawl_data(DATE) is not None
+        assert conn.total_changes == before
+        assert not conn.in_transaction
+    finally:
+        backend.cleanup()
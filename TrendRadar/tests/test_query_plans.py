@@ -0,0 +1,176 @@
+# coding=utf-8
+"""
+热点查询的执行计划测试
+
+用 EXPLAIN QUERY PLAN 确认存储层的热点查询走 migrations.py 建立的复合索引，
+且不产生临时排序（USE TEMP B-TREE）。分别检查两种数据库：
+- 新建数据库：由 schema.sql / rss_schema.sql 直接得到最新结构
+- 迁移数据库：先构造迁移 v1 之前的索引结构，再由存储后端打开并执行迁移
+
+修改下列 SQL 对应的查询（sqlite_mixin.py / warehouse.py / parser_service.py）、
+调整索引或追加迁移时同步更新本文件。
+"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from trendradar.storage.local import LocalStorageBackend
+from trendradar.storage.migrations import get_latest_version, get_schema_version
+
+DATE = "2000-01-01"
+
+# (数据库类型, 说明, SQL, 期望使用的索引)
+HOT_QUERIES = [
+    (
+        "news",
+        "按条目读取排名历史（MCP）",
+        """
+        SELECT rh.news_item_id, rh.rank
+        FROM rank_history rh
+        JOIN news_items n ON n.id = rh.news_item_id
+        ORDER BY rh.news_item_id, rh.crawl_time
+        """,
+        "idx_rank_history_news_time",
+    ),
+    (
+        "news",
+        "按平台读取排名历史（MCP）",
+        """
+        SELECT rh.news_item_id, rh.rank
+        FROM rank_history rh
+        WHERE rh.news_item_id IN (SELECT n.id FROM news_items n WHERE n.platform_id IN (?, ?))
+        ORDER BY rh.news_item_id, rh.crawl_time
+        """,
+        "idx_rank_history_news_time",
+    ),
+    (
+        "news",
+        "按抓取时间读取排名历史（数据仓库汇总）",
+        """
+        SELECT news_item_id, rank FROM rank_history
+        ORDER BY news_item_id, crawl_time
+        """,
+        "idx_rank_history_news_time",
+    ),
+    (
+        "news",
+        "加载平台已有条目（保存新闻数据）",
+        """
+        SELECT id, title, url, platform_id FROM news_items
+        WHERE platform_id IN (?, ?) AND url != ''
+        """,
+        "idx_news_platform_last_crawl",
+    ),
+    (
+        "news",
+        "各平台上一次在榜时间（脱榜检测）",
+        """
+        SELECT platform_id, MAX(last_crawl_time) AS prev_time
+        FROM news_items
+        WHERE platform_id IN (?, ?) AND last_crawl_time < ?
+        GROUP BY platform_id
+        """,
+        "idx_news_platform_last_crawl",
+    ),
+    (
+        "news",
+        "各平台最后抓取时间（自适应调度）",
+        """
+        SELECT platform_id, MAX(last_crawl_time) AS latest_time
+        FROM news_items
+        GROUP BY platform_id
+        """,
+        "idx_news_platform_last_crawl",
+    ),
+    (
+        "rss",
+        "获取最新 RSS 数据",
+        """
+        SELECT i.id, i.title, i.feed_id, f.name as feed_name,
+               i.url, i.published_at, i.summary, i.author,
+               i.first_crawl_time, i.last_crawl_time, i.crawl_count
+        FROM rss_items i
+        LEFT JOIN rss_feeds f ON i.feed_id = f.id
+        WHERE i.last_crawl_time = ?
+        ORDER BY i.published_at DESC
+        """,
+        "idx_rss_crawl_time_published",
+    ),
+]
+
+# 迁移 v1 之前的索引结构（在最新结构上还原，用于构造待迁移的数据库）
+BASELINE_INDEXES = {
+    "news": """
+        DROP INDEX IF EXISTS idx_rank_history_news_time;
+        CREATE INDEX idx_news_platform ON news_items(platform_id);
+        CREATE INDEX idx_news_title ON news_items(title);
+        CREATE INDEX idx_rank_history_news ON rank_history(news_item_id);
+        PRAGMA user_version = 0;
+    """,
+    "rss": """
+        DROP INDEX IF EXISTS idx_rss_crawl_time_published;
+        CREATE INDEX idx_rss_crawl_time ON rss_items(last_crawl_time);
+        CREATE INDEX idx_rss_title ON rss_items(title);
+        PRAGMA user_version = 0;
+    """,
+}
+
+# 迁移后不应存在的旧索引
+DROPPED_INDEXES = {
+    "news": ["idx_news_title", "idx_news_platform", "idx_rank_history_news"],
+    "rss": ["idx_rss_title", "idx_rss_crawl_time"],
+}
+
+
+def _create_baseline_database(db_path: Path, db_type: str) -> None:
+    """创建迁移 v1 之前结构的数据库（表结构最新，索引为旧版）"""
+    schema_name = "schema.sql" if db_type == "news" else "rss_schema.sql"
+    schema_path = Path(__file__).parent.parent / "trendradar" / "storage" / schema_name
+
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path))
+    try:
+        conn.executescript(schema_path.read_text(encoding="utf-8"))
+        conn.executescript(BASELINE_INDEXES[db_type])
+    finally:
+        conn.close()
+
+
+@pytest.fixture(scope="module", params=["fresh", "migrated"])
+def backend(request, tmp_path_factory):
+    data_dir = tmp_path_factory.mktemp(request.param)
+    if request.param == "migrated":
+        for db_type in ("news", "rss"):
+            _create_baseline_database(data_dir / db_type / f"{DATE}.db", db_type)
+
+    backend = LocalStorageBackend(data_dir=str(data_dir), enable_txt=False, enable_html=False)
+    yield backend
+    backend.cleanup()
+
+
+def _explain(conn: sqlite3.Connection, sql: str):
+    """获取查询的执行计划（每个步骤一行），参数统一绑定为 NULL"""
+    params = [None] * sql.count("?")
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+@pytest.mark.parametrize("db_type", ["news", "rss"])
+def test_schema_is_latest_and_old_indexes_dropped(backend, db_type):
+    conn = backend._get_connection(DATE, db_type=db_type)
+    assert get_schema_version(conn) == get_latest_version(db_type)
+
+    indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert not indexes & set(DROPPED_INDEXES[db_type])
+
+
+@pytest.mark.parametrize(
+    "db_type, sql, index_name",
+    [(db_type, sql, index_name) for db_type, _, sql, index_name in HOT_QUERIES],
+    ids=[description for _, description, _, _ in HOT_QUERIES],
+)
+def test_hot_query_uses_composite_index(backend, db_type, sql, index_name):
+    plan = _explain(backend._get_connection(DATE, db_type=db_type), sql)
+    assert any(index_name in step for step in plan), plan
+    assert not any("USE TEMP B-TREE" in step for step in plan), plan
@@ -0,0 +1,68 @@
+# coding=utf-8
+"""
+RSS 解析器测试：流式 XML 快速路径与 feedparser 路径的结果一致
+"""
+
+import pytest
+
+from trendradar.crawler.rss.parser import RSSParser
+
+# RFC 822 与常见的 RFC 3339 / ISO 8601 写法
+DATES = [
+    "Tue, 02 Jan 2024 03:04:05 GMT",
+    "Tue, 02 Jan 2024 11:04:05 +0800",
+    "Tue, 02 Jan 2024 03:04:05 -0000",
+    "2024-01-02T03:04:05Z",
+    "2024-01-02T03:04:05.678Z",
+    "2024-01-02T03:04:05.123456+08:00",
+    "2024-01-02t03:04:05z",
+    "2024-01-02T03:04:05",
+    "2024-01-02",
+    "2024-01-02 03:04:05Z",
+]
+
+
+def _rss(date):
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>t</title>
+<item><title>标题</title><link>https://example.com/1</link><pubDate>{date}</pubDate></item>
+</channel></rss>"""
+
+
+def _atom(date):
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>t</title>
+<entry><title>标题</title><link href="https://example.com/1"/><id>1</id><updated>{date}</updated></entry>
+</feed>"""
+
+
+@pytest.fixture(scope="module")
+def parser():
+    return RSSParser()
+
+
+@pytest.mark.parametrize("build", [_rss, _atom], ids=["rss", "atom"])
+@pytest.mark.parametrize("date", DATES)
+def test_fast_path_dates_match_feedparser(parser, build, date):
+    content = build(date)
+    assert parser._parse_xml_fast(content) is not None
+
+    fast = parser.parse(content)
+    slow = parser._parse_with_feedparser(content)
+    assert [item.published_at for item in fast] == [item.published_at for item in slow]
+    assert fast[0].published_at is not None
+
+
+def test_normalize_date_falls_back_to_feedparser(parser, monkeypatch):
+    """fromisoformat 无法解析时（Python 3.10 只支持其自身输出的格式）交给 feedparser 解析"""
+    import trendradar.crawler.rss.parser as parser_module
+
+    class StrictDatetime(parser_module.datetime):
+        @classmethod
+        def fromisoformat(cls, date_str):
+            raise ValueError(date_str)
+
+    monkeypatch.setattr(parser_module, "datetime", StrictDatetime)
+
+    assert parser._normalize_date("2024-01-02T03:04:05.678+08:00") == "2024-01-01T19:04:05"
+    assert parser._normalize_date("not a date") is None
@@ -0,0 +1,19 @@
+# coding=utf-8
+"""
+启动导入测试：未启用的功能不在启动时导入其依赖
+"""
+
+import subprocess
+import sys
+
+# 导入主程序以及 RSS 模块后不应加载的模块（通知发送器、feedparser 按需导入）
+LAZY_MODULES = ["trendradar.notification.senders", "smtplib", "feedparser"]
+
+
+def test_optional_modules_are_imported_lazily():
+    code = (
+        "import sys, trendradar.__main__, trendradar.crawler.rss\n"
+        f"print([m for m in {LAZY_MODULES!r} if m in sys.modules])"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert proc.stdout.strip() == "[]"
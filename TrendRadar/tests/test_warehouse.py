@@ -0,0 +1,70 @@
+# coding=utf-8
+"""
+数据仓库测试
+"""
+
+import pytest
+
+from trendradar.storage import convert_crawl_results_to_news_data
+from trendradar.storage.local import LocalStorageBackend
+from trendradar.storage.warehouse import NewsWarehouse
+
+
+@pytest.fixture
+def backend(tmp_path):
+    backend = LocalStorageBackend(data_dir=str(tmp_path), enable_txt=False, enable_html=False)
+    yield backend
+    backend.cleanup()
+
+
+def _save(backend, date, crawl_time, ranks):
+    results = {
+        "a": {
+            title: {"ranks": [rank], "url": f"https://example.com/{title}", "mobileUrl": ""}
+            for title, rank in ranks.items()
+        }
+    }
+    news_data = convert_crawl_results_to_news_data(results, {"a": "平台A"}, [], crawl_time, date)
+    assert backend.save_news_data(news_data)
+    return backend._get_db_path(date, "news")
+
+
+def _ranks(warehouse, date):
+    conn = warehouse._get_connection()
+    return dict(conn.execute("SELECT title, ranks FROM titles WHERE date = ?", (date,)).fetchall())
+
+
+def test_ranks_follow_crawl_time(backend, tmp_path):
+    # 补录更早的抓取：rank_history 的写入顺序与抓取时间顺序相反
+    _save(backend, "2000-01-01", "10-30", {"x": 2})
+    db_path = _save(backend, "2000-01-01", "10-00", {"x": 5})
+
+    warehouse = NewsWarehouse(tmp_path / "warehouse.db")
+    try:
+        assert warehouse.refresh("2000-01-01", db_path)
+        assert _ranks(warehouse, "2000-01-01") == {"x": "5,2"}
+    finally:
+        warehouse.close()
+
+
+def test_refresh_prunes_expired_dates(backend, tmp_path):
+    warehouse = NewsWarehouse(tmp_path / "warehouse.db", retention_days=2)
+    try:
+        for date in ("2000-01-01", "2000-01-02", "2000-01-04"):
+            assert warehouse.refresh(date, _save(backend, date, "10-00", {"x": 1}))
+        assert warehouse.get_dates() == ["2000-01-04"]
+        assert warehouse._get_connection().execute(
+            "SELECT COUNT(*) FROM titles WHERE date < '2000-01-03'"
+        ).fetchone()[0] == 0
+    finally:
+        warehouse.close()
+
+
+def test_refresh_keeps_all_dates_without_retention(backend, tmp_path):
+    warehouse = NewsWarehouse(tmp_path / "warehouse.db")
+    try:
+        for date in ("2000-01-01", "2000-01-04"):
+            assert warehouse.refresh(date, _save(backend, date, "10-00", {"x": 1}))
+        assert warehouse.get_dates() == ["2000-01-01", "2000-01-04"]
+    finally:
+        warehouse.close()
@@ -6,6 +6,7 @@ TrendRadar 主程序
 支持: python -m trendradar
 """
 
+import argparse
 import os
 import re
 import webbrowser
@@ -18,7 +19,7 @@ from trendradar.context import AppContext
 from trendradar import __version__
 from trendradar.core import load_config
 from trendradar.core.analyzer import convert_keyword_stats_to_platform_stats
-from trendradar.crawler import DataFetcher
+from trendradar.crawler import DataFetcher, AdaptiveScheduler, CircuitBreaker
 from trendradar.storage import convert_crawl_results_to_news_data
 from trendradar.utils.time import is_within_days
 from trendradar.ai import AIAnalyzer, AIAnalysisResult
@@ -219,6 +220,7 @@ class NewsAnalyzer:
         self.ctx = AppContext(config)
 
         self.request_interval = self.ctx.config["REQUEST_INTERVAL"]
+        self.crawler_max_workers = self.ctx.config.get("CRAWLER_MAX_WORKERS", 1)
         self.report_mode = self.ctx.config["REPORT_MODE"]
         self.rank_threshold = self.ctx.rank_threshold
         self.is_github_actions = os.environ.get("GITHUB_ACTIONS") == "true"
@@ -226,7 +228,19 @@ class NewsAnalyzer:
         self.update_info = None
         self.proxy_url = None
         self._setup_proxy()
-        self.data_fetcher = DataFetcher(self.proxy_url)
+        cache_path = None
+        if self.ctx.config.get("CRAWLER_HTTP_CACHE", True):
+            cache_path = str(Path("output") / "cache" / "newsnow_validators.json")
+        self.data_fetcher = DataFetcher(self.proxy_url, cache_path=cache_path)
+
+        # 自适应抓取调度（可选）
+        schedule_config = self.ctx.config.get("ADAPTIVE_SCHEDULE", {})
+        self.scheduler = (
+            AdaptiveScheduler.from_config(schedule_config)
+            if schedule_config.get("ENABLED", False) else None
+        )
+        # 本轮沿用上次结果的平台（不重复写入存储）
+        self._carried_platforms: List[str] = []
 
         # 初始化存储管理器（使用 AppContext）
         self._init_storage_manager()
@@ -1017,15 +1031,32 @@ class NewsAnalyzer:
         print(f"开始爬取数据，请求间隔 {self.request_interval} 毫秒")
         Path("output").mkdir(parents=True, exist_ok=True)
 
-        results, id_to_name, failed_ids = self.data_fetcher.crawl_websites(
-            ids, self.request_interval
+        self.data_fetcher.breaker = self._create_breaker(
+            self.storage_manager.get_source_failure_stats(self.ctx.format_date())
         )
 
+        carried = []
+        if self.scheduler:
+            results, id_to_name, failed_ids, carried = self._crawl_with_schedule(ids)
+        else:
+            results, id_to_name, failed_ids = self.data_fetcher.crawl_websites(
+                ids, self.request_interval, max_workers=self.crawler_max_workers
+            )
+
+        # 沿用的平台数据只参与本次报告，不重复写入（避免虚增排名历史和抓取次数）
+        if carried:
+            saved_results = {pid: r for pid, r in results.items() if pid not in carried}
+            saved_names = {pid: n for pid, n in id_to_name.items() if pid not in carried}
+        else:
+            saved_results, saved_names = results, id_to_name
+        self._carried_platforms = carried
+
         # 转换为 NewsData 格式并保存到存储后端
         crawl_time = self.ctx.format_time()
         crawl_date = self.ctx.format_date()
         news_data = convert_crawl_results_to_news_data(
-            results, id_to_name, failed_ids, crawl_time, crawl_date
+            saved_results, saved_names, failed_ids, crawl_time, crawl_date,
+            carried_ids=carried,
         )
 
         # 保存到存储后端（SQLite）
@@ -1039,11 +1070,83 @@ class NewsAnalyzer:
 
         # 兼容：同时保存到原有 TXT 格式（确保向后兼容）
         if self.ctx.config["STORAGE"]["FORMATS"]["TXT"]:
-            title_file = self.ctx.save_titles(results, id_to_name, failed_ids)
+            title_file = self.ctx.save_titles(saved_results, saved_names, failed_ids)
             print(f"标题已保存到: {title_file}")
 
         return results, id_to_name, failed_ids
 
+    def _create_breaker(self, failure_stats: Dict) -> Optional[CircuitBreaker]:
+        """按配置创建数据源熔断器，未启用时返回 None"""
+        breaker_config = self.ctx.config.get("CIRCUIT_BREAKER", {})
+        if not breaker_config.get("ENABLED", True):
+            return None
+        return CircuitBreaker.from_config(breaker_config, failure_stats, self.ctx.get_time())
+
+    def _crawl_with_schedule(self, ids: List) -> Tuple[Dict, Dict, List, List]:
+        """
+        按自适应调度抓取热榜平台
+
+        只请求到期的平台；未到期的平台沿用最近一次在榜数据，
+        失败退避中的平台本次跳过。抓取后立即写入调度状态。
+
+        Returns:
+            (结果字典, ID到名称的映射, 失败ID列表, 沿用的平台ID列表)，
+            结果字典包含沿用的平台数据，调用方保存时需排除这些平台
+        """
+        id_names = {}
+        for id_info in ids:
+            if isinstance(id_info, tuple):
+                id_names[id_info[0]] = id_info[1]
+            else:
+                id_names[id_info] = id_info
+
+        now = self.ctx.get_time()
+        crawl_date = self.ctx.format_date()
+        states = AdaptiveScheduler.load_states(self.storage_manager.get_crawl_schedule(crawl_date))
+        previous = self.storage_manager.get_latest_platform_titles(list(id_names), crawl_date)
+        due, deferred, backing_off = self.scheduler.plan(id_names, states, now)
+
+        # 没有历史数据可沿用的平台照常抓取
+        carried = [pid for pid in deferred if pid in previous]
+        due_set = set(due) | (set(deferred) - set(carried))
+        print(
+            f"[调度] 本次抓取 {len(due_set)} 个平台，沿用上次结果 {len(carried)} 个，"
+            f"失败退避 {len(backing_off)} 个"
+        )
+
+        crawl_ids = [
+            id_info for id_info in ids
+            if (id_info[0] if isinstance(id_info, tuple) else id_info) in due_set
+        ]
+        fetched, _, failed_ids = self.data_fetcher.crawl_websites(
+            crawl_ids, self.request_interval, max_workers=self.crawler_max_workers
+        )
+
+        for platform_id in due_set - set(self.data_fetcher.breaker_skipped):
+            self.scheduler.record(
+                states, platform_id, now,
+                success=platform_id in fetched,
+                current_keys=set(fetched.get(platform_id, {})),
+                previous_keys=set(previous.get(platform_id, {})),
+            )
+        self.storage_manager.save_crawl_schedule(AdaptiveScheduler.dump_states(states), crawl_date)
+
+        # 按配置顺序合并本次结果与沿用结果
+        results = {}
+        id_to_name = {}
+        for platform_id, name in id_names.items():
+            if platform_id in fetched:
+                results[platform_id] = fetched[platform_id]
+            elif platform_id in carried:
+                results[platform_id] = previous[platform_id]
+            else:
+                continue
+            id_to_name[platform_id] = name
+        for platform_id in failed_ids:
+            id_to_name[platform_id] = id_names.get(platform_id, platform_id)
+
+        return results, id_to_name, failed_ids, carried
+
     def _crawl_rss_data(self) -> Tuple[Optional[List[Dict]], Optional[List[Dict]], Optional[List[Dict]]]:
         """
         执行 RSS 数据抓取
@@ -1110,6 +1213,27 @@ class NewsAnalyzer:
             freshness_enabled = freshness_config.get("ENABLED", True)
             default_max_age_days = freshness_config.get("MAX_AGE_DAYS", 3)
 
+            # 条件请求缓存：从存储后端读取当日缓存
+            http_cache_enabled = rss_config.get("HTTP_CACHE", True)
+            feed_cache = self.storage_manager.get_rss_feed_cache() if http_cache_enabled else None
+
+            # 自适应调度：未到期的源沿用缓存结果（依赖 HTTP 缓存），失败退避中的源本次跳过
+            rss_states = None
+            deferred_feed_ids: List[str] = []
+            now = self.ctx.get_time()
+            if self.scheduler and feed_cache is not None:
+                rss_states = AdaptiveScheduler.load_states(self.storage_manager.get_rss_schedule())
+                _, deferred_feed_ids, backing_off = self.scheduler.plan(
+                    [feed.id for feed in feeds], rss_states, now
+                )
+                if backing_off:
+                    feeds = [feed for feed in feeds if feed.id not in set(backing_off)]
+                print(
+                    f"[RSS] 调度：未到期 {len(deferred_feed_ids)} 个源，失败退避 {len(backing_off)} 个源"
+                )
+            elif self.scheduler:
+                print("[RSS] 自适应调度需要启用 advanced.rss.http_cache，本次抓取全部源")
+
             fetcher = RSSFetcher(
                 feeds=feeds,
                 request_interval=rss_config.get("REQUEST_INTERVAL", 2000),
@@ -1119,11 +1243,39 @@ class NewsAnalyzer:
                 timezone=timezone,
                 freshness_enabled=freshness_enabled,
                 default_max_age_days=default_max_age_days,
+                max_workers=rss_config.get("MAX_WORKERS", 1),
+                feed_cache=feed_cache,
+                deferred_ids=deferred_feed_ids,
+                breaker=self._create_breaker(
+                    self.storage_manager.get_rss_failure_stats(self.ctx.format_date())
+                ),
             )
 
             # 抓取数据
             rss_data = fetcher.fetch_all()
 
+            # 写回变化的缓存条目（与 RSS 数据写入同一数据库，随后一并持久化）
+            if fetcher.updated_feed_cache:
+                self.storage_manager.save_rss_feed_cache(fetcher.updated_feed_cache, rss_data.date)
+
+            # 更新实际请求过的源的调度状态
+            if rss_states is not None:
+                failed_feed_ids = set(rss_data.failed_ids)
+                skipped = fetcher.deferred_served | set(fetcher.breaker_skipped)
+                for feed in feeds:
+                    if feed.id in skipped:
+                        continue
+                    previous_items = feed_cache.get(feed.id, {}).get("items", [])
+                    self.scheduler.record(
+                        rss_states, feed.id, now,
+                        success=feed.id not in failed_feed_ids,
+                        current_keys={item.url for item in rss_data.items.get(feed.id, [])},
+                        previous_keys={item.get("url", "") for item in previous_items},
+                    )
+                self.storage_manager.save_rss_schedule(
+                    AdaptiveScheduler.dump_states(rss_states), rss_data.date
+                )
+
             # 保存到存储后端
             if self.storage_manager.save_rss_data(rss_data):
                 print(f"[RSS] 数据已保存到存储后端")
@@ -1434,7 +1586,12 @@ class NewsAnalyzer:
         new_titles = self.ctx.detect_new_titles(current_platform_ids)
         time_info = self.ctx.format_time()
         if self.ctx.config["STORAGE"]["FORMATS"]["TXT"]:
-            self.ctx.save_titles(results, id_to_name, failed_ids)
+            carried = self._carried_platforms
+            self.ctx.save_titles(
+                {pid: r for pid, r in results.items() if pid not in carried},
+                {pid: n for pid, n in id_to_name.items() if pid not in carried},
+                failed_ids,
+            )
         word_groups, filter_words, global_filters = self.ctx.load_frequency_words()
 
         html_file = None
@@ -1603,7 +1760,14 @@ class NewsAnalyzer:
         return html_file
 
     def run(self) -> None:
-        """执行分析流程"""
+        """执行分析流程（单次运行，结束后释放资源）"""
+        try:
+            self.run_cycle()
+        finally:
+            self.close()
+
+    def run_cycle(self) -> None:
+        """执行一次抓取与分析（不释放会话和数据库连接，可在守护进程中重复调用）"""
         try:
             self._initialize_and_check_config()
 
@@ -1626,15 +1790,121 @@ class NewsAnalyzer:
             print(f"分析流程执行出错: {e}")
             if self.ctx.config.get("DEBUG", False):
                 raise
-        finally:
-            # 清理资源（包括过期数据清理和数据库连接关闭）
-            self.ctx.cleanup()
+
+    def close(self) -> None:
+        """清理资源（包括过期数据清理和数据库连接关闭）"""
+        self.data_fetcher.close()
+        self.ctx.cleanup()
+
+
+def _interval_minutes(value: str) -> int:
+    """解析守护进程运行间隔（正整数分钟）"""
+    try:
+        minutes = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"运行间隔必须是整数分钟: {value!r}")
+    if minutes <= 0:
+        raise argparse.ArgumentTypeError(f"运行间隔必须大于 0: {value!r}")
+    return minutes
+
+
+def _parse_args() -> argparse.Namespace:
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(prog="trendradar", description="TrendRadar 热点新闻聚合与分析")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="以常驻守护进程模式运行，按 --interval 定时执行（配置文件修改后自动重新加载）",
+    )
+    parser.add_argument(
+        "--interval",
+        type=_interval_minutes,
+        default=None,
+        help="守护进程运行间隔（分钟，默认 30，可通过环境变量 DAEMON_INTERVAL 设置）",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="统计启动阶段各模块的导入耗时后退出（不执行抓取）",
+    )
+    args = parser.parse_args()
+
+    # 环境变量只在守护进程模式下读取，非法值给出明确的错误
+    if args.daemon and args.interval is None:
+        try:
+            args.interval = _interval_minutes(os.environ.get("DAEMON_INTERVAL", "").strip() or "30")
+        except argparse.ArgumentTypeError as e:
+            parser.error(f"环境变量 DAEMON_INTERVAL 无效: {e}")
+    return args
+
+
+def _profile_startup(top: int = 25) -> None:
+    """
+    统计启动导入耗时（基于 python -X importtime）
+
+    在子进程中导入主程序（当前进程在解析参数前已完成导入，无法再次测量），
+    按模块汇总自身导入耗时：trendradar 按子模块统计，第三方库按顶层包统计。
+    """
+    import subprocess
+    import sys
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import trendradar.__main__"],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        print(f"[启动分析] 导入失败:\n{proc.stderr}")
+        return
+
+    totals: Dict[str, int] = {}
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            self_us = int(self_us)
+        except ValueError:
+            continue  # 表头行
+        module = name.strip()
+        parts = module.split(".")
+        group = ".".join(parts[:2]) if parts[0] == "trendradar" else parts[0]
+        totals[group] = totals.get(group, 0) + self_us
+        if module == "trendradar.__main__":
+            total_us = int(cumulative_us)
+
+    print(f"[启动分析] 导入 trendradar.__main__ 总耗时: {total_us / 1000:.1f} ms")
+    print(f"[启动分析] 耗时最多的 {top} 个模块（按包汇总各子模块自身导入耗时）:")
+    for group, self_us in sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"  {self_us / 1000:8.1f} ms  {group}")
+
+
+def _run_daemon(interval: int) -> None:
+    """守护进程模式入口"""
+    from trendradar.daemon import CrawlDaemon
+
+    daemon = CrawlDaemon(
+        analyzer_factory=lambda config: NewsAnalyzer(config=config),
+        interval_minutes=interval,
+        run_immediately=os.environ.get("IMMEDIATE_RUN", "true").lower() != "false",
+    )
+    daemon.run_forever()
 
 
 def main():
     """主程序入口"""
+    args = _parse_args()
+    if args.profile_startup:
+        _profile_startup()
+        return
+
     debug_mode = False
     try:
+        if args.daemon:
+            _run_daemon(args.interval)
+            return
+
         # 先加载配置以获取 version_check_url
         config = load_config()
         version_url = config.get("VERSION_CHECK_URL", "")
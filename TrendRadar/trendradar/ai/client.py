@@ -9,8 +9,6 @@ AI 客户端模块
 import os
 from typing import Any, Dict, List, Optional
 
-from litellm import completion
-
 
 class AIClient:
     """统一的 AI 客户端（基于 LiteLLM）"""
@@ -89,6 +87,9 @@ class AIClient:
                 params[key] = value
 
         # 调用 LiteLLM
+        # 延迟导入：litellm 导入耗时数秒，仅在实际调用 AI 时加载
+        from litellm import completion
+
         response = completion(**params)
 
         # 提取响应内容
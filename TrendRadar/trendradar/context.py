@@ -5,9 +5,10 @@
 提供配置上下文类，封装所有依赖配置的操作，消除全局状态和包装函数。
 """
 
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from trendradar.utils.time import (
     get_configured_time,
@@ -30,16 +31,13 @@ from trendradar.report import (
     generate_html_report,
     render_html_content,
 )
-from trendradar.notification import (
-    render_feishu_content,
-    render_dingtalk_content,
-    split_content_into_batches,
-    NotificationDispatcher,
-    PushRecordManager,
-)
 from trendradar.ai import AITranslator
 from trendradar.storage import get_storage_manager
 
+# 通知模块（各渠道发送器依赖 smtplib / email 等）只在启用通知或推送记录时按需导入
+if TYPE_CHECKING:
+    from trendradar.notification import NotificationDispatcher, PushRecordManager
+
 
 class AppContext:
     """
@@ -72,6 +70,8 @@ class AppContext:
         """
         self.config = config
         self._storage_manager = None
+        # 频率词缓存：{文件路径: (修改时间, 解析结果)}
+        self._frequency_cache: Dict[str, Tuple[float, Tuple[List[Dict], List[str], List[str]]]] = {}
 
     # === 配置访问 ===
 
@@ -164,6 +164,7 @@ class AppContext:
             local_config = storage_config.get("LOCAL", {})
             pull_config = storage_config.get("PULL", {})
 
+            # 每个上下文按自身配置创建（守护进程重新加载配置时不复用旧实例）
             self._storage_manager = get_storage_manager(
                 backend_type=storage_config.get("BACKEND", "auto"),
                 data_dir=local_config.get("DATA_DIR", "output"),
@@ -175,12 +176,20 @@ class AppContext:
                     "secret_access_key": remote_config.get("SECRET_ACCESS_KEY", ""),
                     "endpoint_url": remote_config.get("ENDPOINT_URL", ""),
                     "region": remote_config.get("REGION", ""),
+                    "sync_mode": remote_config.get("SYNC_MODE", "full"),
+                    "compact_every": remote_config.get("COMPACT_EVERY", 24),
+                    "max_workers": remote_config.get("MAX_WORKERS", 8),
+                    "background_upload": remote_config.get("BACKGROUND_UPLOAD", False),
                 },
                 local_retention_days=local_config.get("RETENTION_DAYS", 0),
                 remote_retention_days=remote_config.get("RETENTION_DAYS", 0),
+                local_archive_days=local_config.get("ARCHIVE_DAYS", 0),
+                remote_archive_days=remote_config.get("ARCHIVE_DAYS", 0),
                 pull_enabled=pull_config.get("ENABLED", False),
                 pull_days=pull_config.get("DAYS", 7),
                 timezone=self.timezone,
+                warehouse_enabled=storage_config.get("WAREHOUSE", {}).get("ENABLED", False),
+                force_new=True,
             )
         return self._storage_manager
 
@@ -218,8 +227,24 @@ class AppContext:
     def load_frequency_words(
         self, frequency_file: Optional[str] = None
     ) -> Tuple[List[Dict], List[str], List[str]]:
-        """加载频率词配置"""
-        return load_frequency_words(frequency_file)
+        """
+        加载频率词配置
+
+        按文件修改时间缓存解析结果，文件未变化时直接复用（守护进程模式下跨周期生效）
+        """
+        path = frequency_file or os.environ.get("FREQUENCY_WORDS_PATH", "config/frequency_words.txt")
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return load_frequency_words(frequency_file)
+
+        cached = self._frequency_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        result = load_frequency_words(frequency_file)
+        self._frequency_cache[path] = (mtime, result)
+        return result
 
     def matches_word_groups(
         self,
@@ -355,6 +380,8 @@ class AppContext:
         mode: str = "daily",
     ) -> str:
         """渲染飞书内容"""
+        from trendradar.notification import render_feishu_content
+
         return render_feishu_content(
             report_data=report_data,
             update_info=update_info,
@@ -372,6 +399,8 @@ class AppContext:
         mode: str = "daily",
     ) -> str:
         """渲染钉钉内容"""
+        from trendradar.notification import render_dingtalk_content
+
         return render_dingtalk_content(
             report_data=report_data,
             update_info=update_info,
@@ -413,6 +442,8 @@ class AppContext:
         Returns:
             分批后的消息内容列表
         """
+        from trendradar.notification import split_content_into_batches
+
         return split_content_into_batches(
             report_data=report_data,
             format_type=format_type,
@@ -441,8 +472,10 @@ class AppContext:
 
     # === 通知发送 ===
 
-    def create_notification_dispatcher(self) -> NotificationDispatcher:
+    def create_notification_dispatcher(self) -> "NotificationDispatcher":
         """创建通知调度器"""
+        from trendradar.notification import NotificationDispatcher
+
         # 创建翻译器（如果启用）
         translator = None
         trans_config = self.config.get("AI_TRANSLATION", {})
@@ -457,8 +490,10 @@ class AppContext:
             translator=translator,
         )
 
-    def create_push_manager(self) -> PushRecordManager:
+    def create_push_manager(self) -> "PushRecordManager":
         """创建推送记录管理器"""
+        from trendradar.notification import PushRecordManager
+
         return PushRecordManager(
             storage_backend=self.get_storage_manager(),
             get_time_func=self.get_time,
@@ -10,7 +10,12 @@ from trendradar.core.config import (
     get_account_at_index,
 )
 from trendradar.core.loader import load_config
-from trendradar.core.frequency import load_frequency_words, matches_word_groups
+from trendradar.core.frequency import (
+    load_frequency_words,
+    matches_word_groups,
+    KeywordMatcher,
+    compile_keyword_matcher,
+)
 from trendradar.core.data import (
     save_titles_to_file,
     read_all_today_titles_from_storage,
@@ -33,6 +38,8 @@ __all__ = [
     "load_config",
     "load_frequency_words",
     "matches_word_groups",
+    "KeywordMatcher",
+    "compile_keyword_matcher",
     # 数据处理
     "save_titles_to_file",
     "read_all_today_titles_from_storage",
@@ -4,13 +4,21 @@
 
 提供新闻统计和分析功能：
 - calculate_news_weight: 计算新闻权重
+- rank_titles_by_weight: 按权重批量排序新闻
 - format_time_display: 格式化时间显示
 - count_word_frequency: 统计词频
 """
 
+import heapq
+from itertools import repeat
 from typing import Dict, List, Tuple, Optional, Callable
 
-from trendradar.core.frequency import matches_word_groups, _word_matches
+from trendradar.core.frequency import compile_keyword_matcher
+
+# 频率词配置为空时使用的虚拟词组（只读；匹配器按列表对象缓存，复用同一对象才能命中缓存）
+_SHOW_ALL_NEWS_GROUPS = [{"required": [], "normal": [], "group_key": "全部新闻"}]
+_SHOW_ALL_RSS_GROUPS = [{"required": [], "normal": [], "group_key": "全部 RSS"}]
+_NO_FILTER_WORDS: List = []
 
 
 def calculate_news_weight(
@@ -60,6 +68,61 @@ def calculate_news_weight(
     return total_weight
 
 
+def rank_titles_by_weight(
+    titles: List[Dict],
+    rank_threshold: int,
+    weight_config: Dict,
+    limit: int = 0,
+) -> List[Dict]:
+    """
+    按权重批量排序新闻（权重降序 → 最高排名升序 → 出现次数降序）
+
+    一次性为所有标题计算排序键（与 calculate_news_weight 的计算结果完全一致），
+    有数量限制时用堆只选出前 limit 条，避免对整个分组全排序。
+
+    Args:
+        titles: 标题数据列表，包含 ranks 和 count
+        rank_threshold: 排名阈值
+        weight_config: 权重配置 {RANK_WEIGHT, FREQUENCY_WEIGHT, HOTNESS_WEIGHT}
+        limit: 最多返回的条数，0 表示不限制
+
+    Returns:
+        排序（并截断）后的标题列表，相同排序键保持原有顺序
+    """
+    rank_w = weight_config["RANK_WEIGHT"]
+    frequency_w = weight_config["FREQUENCY_WEIGHT"]
+    hotness_w = weight_config["HOTNESS_WEIGHT"]
+    # 逐元素运算交给 map（C 层循环），避免每条标题构造临时列表和生成器
+    cap_10 = repeat(10)
+    within_threshold = rank_threshold.__ge__
+
+    keys = []
+    for title_data in titles:
+        ranks = title_data.get("ranks", [])
+        count = title_data.get("count", len(ranks))
+        if not ranks:
+            keys.append((-0.0, 999, -title_data["count"]))
+            continue
+
+        total = len(ranks)
+        rank_score = 11 * total - sum(map(min, ranks, cap_10))
+        high_rank_count = sum(map(within_threshold, ranks))
+        weight = (
+            rank_score / total * rank_w
+            + min(count, 10) * 10 * frequency_w
+            + high_rank_count / total * 100 * hotness_w
+        )
+        keys.append((-weight, min(ranks), -title_data["count"]))
+
+    order = range(len(titles))
+    if 0 < limit < len(titles):
+        # nsmallest 与 sorted(...)[:limit] 结果一致（同样保持稳定性）
+        indexes = heapq.nsmallest(limit, order, key=keys.__getitem__)
+    else:
+        indexes = sorted(order, key=keys.__getitem__)
+    return [titles[index] for index in indexes]
+
+
 def format_time_display(
     first_time: str,
     last_time: str,
@@ -146,232 +209,143 @@ def count_word_frequency(
     # 如果没有配置词组，创建一个包含所有新闻的虚拟词组
     if not word_groups:
         print("频率词配置为空，将显示所有新闻")
-        word_groups = [{"required": [], "normal": [], "group_key": "全部新闻"}]
-        filter_words = []  # 清空过滤词，显示所有新闻
+        word_groups = _SHOW_ALL_NEWS_GROUPS
+        filter_words = _NO_FILTER_WORDS  # 清空过滤词，显示所有新闻
 
     is_first_today = is_first_crawl_func()
+    show_all = len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
+
+    if title_info is None:
+        title_info = {}
+    if new_titles is None:
+        new_titles = {}
 
     # 确定处理的数据源和新增标记逻辑
+    latest_time = None
     if mode == "incremental":
         if is_first_today:
             # 增量模式 + 当天第一次：处理所有新闻，都标记为新增
             results_to_process = results
-            all_news_are_new = True
         else:
             # 增量模式 + 当天非第一次：只处理新增的新闻
-            results_to_process = new_titles if new_titles else {}
-            all_news_are_new = True
+            results_to_process = new_titles
+        all_news_are_new = True
     elif mode == "current":
         # current 模式：只处理当前时间批次的新闻，但统计信息来自全部历史
-        if title_info:
-            latest_time = None
-            for source_titles in title_info.values():
-                for title_data in source_titles.values():
-                    last_time = title_data.get("last_time", "")
-                    if last_time:
-                        if latest_time is None or last_time > latest_time:
-                            latest_time = last_time
-
-            # 只处理 last_time 等于最新时间的新闻
-            if latest_time:
-                results_to_process = {}
-                for source_id, source_titles in results.items():
-                    if source_id in title_info:
-                        filtered_titles = {}
-                        for title, title_data in source_titles.items():
-                            if title in title_info[source_id]:
-                                info = title_info[source_id][title]
-                                if info.get("last_time") == latest_time:
-                                    filtered_titles[title] = title_data
-                        if filtered_titles:
-                            results_to_process[source_id] = filtered_titles
-
-                if not quiet:
-                    print(
-                        f"当前榜单模式：最新时间 {latest_time}，筛选出 {sum(len(titles) for titles in results_to_process.values())} 条当前榜单新闻"
-                    )
-            else:
-                results_to_process = results
-        else:
-            results_to_process = results
+        # （按最新时间的筛选在下方主循环中完成，不再构建中间字典）
+        results_to_process = results
+        latest_time = max(
+            (
+                title_data.get("last_time", "")
+                for source_titles in title_info.values()
+                for title_data in source_titles.values()
+            ),
+            default="",
+        ) or None
         all_news_are_new = False
     else:
         # 当日汇总模式：处理所有新闻
         results_to_process = results
         all_news_are_new = False
         total_input_news = sum(len(titles) for titles in results.values())
-        filter_status = (
-            "全部显示"
-            if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
-            else "频率词过滤"
-        )
+        filter_status = "全部显示" if show_all else "频率词过滤"
         print(f"当日汇总模式：处理 {total_input_news} 条新闻，模式：{filter_status}")
 
+    # 如果是增量模式或 current 模式第一次，统计匹配的新增新闻数量
+    count_matched_new = (mode == "incremental" and all_news_are_new) or (
+        mode == "current" and is_first_today
+    )
+
+    # 按词组逐条累积统计结果：{group_key: {"count": 匹配数, "titles": [标题数据]}}
     word_stats = {}
+    for group in word_groups:
+        word_stats[group["group_key"]] = {"count": 0, "titles": []}
+
     total_titles = 0
-    processed_titles = {}
     matched_new_count = 0
 
-    if title_info is None:
-        title_info = {}
-    if new_titles is None:
-        new_titles = {}
-
-    for group in word_groups:
-        group_key = group["group_key"]
-        word_stats[group_key] = {"count": 0, "titles": {}}
+    # 标题 → 词组的分配结果缓存在匹配器中，同一份配置下重复统计时只需匹配新出现的标题
+    matcher = compile_keyword_matcher(word_groups, filter_words, global_filters)
 
     for source_id, titles_data in results_to_process.items():
-        total_titles += len(titles_data)
-
-        if source_id not in processed_titles:
-            processed_titles[source_id] = {}
-
-        for title, title_data in titles_data.items():
-            if title in processed_titles.get(source_id, {}):
+        source_info = title_info.get(source_id, {})
+        if latest_time is not None:
+            # current 模式：只处理 last_time 等于最新时间的新闻
+            if source_id not in title_info:
                 continue
+        else:
+            total_titles += len(titles_data)
 
-            # 使用统一的匹配逻辑
-            matches_frequency_words = matches_word_groups(
-                title, word_groups, filter_words, global_filters
-            )
+        source_name = id_to_name.get(source_id, source_id)
+        source_new_titles = new_titles.get(source_id, {})
 
-            if not matches_frequency_words:
+        for title, title_data in titles_data.items():
+            info = source_info.get(title)
+            if latest_time is not None:
+                if info is None or info.get("last_time") != latest_time:
+                    continue
+                total_titles += 1
+
+            # 一次匹配得到标题所属的第一个词组（同时应用过滤词和全局过滤词）
+            group_index = matcher.match(title)
+            if group_index is None:
                 continue
 
-            # 如果是增量模式或 current 模式第一次，统计匹配的新增新闻数量
-            if (mode == "incremental" and all_news_are_new) or (
-                mode == "current" and is_first_today
-            ):
+            if count_matched_new:
                 matched_new_count += 1
 
-            source_ranks = title_data.get("ranks", [])
-            source_url = title_data.get("url", "")
-            source_mobile_url = title_data.get("mobileUrl", "")
-
-            # 找到匹配的词组（防御性转换确保类型安全）
-            title_lower = str(title).lower() if not isinstance(title, str) else title.lower()
-            for group in word_groups:
-                required_words = group["required"]
-                normal_words = group["normal"]
-
-                # 如果是"全部新闻"模式，所有标题都匹配第一个（唯一的）词组
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻":
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-                else:
-                    # 原有的匹配逻辑（支持正则语法）
-                    if required_words:
-                        all_required_present = all(
-                            _word_matches(req_item, title_lower)
-                            for req_item in required_words
-                        )
-                        if not all_required_present:
-                            continue
-
-                    if normal_words:
-                        any_normal_present = any(
-                            _word_matches(normal_item, title_lower)
-                            for normal_item in normal_words
-                        )
-                        if not any_normal_present:
-                            continue
-
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-
-                first_time = ""
-                last_time = ""
-                count_info = 1
-                ranks = source_ranks if source_ranks else []
-                url = source_url
-                mobile_url = source_mobile_url
-                rank_timeline = []
-
-                # 对于 current 模式，从历史统计信息中获取完整数据
-                if (
-                    mode == "current"
-                    and title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                    rank_timeline = info.get("rank_timeline", [])
-                elif (
-                    title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                    rank_timeline = info.get("rank_timeline", [])
-
-                if not ranks:
-                    ranks = [99]
-
-                time_display = format_time_display(first_time, last_time, convert_time_func)
-
-                source_name = id_to_name.get(source_id, source_id)
-
-                # 判断是否为新增
-                is_new = False
-                if all_news_are_new:
-                    # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
-                    is_new = True
-                elif new_titles and source_id in new_titles:
-                    # 检查是否在新增列表中
-                    new_titles_for_source = new_titles[source_id]
-                    is_new = title in new_titles_for_source
-
-                word_stats[group_key]["titles"][source_id].append(
-                    {
-                        "title": title,
-                        "source_name": source_name,
-                        "first_time": first_time,
-                        "last_time": last_time,
-                        "time_display": time_display,
-                        "count": count_info,
-                        "ranks": ranks,
-                        "rank_threshold": rank_threshold,
-                        "url": url,
-                        "mobileUrl": mobile_url,
-                        "is_new": is_new,
-                        "rank_timeline": rank_timeline,
-                    }
-                )
-
-                if source_id not in processed_titles:
-                    processed_titles[source_id] = {}
-                processed_titles[source_id][title] = True
+            first_time = ""
+            last_time = ""
+            count_info = 1
+            ranks = title_data.get("ranks", [])
+            url = title_data.get("url", "")
+            mobile_url = title_data.get("mobileUrl", "")
+            rank_timeline = []
+
+            # 从历史统计信息中获取完整数据
+            if info is not None:
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if info.get("ranks"):
+                    ranks = info["ranks"]
+                url = info.get("url", url)
+                mobile_url = info.get("mobileUrl", mobile_url)
+                rank_timeline = info.get("rank_timeline", [])
+
+            if not ranks:
+                ranks = [99]
+
+            # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
+            is_new = all_news_are_new or title in source_new_titles
+
+            group_stats = word_stats[word_groups[group_index]["group_key"]]
+            group_stats["count"] += 1
+            group_stats["titles"].append(
+                {
+                    "title": title,
+                    "source_name": source_name,
+                    "first_time": first_time,
+                    "last_time": last_time,
+                    "time_display": format_time_display(first_time, last_time, convert_time_func),
+                    "count": count_info,
+                    "ranks": ranks,
+                    "rank_threshold": rank_threshold,
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                    "is_new": is_new,
+                    "rank_timeline": rank_timeline,
+                }
+            )
 
-                break
+    if latest_time is not None and not quiet:
+        print(f"当前榜单模式：最新时间 {latest_time}，筛选出 {total_titles} 条当前榜单新闻")
 
     # 最后统一打印汇总信息
     if mode == "incremental":
         if is_first_today:
             total_input_news = sum(len(titles) for titles in results.values())
-            filter_status = (
-                "全部显示"
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
-                else "频率词匹配"
-            )
+            filter_status = "全部显示" if show_all else "频率词匹配"
             if not quiet:
                 print(
                     f"增量模式：当天第一次爬取，{total_input_news} 条新闻中有 {matched_new_count} 条{filter_status}"
@@ -379,12 +353,7 @@ def count_word_frequency(
         else:
             if new_titles:
                 total_new_count = sum(len(titles) for titles in new_titles.values())
-                filter_status = (
-                    "全部显示"
-                    if len(word_groups) == 1
-                    and word_groups[0]["group_key"] == "全部新闻"
-                    else "匹配频率词"
-                )
+                filter_status = "全部显示" if show_all else "匹配频率词"
                 if not quiet:
                     print(
                         f"增量模式：{total_new_count} 条新增新闻中，有 {matched_new_count} 条{filter_status}"
@@ -395,24 +364,16 @@ def count_word_frequency(
                 if not quiet:
                     print("增量模式：未检测到新增新闻")
     elif mode == "current":
-        total_input_news = sum(len(titles) for titles in results_to_process.values())
+        total_input_news = total_titles
         if is_first_today:
-            filter_status = (
-                "全部显示"
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
-                else "频率词匹配"
-            )
+            filter_status = "全部显示" if show_all else "频率词匹配"
             if not quiet:
                 print(
                     f"当前榜单模式：当天第一次爬取，{total_input_news} 条当前榜单新闻中有 {matched_new_count} 条{filter_status}"
                 )
         else:
             matched_count = sum(stat["count"] for stat in word_stats.values())
-            filter_status = (
-                "全部显示"
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
-                else "频率词匹配"
-            )
+            filter_status = "全部显示" if show_all else "频率词匹配"
             if not quiet:
                 print(
                     f"当前榜单模式：{total_input_news} 条当前榜单新闻中有 {matched_count} 条{filter_status}"
@@ -431,28 +392,16 @@ def count_word_frequency(
     }
 
     for group_key, data in word_stats.items():
-        all_titles = []
-        for source_id, title_list in data["titles"].items():
-            all_titles.extend(title_list)
-
-        # 按权重排序
-        sorted_titles = sorted(
-            all_titles,
-            key=lambda x: (
-                -calculate_news_weight(x, rank_threshold, weight_config),
-                min(x["ranks"]) if x["ranks"] else 999,
-                -x["count"],
-            ),
-        )
-
         # 应用最大显示数量限制（优先级：单独配置 > 全局配置）
         group_max_count = group_key_to_max_count.get(group_key, 0)
         if group_max_count == 0:
             # 使用全局配置
             group_max_count = max_news_per_keyword
 
-        if group_max_count > 0:
-            sorted_titles = sorted_titles[:group_max_count]
+        # 按权重排序（有数量限制时只选出前 N 条）
+        sorted_titles = rank_titles_by_weight(
+            data["titles"], rank_threshold, weight_config, limit=group_max_count
+        )
 
         # 优先使用 display_name，否则使用 group_key
         display_word = group_key_to_display_name.get(group_key) or group_key
@@ -553,8 +502,8 @@ def count_rss_frequency(
     if not word_groups:
         if not quiet:
             print("[RSS] 频率词配置为空，将显示所有 RSS 条目")
-        word_groups = [{"required": [], "normal": [], "group_key": "全部 RSS"}]
-        filter_words = []
+        word_groups = _SHOW_ALL_RSS_GROUPS
+        filter_words = _NO_FILTER_WORDS
 
     # 创建新增条目的 URL 集合，用于快速查找
     new_urls = set()
@@ -571,6 +520,7 @@ def count_rss_frequency(
 
     total_items = len(rss_items)
     processed_urls = set()  # 用于去重
+    matcher = compile_keyword_matcher(word_groups, filter_words, global_filters)
 
     # 为每个条目分配一个基于发布时间的"排名"
     # 按发布时间排序，最新的排在前面
@@ -591,67 +541,36 @@ def count_rss_frequency(
         if url:
             processed_urls.add(url)
 
-        # 使用统一的匹配逻辑
-        if not matches_word_groups(title, word_groups, filter_words, global_filters):
+        # 一次匹配得到条目所属的第一个词组（一个条目只计入一个词组）
+        group_index = matcher.match(title)
+        if group_index is None:
             continue
 
-        # 找到匹配的词组
-        title_lower = title.lower()
-        for group in word_groups:
-            required_words = group["required"]
-            normal_words = group["normal"]
-            group_key = group["group_key"]
-
-            # "全部 RSS" 模式：所有条目都匹配
-            if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部 RSS":
-                matched = True
-            else:
-                # 检查必须词（支持正则语法）
-                if required_words:
-                    all_required_present = all(
-                        _word_matches(req_item, title_lower)
-                        for req_item in required_words
-                    )
-                    if not all_required_present:
-                        continue
-
-                # 检查普通词（支持正则语法）
-                if normal_words:
-                    any_normal_present = any(
-                        _word_matches(normal_item, title_lower)
-                        for normal_item in normal_words
-                    )
-                    if not any_normal_present:
-                        continue
-
-                matched = True
-
-            if matched:
-                word_stats[group_key]["count"] += 1
-
-                # 格式化时间显示
-                published_at = item.get("published_at", "")
-                time_display = format_iso_time_friendly(published_at, timezone, include_date=True) if published_at else ""
-
-                # 判断是否为新增
-                is_new = url in new_urls if url else False
-
-                # 获取排名（基于发布时间顺序）
-                rank = url_to_rank.get(url, 99) if url else 99
-
-                title_data = {
-                    "title": title,
-                    "source_name": item.get("feed_name", item.get("feed_id", "RSS")),
-                    "time_display": time_display,
-                    "count": 1,  # RSS 条目通常只出现一次
-                    "ranks": [rank],
-                    "rank_threshold": rank_threshold,
-                    "url": url,
-                    "mobile_url": "",
-                    "is_new": is_new,
-                }
-                word_stats[group_key]["titles"].append(title_data)
-                break  # 一个条目只匹配第一个词组
+        group_key = word_groups[group_index]["group_key"]
+        word_stats[group_key]["count"] += 1
+
+        # 格式化时间显示
+        published_at = item.get("published_at", "")
+        time_display = format_iso_time_friendly(published_at, timezone, include_date=True) if published_at else ""
+
+        # 判断是否为新增
+        is_new = url in new_urls if url else False
+
+        # 获取排名（基于发布时间顺序）
+        rank = url_to_rank.get(url, 99) if url else 99
+
+        title_data = {
+            "title": title,
+            "source_name": item.get("feed_name", item.get("feed_id", "RSS")),
+            "time_display": time_display,
+            "count": 1,  # RSS 条目通常只出现一次
+            "ranks": [rank],
+            "rank_threshold": rank_threshold,
+            "url": url,
+            "mobile_url": "",
+            "is_new": is_new,
+        }
+        word_stats[group_key]["titles"].append(title_data)
 
     # 构建统计结果
     stats = []
@@ -751,14 +670,7 @@ def convert_keyword_stats_to_platform_stats(
 
     # 3. 按权重排序每个平台内的新闻
     for source_name, titles in platform_map.items():
-        platform_map[source_name] = sorted(
-            titles,
-            key=lambda x: (
-                -calculate_news_weight(x, rank_threshold, weight_config),
-                min(x["ranks"]) if x["ranks"] else 999,
-                -x["count"],
-            ),
-        )
+        platform_map[source_name] = rank_titles_by_weight(titles, rank_threshold, weight_config)
 
     # 4. 构建平台统计结果
     platform_stats = []
@@ -11,12 +11,16 @@
 - 正则表达式（/pattern/ 语法）
 - 显示名称（=> 别名 语法）
 - 组别名（[组别名] 语法，作为词组第一行）
+
+匹配由预编译的 KeywordMatcher 完成（Aho–Corasick 自动机 + 合并正则），
+每个标题只需一次扫描即可确定所属词组。
 """
 
 import os
 import re
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Union
 
 
 def _parse_word(word: str) -> Dict:
@@ -240,6 +244,241 @@ def load_frequency_words(
     return processed_groups, filter_words, global_filters
 
 
+class _AhoCorasick:
+    """
+    多模式字符串匹配自动机（Aho–Corasick）
+
+    一次扫描文本即可找出所有出现的模式，耗时与文本长度及命中数相关，
+    与模式数量基本无关
+    """
+
+    def __init__(self, patterns: List[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        outputs: List[Set[int]] = [set()]
+        # 空模式在任何文本中都“出现”（与 "" in text 语义一致）
+        self.always: FrozenSet[int] = frozenset(i for i, p in enumerate(patterns) if not p)
+
+        for pattern_id, pattern in enumerate(patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append(set())
+                state = next_state
+            outputs[state].add(pattern_id)
+
+        # 广度优先构建失败指针，并把失败链上的输出合并到当前状态
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                outputs[next_state] |= outputs[self._fail[next_state]]
+
+        self._output: List[FrozenSet[int]] = [frozenset(o) for o in outputs]
+
+    def search(self, text: str) -> Set[int]:
+        """返回文本中出现的所有模式 ID"""
+        goto, fail, output = self._goto, self._fail, self._output
+        found = set(self.always)
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found |= output[state]
+        return found
+
+
+class KeywordMatcher:
+    """
+    预编译的频率词匹配器
+
+    将词组中的普通词、必须词、过滤词以及全局过滤词统一编号：
+    - 普通字符串词放入一个 Aho–Corasick 自动机，一次扫描得到全部命中
+    - 正则词合并为一个正则做预筛，只有合并正则命中时才逐个确认
+    再通过“词 → 所属词组”的倒排表，只检查有命中词的候选词组，
+    一次扫描即可得到标题所属的第一个词组。
+
+    词组分配结果按标题缓存：同一份配置下对当日不断增长的数据重复统计时，
+    只有新出现的标题需要实际匹配。
+
+    匹配语义与 matches_word_groups 完全一致。
+    """
+
+    # 标题缓存上限（超出后清空重建，避免常驻进程中无限增长）
+    TITLE_CACHE_SIZE = 200000
+
+    def __init__(
+        self,
+        word_groups: List[Dict],
+        filter_words: List,
+        global_filters: Optional[List[str]] = None,
+    ):
+        self.word_groups = word_groups
+        self._title_cache: Dict[str, Optional[int]] = {}
+        self._literal_ids: Dict[str, int] = {}
+        self._regex_patterns: List[re.Pattern] = []
+
+        self._global_ids = frozenset(self._literal_term(w) for w in (global_filters or []))
+        self._filter_ids = frozenset(self._term(w) for w in filter_words)
+
+        # 每个词组的 (必须词集合, 普通词集合)，以及 词 → 词组索引 的倒排表
+        self._groups: List[Tuple[FrozenSet[int], FrozenSet[int]]] = []
+        term_groups: Dict[int, List[int]] = {}
+        always_groups = []
+        for index, group in enumerate(word_groups):
+            required = frozenset(self._term(w) for w in group["required"])
+            normal = frozenset(self._term(w) for w in group["normal"])
+            self._groups.append((required, normal))
+            if not required and not normal:
+                always_groups.append(index)
+            # 词组至少要命中一个词：有普通词时必须命中普通词，否则必须命中全部必须词
+            for term_id in normal or required:
+                term_groups.setdefault(term_id, []).append(index)
+        self._term_groups = term_groups
+        self._always_groups = frozenset(always_groups)
+
+        literals = sorted(self._literal_ids, key=self._literal_ids.get)
+        self._automaton = _AhoCorasick(literals)
+
+        # 合并正则用于预筛（含反向引用等无法合并的写法时退化为逐个匹配）
+        self._combined_regex = None
+        if self._regex_patterns:
+            try:
+                self._combined_regex = re.compile(
+                    "|".join(f"(?:{p.pattern})" for p in self._regex_patterns),
+                    re.IGNORECASE,
+                )
+            except re.error:
+                self._combined_regex = None
+
+    def _literal_term(self, word: str) -> int:
+        return self._literal_ids.setdefault(word.lower(), len(self._literal_ids))
+
+    def _term(self, word_config: Union[str, Dict]) -> int:
+        """
+        为词分配编号：字符串词为非负整数，正则词为负数（~正则序号）
+        """
+        if isinstance(word_config, str):
+            return self._literal_term(word_config)
+        if word_config.get("is_regex") and word_config.get("pattern"):
+            self._regex_patterns.append(word_config["pattern"])
+            return ~(len(self._regex_patterns) - 1)
+        return self._literal_term(word_config["word"])
+
+    def _hits(self, title_lower: str) -> Set[int]:
+        """标题命中的所有词编号"""
+        hits = self._automaton.search(title_lower)
+        if self._regex_patterns and (
+            self._combined_regex is None or self._combined_regex.search(title_lower)
+        ):
+            for index, pattern in enumerate(self._regex_patterns):
+                if pattern.search(title_lower):
+                    hits.add(~index)
+        return hits
+
+    @staticmethod
+    def _normalize_title(title: Any) -> str:
+        # 防御性类型检查：确保 title 是有效字符串
+        if not isinstance(title, str):
+            title = str(title) if title is not None else ""
+        return title
+
+    def _first_group(self, hits: Set[int]) -> Optional[int]:
+        candidates = set(self._always_groups)
+        for term_id in hits:
+            candidates.update(self._term_groups.get(term_id, ()))
+        for index in sorted(candidates):
+            required, normal = self._groups[index]
+            if required and not required <= hits:
+                continue
+            if normal and normal.isdisjoint(hits):
+                continue
+            return index
+        return None
+
+    def match(self, title: str) -> Optional[int]:
+        """
+        返回标题匹配的第一个词组索引
+
+        Returns:
+            词组索引；被（全局）过滤词排除、未匹配任何词组或未配置词组时返回 None
+        """
+        title = self._normalize_title(title)
+        cache = self._title_cache
+        if title in cache:
+            return cache[title]
+
+        if not title.strip() or not self.word_groups:
+            group_index = None
+        else:
+            hits = self._hits(title.lower())
+            if not self._global_ids.isdisjoint(hits) or not self._filter_ids.isdisjoint(hits):
+                group_index = None
+            else:
+                group_index = self._first_group(hits)
+
+        if len(cache) >= self.TITLE_CACHE_SIZE:
+            cache.clear()
+        cache[title] = group_index
+        return group_index
+
+    def matches(self, title: str) -> bool:
+        """检查标题是否匹配词组规则（未配置词组时仅应用全局过滤，匹配所有标题）"""
+        title = self._normalize_title(title)
+        if not title.strip():
+            return False
+
+        if self.word_groups:
+            return self.match(title) is not None
+
+        # 如果没有配置词组，则匹配所有标题（支持显示全部新闻）
+        return self._global_ids.isdisjoint(self._automaton.search(title.lower()))
+
+
+# 按配置对象身份缓存编译结果（缓存中持有原对象引用，保证 id 不会被复用）
+_MATCHER_CACHE: "OrderedDict[Tuple[int, int, int], Tuple[Tuple, KeywordMatcher]]" = OrderedDict()
+_MATCHER_CACHE_SIZE = 16
+
+
+def compile_keyword_matcher(
+    word_groups: List[Dict],
+    filter_words: List,
+    global_filters: Optional[List[str]] = None,
+) -> KeywordMatcher:
+    """
+    获取频率词配置对应的预编译匹配器
+
+    load_frequency_words 的返回值（及 AppContext 中按文件修改时间缓存的结果）
+    在整个运行期间复用同一组列表对象，因此同一份配置只编译一次。
+    配置列表在编译后应视为只读。
+    """
+    key = (id(word_groups), id(filter_words), id(global_filters))
+    cached = _MATCHER_CACHE.get(key)
+    if cached is not None:
+        _MATCHER_CACHE.move_to_end(key)
+        return cached[1]
+
+    matcher = KeywordMatcher(word_groups, filter_words, global_filters)
+    _MATCHER_CACHE[key] = ((word_groups, filter_words, global_filters), matcher)
+    if len(_MATCHER_CACHE) > _MATCHER_CACHE_SIZE:
+        _MATCHER_CACHE.popitem(last=False)
+    return matcher
+
+
 def matches_word_groups(
     title: str,
     word_groups: List[Dict],
@@ -258,49 +497,4 @@ def matches_word_groups(
     Returns:
         是否匹配
     """
-    # 防御性类型检查：确保 title 是有效字符串
-    if not isinstance(title, str):
-        title = str(title) if title is not None else ""
-    if not title.strip():
-        return False
-
-    title_lower = title.lower()
-
-    # 全局过滤检查（优先级最高）
-    if global_filters:
-        if any(global_word.lower() in title_lower for global_word in global_filters):
-            return False
-
-    # 如果没有配置词组，则匹配所有标题（支持显示全部新闻）
-    if not word_groups:
-        return True
-
-    # 过滤词检查（兼容新旧格式）
-    for filter_item in filter_words:
-        if _word_matches(filter_item, title_lower):
-            return False
-
-    # 词组匹配检查
-    for group in word_groups:
-        required_words = group["required"]
-        normal_words = group["normal"]
-
-        # 必须词检查
-        if required_words:
-            all_required_present = all(
-                _word_matches(req_item, title_lower) for req_item in required_words
-            )
-            if not all_required_present:
-                continue
-
-        # 普通词检查
-        if normal_words:
-            any_normal_present = any(
-                _word_matches(normal_item, title_lower) for normal_item in normal_words
-            )
-            if not any_normal_present:
-                continue
-
-        return True
-
-    return False
+    return compile_keyword_matcher(word_groups, filter_words, global_filters).matches(title)
@@ -69,6 +69,8 @@ def _load_crawler_config(config_data: Dict) -> Dict:
     platforms_config = config_data.get("platforms", {})
     return {
         "REQUEST_INTERVAL": crawler_config.get("request_interval", 100),
+        "CRAWLER_MAX_WORKERS": crawler_config.get("max_workers", 1),
+        "CRAWLER_HTTP_CACHE": crawler_config.get("http_cache", True),
         "USE_PROXY": crawler_config.get("use_proxy", False),
         "DEFAULT_PROXY": crawler_config.get("default_proxy", ""),
         "ENABLE_CRAWLER": platforms_config.get("enabled", True),
@@ -140,6 +142,33 @@ def _load_weight_config(config_data: Dict) -> Dict:
     }
 
 
+def _load_adaptive_schedule_config(config_data: Dict) -> Dict:
+    """加载自适应抓取调度配置"""
+    advanced = config_data.get("advanced", {})
+    schedule = advanced.get("adaptive_schedule", {})
+    return {
+        "ENABLED": schedule.get("enabled", False),
+        "MIN_INTERVAL": schedule.get("min_interval", 0),
+        "MAX_INTERVAL": schedule.get("max_interval", 120),
+        "FAILURE_BACKOFF": schedule.get("failure_backoff", 30),
+        "HIGH_CHURN": schedule.get("high_churn", 0.3),
+        "LOW_CHURN": schedule.get("low_churn", 0.05),
+        "SMOOTHING": schedule.get("smoothing", 0.5),
+    }
+
+
+def _load_circuit_breaker_config(config_data: Dict) -> Dict:
+    """加载数据源熔断配置"""
+    advanced = config_data.get("advanced", {})
+    breaker = advanced.get("circuit_breaker", {})
+    return {
+        "ENABLED": breaker.get("enabled", True),
+        "FAILURE_THRESHOLD": breaker.get("failure_threshold", 3),
+        "COOLDOWN": breaker.get("cooldown", 30),
+        "MAX_COOLDOWN": breaker.get("max_cooldown", 240),
+    }
+
+
 def _load_rss_config(config_data: Dict) -> Dict:
     """加载 RSS 配置"""
     rss = config_data.get("rss", {})
@@ -169,6 +198,8 @@ def _load_rss_config(config_data: Dict) -> Dict:
         "ENABLED": rss.get("enabled", False),
         "REQUEST_INTERVAL": advanced_rss.get("request_interval", 2000),
         "TIMEOUT": advanced_rss.get("timeout", 15),
+        "MAX_WORKERS": advanced_rss.get("max_workers", 1),
+        "HTTP_CACHE": advanced_rss.get("http_cache", True),
         "USE_PROXY": advanced_rss.get("use_proxy", False),
         "PROXY_URL": rss_proxy_url,
         "FEEDS": rss.get("feeds", []),
@@ -289,10 +320,13 @@ def _load_storage_config(config_data: Dict) -> Dict:
     local = storage.get("local", {})
     remote = storage.get("remote", {})
     pull = storage.get("pull", {})
+    warehouse = storage.get("warehouse", {})
 
     txt_enabled_env = _get_env_bool("STORAGE_TXT_ENABLED")
     html_enabled_env = _get_env_bool("STORAGE_HTML_ENABLED")
     pull_enabled_env = _get_env_bool("PULL_ENABLED")
+    background_upload_env = _get_env_bool("REMOTE_BACKGROUND_UPLOAD")
+    warehouse_enabled_env = _get_env_bool("WAREHOUSE_ENABLED")
 
     return {
         "BACKEND": _get_env_str("STORAGE_BACKEND") or storage.get("backend", "auto"),
@@ -304,6 +338,7 @@ def _load_storage_config(config_data: Dict) -> Dict:
         "LOCAL": {
             "DATA_DIR": local.get("data_dir", "output"),
             "RETENTION_DAYS": _get_env_int("LOCAL_RETENTION_DAYS") or local.get("retention_days", 0),
+            "ARCHIVE_DAYS": _get_env_int("LOCAL_ARCHIVE_DAYS") or local.get("archive_days", 0),
         },
         "REMOTE": {
             "ENDPOINT_URL": _get_env_str("S3_ENDPOINT_URL") or remote.get("endpoint_url", ""),
@@ -312,11 +347,19 @@ def _load_storage_config(config_data: Dict) -> Dict:
             "SECRET_ACCESS_KEY": _get_env_str("S3_SECRET_ACCESS_KEY") or remote.get("secret_access_key", ""),
             "REGION": _get_env_str("S3_REGION") or remote.get("region", ""),
             "RETENTION_DAYS": _get_env_int("REMOTE_RETENTION_DAYS") or remote.get("retention_days", 0),
+            "ARCHIVE_DAYS": _get_env_int("REMOTE_ARCHIVE_DAYS") or remote.get("archive_days", 0),
+            "SYNC_MODE": _get_env_str("REMOTE_SYNC_MODE") or remote.get("sync_mode", "full"),
+            "COMPACT_EVERY": _get_env_int("REMOTE_COMPACT_EVERY") or remote.get("compact_every", 24),
+            "MAX_WORKERS": _get_env_int("REMOTE_MAX_WORKERS") or remote.get("max_workers", 8),
+            "BACKGROUND_UPLOAD": background_upload_env if background_upload_env is not None else remote.get("background_upload", False),
         },
         "PULL": {
             "ENABLED": pull_enabled_env if pull_enabled_env is not None else pull.get("enabled", False),
             "DAYS": _get_env_int("PULL_DAYS") or pull.get("days", 7),
         },
+        "WAREHOUSE": {
+            "ENABLED": warehouse_enabled_env if warehouse_enabled_env is not None else warehouse.get("enabled", False),
+        },
     }
 
 
@@ -494,6 +537,12 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     # 权重配置
     config["WEIGHT_CONFIG"] = _load_weight_config(config_data)
 
+    # 自适应抓取调度配置
+    config["ADAPTIVE_SCHEDULE"] = _load_adaptive_schedule_config(config_data)
+
+    # 数据源熔断配置
+    config["CIRCUIT_BREAKER"] = _load_circuit_breaker_config(config_data)
+
     # 平台配置
     platforms_config = config_data.get("platforms", {})
     config["PLATFORMS"] = platforms_config.get("sources", [])
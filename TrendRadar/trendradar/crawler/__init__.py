@@ -4,5 +4,7 @@
 """
 
 from trendradar.crawler.fetcher import DataFetcher
+from trendradar.crawler.breaker import CircuitBreaker
+from trendradar.crawler.schedule import AdaptiveScheduler
 
-__all__ = ["DataFetcher"]
+__all__ = ["DataFetcher", "CircuitBreaker", "AdaptiveScheduler"]
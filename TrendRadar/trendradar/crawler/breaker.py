@@ -0,0 +1,120 @@
+# coding=utf-8
+"""
+数据源熔断模块
+
+根据 crawl_source_status / rss_crawl_status 中的抓取状态，
+对连续失败的数据源进行熔断：
+- 关闭（closed）：正常抓取
+- 打开（open）：冷却期内直接跳过，不发请求
+- 半开（half_open）：冷却期结束后发出一次探测请求（不重试、缩短超时），
+  成功则恢复，失败则重新进入冷却期（冷却时间按 2 的幂次递增）
+
+状态完全由当日抓取状态表推导：跳过的源不写入状态表，
+因此“上次尝试时间”即最近一条状态记录的抓取时间。
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class CircuitBreaker:
+    """数据源熔断器"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_stats: Dict[str, Dict[str, Any]],
+        now: datetime,
+        failure_threshold: int = 3,
+        cooldown: float = 30,
+        max_cooldown: float = 240,
+    ):
+        """
+        初始化熔断器
+
+        Args:
+            failure_stats: {source_id: {failures, last_attempt}}，
+                由存储后端 get_source_failure_stats / get_rss_failure_stats 提供
+            now: 当前时间（配置时区）
+            failure_threshold: 连续失败多少次后熔断
+            cooldown: 首次熔断的冷却时间（分钟）
+            max_cooldown: 冷却时间上限（分钟）
+        """
+        self.failure_stats = failure_stats
+        self.now_minutes = now.hour * 60 + now.minute
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.cooldown = max(0.0, float(cooldown))
+        self.max_cooldown = max(self.cooldown, float(max_cooldown))
+
+    @classmethod
+    def from_config(
+        cls, config: Dict, failure_stats: Dict[str, Dict[str, Any]], now: datetime
+    ) -> "CircuitBreaker":
+        """从 CIRCUIT_BREAKER 配置创建熔断器"""
+        return cls(
+            failure_stats,
+            now,
+            failure_threshold=config.get("FAILURE_THRESHOLD", 3),
+            cooldown=config.get("COOLDOWN", 30),
+            max_cooldown=config.get("MAX_COOLDOWN", 240),
+        )
+
+    @staticmethod
+    def _parse_minutes(time_str: str) -> Optional[int]:
+        """解析 HH:MM 或 HH-MM 为当日分钟数"""
+        try:
+            hour, minute = time_str.replace("-", ":").split(":")[:2]
+            return int(hour) * 60 + int(minute)
+        except (AttributeError, ValueError):
+            return None
+
+    def _cooldown_for(self, failures: int) -> float:
+        """当前连续失败次数对应的冷却时间（分钟）"""
+        exponent = failures - self.failure_threshold
+        return min(self.max_cooldown, self.cooldown * (2 ** exponent))
+
+    def retry_in(self, source_id: str) -> float:
+        """距离允许探测还有多少分钟（未熔断时为 0）"""
+        stats = self.failure_stats.get(source_id)
+        if not stats or stats.get("failures", 0) < self.failure_threshold:
+            return 0.0
+
+        last_minutes = self._parse_minutes(stats.get("last_attempt", ""))
+        if last_minutes is None or last_minutes > self.now_minutes:
+            return 0.0
+
+        elapsed = self.now_minutes - last_minutes
+        return max(0.0, self._cooldown_for(stats["failures"]) - elapsed)
+
+    def state(self, source_id: str) -> str:
+        """获取数据源的熔断状态"""
+        stats = self.failure_stats.get(source_id)
+        if not stats or stats.get("failures", 0) < self.failure_threshold:
+            return self.CLOSED
+        return self.OPEN if self.retry_in(source_id) > 0 else self.HALF_OPEN
+
+    def partition(self, source_ids: Iterable[str]) -> Tuple[List[str], List[str]]:
+        """
+        拆分本次可请求与需跳过的数据源，并输出熔断日志
+
+        Returns:
+            (可请求的源 ID 列表, 跳过的源 ID 列表)
+        """
+        allowed, skipped = [], []
+        for source_id in source_ids:
+            state = self.state(source_id)
+            failures = self.failure_stats.get(source_id, {}).get("failures", 0)
+            if state == self.OPEN:
+                print(
+                    f"[熔断] 跳过 {source_id}（连续失败 {failures} 次，"
+                    f"{self.retry_in(source_id):.0f} 分钟后探测）"
+                )
+                skipped.append(source_id)
+            else:
+                if state == self.HALF_OPEN:
+                    print(f"[熔断] 探测 {source_id}（连续失败 {failures} 次）")
+                allowed.append(source_id)
+        return allowed, skipped
@@ -7,14 +7,24 @@
 - 批量平台数据爬取
 - 自动重试机制
 - 代理支持
+- 并发抓取（有界线程池 + 按主机限速）
+- 连接复用与条件请求（ETag / Last-Modified）
+- 数据源熔断（跳过持续失败的平台，冷却后探测）
 """
 
 import json
 import random
 import time
-from typing import Dict, List, Tuple, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+
+from trendradar.crawler.breaker import CircuitBreaker
+from trendradar.crawler.http_cache import ValidatorCache
+from trendradar.crawler.throttle import HostRateLimiter
 
 
 class DataFetcher:
@@ -32,10 +42,14 @@ class DataFetcher:
         "Cache-Control": "no-cache",
     }
 
+    # 连接池大小（需不小于并发抓取数）
+    POOL_MAXSIZE = 16
+
     def __init__(
         self,
         proxy_url: Optional[str] = None,
         api_url: Optional[str] = None,
+        cache_path: Optional[str] = None,
     ):
         """
         初始化数据获取器
@@ -43,9 +57,97 @@ class DataFetcher:
         Args:
             proxy_url: 代理服务器 URL（可选）
             api_url: API 基础 URL（可选，默认使用 DEFAULT_API_URL）
+            cache_path: HTTP 验证器缓存文件路径（可选，不设置则不发送条件请求）
         """
         self.proxy_url = proxy_url
         self.api_url = api_url or self.DEFAULT_API_URL
+        self.cache = ValidatorCache(cache_path) if cache_path else None
+        self.session = self._create_session()
+        # 并发模式下由 crawl_websites 设置，用于按主机限速
+        self._rate_limiter: Optional[HostRateLimiter] = None
+        # 熔断器（可选，由调用方在抓取前设置）
+        self.breaker: Optional[CircuitBreaker] = None
+        # 最近一次 crawl_websites 中因熔断跳过的平台 ID
+        self.breaker_skipped: List[str] = []
+
+    def _create_session(self) -> requests.Session:
+        """创建带连接池的请求会话（keep-alive，协商 gzip/br 压缩）"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.POOL_MAXSIZE)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        session.headers.update(self.DEFAULT_HEADERS)
+        # 只声明本机可解码的编码（安装 brotli 时包含 br）
+        session.headers["Accept-Encoding"] = make_headers(accept_encoding=True)["accept-encoding"]
+
+        if self.proxy_url:
+            session.proxies = {"http": self.proxy_url, "https": self.proxy_url}
+
+        return session
+
+    def close(self) -> None:
+        """保存验证器缓存并关闭会话"""
+        if self.cache:
+            self.cache.save()
+        self.session.close()
+
+    @staticmethod
+    def _split_id_info(id_info: Union[str, Tuple[str, str]]) -> Tuple[str, str]:
+        """拆分 平台ID 或 (平台ID, 别名) 为 (平台ID, 别名)"""
+        if isinstance(id_info, tuple):
+            return id_info
+        return id_info, id_info
+
+    def _build_url(self, id_value: str) -> str:
+        """构造平台请求 URL"""
+        return f"{self.api_url}?id={id_value}&latest"
+
+    def _get(self, url: str, headers: Optional[Dict] = None) -> requests.Response:
+        """通过会话发送 GET 请求（并发模式下按主机限速）"""
+        if self._rate_limiter:
+            self._rate_limiter.acquire(url)
+        return self.session.get(url, headers=headers, timeout=10)
+
+    @staticmethod
+    def _check_status(id_value: str, data_json: Dict) -> None:
+        """检查 API 响应状态并输出日志，状态异常时抛出 ValueError"""
+        status = data_json.get("status", "未知")
+        if status not in ["success", "cache"]:
+            raise ValueError(f"响应状态异常: {status}")
+
+        status_info = "最新数据" if status == "success" else "缓存数据"
+        print(f"获取 {id_value} 成功（{status_info}）")
+
+    @staticmethod
+    def _with_retry(
+        id_value: str,
+        attempt: Callable[[], Any],
+        max_retries: int,
+        min_retry_wait: int,
+        max_retry_wait: int,
+    ) -> Optional[Any]:
+        """
+        执行请求，失败时按随机退避重试
+
+        Returns:
+            attempt 的返回值，全部失败时返回 None
+        """
+        retries = 0
+        while retries <= max_retries:
+            try:
+                return attempt()
+            except Exception as e:
+                retries += 1
+                if retries <= max_retries:
+                    base_wait = random.uniform(min_retry_wait, max_retry_wait)
+                    additional_wait = (retries - 1) * random.uniform(1, 2)
+                    wait_time = base_wait + additional_wait
+                    print(f"请求 {id_value} 失败: {e}. {wait_time:.2f}秒后重试...")
+                    time.sleep(wait_time)
+                else:
+                    print(f"请求 {id_value} 失败: {e}")
+        return None
 
     def fetch_data(
         self,
@@ -66,113 +168,174 @@ class DataFetcher:
         Returns:
             (响应文本, 平台ID, 别名) 元组，失败时响应文本为 None
         """
-        if isinstance(id_info, tuple):
-            id_value, alias = id_info
-        else:
-            id_value = id_info
-            alias = id_value
+        id_value, alias = self._split_id_info(id_info)
+        url = self._build_url(id_value)
 
-        url = f"{self.api_url}?id={id_value}&latest"
+        def attempt() -> str:
+            response = self._get(url)
+            response.raise_for_status()
+            data_text = response.text
+            self._check_status(id_value, json.loads(data_text))
+            return data_text
 
-        proxies = None
-        if self.proxy_url:
-            proxies = {"http": self.proxy_url, "https": self.proxy_url}
+        data_text = self._with_retry(
+            id_value, attempt, max_retries, min_retry_wait, max_retry_wait
+        )
+        return data_text, id_value, alias
 
-        retries = 0
-        while retries <= max_retries:
-            try:
-                response = requests.get(
-                    url,
-                    proxies=proxies,
-                    headers=self.DEFAULT_HEADERS,
-                    timeout=10,
-                )
-                response.raise_for_status()
+    def fetch_titles(
+        self,
+        id_info: Union[str, Tuple[str, str]],
+        max_retries: int = 2,
+        min_retry_wait: int = 3,
+        max_retry_wait: int = 5,
+    ) -> Tuple[Optional[Dict], str, str]:
+        """
+        获取并解析指定ID数据，支持重试和条件请求
 
-                data_text = response.text
-                data_json = json.loads(data_text)
+        启用验证器缓存时携带 If-None-Match / If-Modified-Since 请求头，
+        服务端返回 304 时直接复用上次的解析结果；响应体只解码一次。
 
-                status = data_json.get("status", "未知")
-                if status not in ["success", "cache"]:
-                    raise ValueError(f"响应状态异常: {status}")
+        Args:
+            id_info: 平台ID 或 (平台ID, 别名) 元组
+            max_retries: 最大重试次数
+            min_retry_wait: 最小重试等待时间（秒）
+            max_retry_wait: 最大重试等待时间（秒）
 
-                status_info = "最新数据" if status == "success" else "缓存数据"
-                print(f"获取 {id_value} 成功（{status_info}）")
-                return data_text, id_value, alias
+        Returns:
+            (标题字典, 平台ID, 别名) 元组，失败时标题字典为 None
+        """
+        id_value, alias = self._split_id_info(id_info)
+        url = self._build_url(id_value)
 
-            except Exception as e:
-                retries += 1
-                if retries <= max_retries:
-                    base_wait = random.uniform(min_retry_wait, max_retry_wait)
-                    additional_wait = (retries - 1) * random.uniform(1, 2)
-                    wait_time = base_wait + additional_wait
-                    print(f"请求 {id_value} 失败: {e}. {wait_time:.2f}秒后重试...")
-                    time.sleep(wait_time)
-                else:
-                    print(f"请求 {id_value} 失败: {e}")
-                    return None, id_value, alias
+        def attempt() -> Dict:
+            headers = self.cache.conditional_headers(id_value) if self.cache else None
+            response = self._get(url, headers=headers)
+
+            if response.status_code == 304 and self.cache:
+                titles = self.cache.get_payload(id_value)
+                if titles is not None:
+                    print(f"获取 {id_value} 成功（未变化）")
+                    return titles
+                raise ValueError("返回 304 但本地无缓存数据")
+
+            response.raise_for_status()
+            data_json = response.json()
+            self._check_status(id_value, data_json)
 
-        return None, id_value, alias
+            titles = self._parse_items(data_json)
+            if self.cache:
+                self.cache.update(id_value, response.headers, titles)
+            return titles
+
+        titles = self._with_retry(
+            id_value, attempt, max_retries, min_retry_wait, max_retry_wait
+        )
+        return titles, id_value, alias
+
+    @staticmethod
+    def _parse_items(data: Dict) -> Dict:
+        """解析 API 响应为 {标题: {ranks, url, mobileUrl}} 字典"""
+        titles = {}
+
+        for index, item in enumerate(data.get("items", []), 1):
+            title = item.get("title")
+            # 跳过无效标题（None、float、空字符串）
+            if title is None or isinstance(title, float) or not str(title).strip():
+                continue
+            title = str(title).strip()
+            url = item.get("url", "")
+            mobile_url = item.get("mobileUrl", "")
+
+            if title in titles:
+                titles[title]["ranks"].append(index)
+            else:
+                titles[title] = {
+                    "ranks": [index],
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                }
+
+        return titles
 
     def crawl_websites(
         self,
         ids_list: List[Union[str, Tuple[str, str]]],
         request_interval: int = 100,
+        max_workers: int = 1,
     ) -> Tuple[Dict, Dict, List]:
         """
         爬取多个网站数据
 
+        max_workers <= 1 时逐个抓取，并在请求之间休眠 request_interval；
+        max_workers > 1 时使用有界线程池并发抓取，request_interval 转为
+        同一主机相邻请求的最小间隔（含重试请求），慢平台或重试等待不再
+        阻塞其他平台。两种模式下结果顺序均与 ids_list 一致。
+
+        设置了熔断器时，熔断中的平台直接跳过（记录在 breaker_skipped，
+        不计入失败列表），冷却结束的平台只探测一次、不重试。
+
         Args:
             ids_list: 平台ID列表，每个元素可以是字符串或 (平台ID, 别名) 元组
             request_interval: 请求间隔（毫秒）
+            max_workers: 最大并发数
 
         Returns:
             (结果字典, ID到名称的映射, 失败ID列表) 元组
         """
-        results = {}
+        self.breaker_skipped = []
+        if self.breaker:
+            allowed, self.breaker_skipped = self.breaker.partition(
+                self._split_id_info(id_info)[0] for id_info in ids_list
+            )
+            allowed_set = set(allowed)
+            ids_list = [
+                id_info for id_info in ids_list
+                if self._split_id_info(id_info)[0] in allowed_set
+            ]
+
         id_to_name = {}
-        failed_ids = []
+        for id_info in ids_list:
+            id_value, name = self._split_id_info(id_info)
+            id_to_name[id_value] = name
 
-        for i, id_info in enumerate(ids_list):
-            if isinstance(id_info, tuple):
-                id_value, name = id_info
-            else:
-                id_value = id_info
-                name = id_value
+        if max_workers > 1 and len(ids_list) > 1:
+            responses = self._fetch_concurrently(ids_list, request_interval, max_workers)
+        else:
+            responses = self._fetch_sequentially(ids_list, request_interval)
 
-            id_to_name[id_value] = name
-            response, _, _ = self.fetch_data(id_info)
-
-            if response:
-                try:
-                    data = json.loads(response)
-                    results[id_value] = {}
-
-                    for index, item in enumerate(data.get("items", []), 1):
-                        title = item.get("title")
-                        # 跳过无效标题（None、float、空字符串）
-                        if title is None or isinstance(title, float) or not str(title).strip():
-                            continue
-                        title = str(title).strip()
-                        url = item.get("url", "")
-                        mobile_url = item.get("mobileUrl", "")
-
-                        if title in results[id_value]:
-                            results[id_value][title]["ranks"].append(index)
-                        else:
-                            results[id_value][title] = {
-                                "ranks": [index],
-                                "url": url,
-                                "mobileUrl": mobile_url,
-                            }
-                except json.JSONDecodeError:
-                    print(f"解析 {id_value} 响应失败")
-                    failed_ids.append(id_value)
-                except Exception as e:
-                    print(f"处理 {id_value} 数据出错: {e}")
-                    failed_ids.append(id_value)
-            else:
+        # 按 ids_list 顺序汇总，保证结果确定
+        results = {}
+        failed_ids = []
+        for id_value, titles in responses:
+            if titles is None:
                 failed_ids.append(id_value)
+            else:
+                results[id_value] = titles
+
+        if self.cache:
+            self.cache.save()
+
+        print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
+        return results, id_to_name, failed_ids
+
+    def _fetch_one(self, id_info: Union[str, Tuple[str, str]]) -> Tuple[Optional[Dict], str, str]:
+        """抓取单个平台（熔断探测时不重试）"""
+        id_value, _ = self._split_id_info(id_info)
+        if self.breaker and self.breaker.state(id_value) == CircuitBreaker.HALF_OPEN:
+            return self.fetch_titles(id_info, max_retries=0)
+        return self.fetch_titles(id_info)
+
+    def _fetch_sequentially(
+        self,
+        ids_list: List[Union[str, Tuple[str, str]]],
+        request_interval: int,
+    ) -> List[Tuple[str, Optional[Dict]]]:
+        """逐个抓取，返回 [(平台ID, 标题字典)] 列表"""
+        responses = []
+        for i, id_info in enumerate(ids_list):
+            titles, id_value, _ = self._fetch_one(id_info)
+            responses.append((id_value, titles))
 
             # 请求间隔（除了最后一个）
             if i < len(ids_list) - 1:
@@ -180,5 +343,23 @@ class DataFetcher:
                 actual_interval = max(50, actual_interval)
                 time.sleep(actual_interval / 1000)
 
-        print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
-        return results, id_to_name, failed_ids
+        return responses
+
+    def _fetch_concurrently(
+        self,
+        ids_list: List[Union[str, Tuple[str, str]]],
+        request_interval: int,
+        max_workers: int,
+    ) -> List[Tuple[str, Optional[Dict]]]:
+        """并发抓取，返回与 ids_list 同序的 [(平台ID, 标题字典)] 列表"""
+        workers = min(max_workers, len(ids_list), self.POOL_MAXSIZE)
+        print(f"并发抓取 {len(ids_list)} 个平台（并发数 {workers}，同主机间隔 {request_interval} 毫秒）")
+
+        self._rate_limiter = HostRateLimiter(request_interval, jitter_ms=20)
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="crawler") as executor:
+                fetched = list(executor.map(self._fetch_one, ids_list))
+        finally:
+            self._rate_limiter = None
+
+        return [(id_value, titles) for titles, id_value, _ in fetched]
@@ -0,0 +1,110 @@
+# coding=utf-8
+"""
+HTTP 验证器缓存模块
+
+在磁盘上保存每个数据源的 ETag / Last-Modified 及上次解析结果，
+用于发送条件请求：服务端返回 304 时直接复用缓存的解析结果，
+无需重新下载和解析响应体。
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class ValidatorCache:
+    """HTTP 验证器缓存（JSON 文件，线程安全）"""
+
+    def __init__(self, cache_path: str):
+        """
+        初始化缓存
+
+        Args:
+            cache_path: 缓存文件路径，不存在时自动创建
+        """
+        self.cache_path = Path(cache_path)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """从磁盘加载缓存，文件损坏时视为空缓存"""
+        if not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError) as e:
+            print(f"[HTTP缓存] 读取缓存失败，将重新建立: {e}")
+            return {}
+
+    def conditional_headers(self, key: str) -> Dict[str, str]:
+        """
+        获取条件请求头
+
+        仅当缓存中存在可复用的解析结果时才返回验证器，
+        避免服务端返回 304 后无数据可用。
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if not entry or entry.get("payload") is None:
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def get_payload(self, key: str) -> Optional[Any]:
+        """获取缓存的解析结果"""
+        with self._lock:
+            entry = self._entries.get(key)
+        return entry.get("payload") if entry else None
+
+    def update(self, key: str, headers: Any, payload: Any) -> None:
+        """
+        根据响应头更新缓存
+
+        响应没有任何验证器时删除旧条目，防止用过期的验证器发起条件请求。
+
+        Args:
+            key: 数据源标识
+            headers: 响应头（大小写不敏感的映射）
+            payload: 解析结果（需可 JSON 序列化）
+        """
+        etag = headers.get("ETag", "")
+        last_modified = headers.get("Last-Modified", "")
+
+        with self._lock:
+            if not etag and not last_modified:
+                if self._entries.pop(key, None) is not None:
+                    self._dirty = True
+                return
+            self._entries[key] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "payload": payload,
+            }
+            self._dirty = True
+
+    def save(self) -> None:
+        """写回磁盘（先写临时文件再替换，避免中断时损坏缓存）"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(self._entries, ensure_ascii=False)
+            self._dirty = False
+
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(self.cache_path.suffix + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"[HTTP缓存] 保存缓存失败: {e}")
@@ -5,15 +5,20 @@ RSS 抓取器
 负责从配置的 RSS 源抓取数据并转换为标准格式
 """
 
+import hashlib
 import time
 import random
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple, Callable
+from typing import Any, Iterable, List, Dict, Optional, Tuple, Callable
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .parser import RSSParser, ParsedRSSItem
+from trendradar.crawler.breaker import CircuitBreaker
+from trendradar.crawler.throttle import HostRateLimiter
 from trendradar.storage.base import RSSItem, RSSData
 from trendradar.utils.time import get_configured_time, is_within_days, DEFAULT_TIMEZONE
 
@@ -32,6 +37,9 @@ class RSSFeedConfig:
 class RSSFetcher:
     """RSS 抓取器"""
 
+    # 熔断探测请求的超时上限（秒），避免失效源每次都耗尽完整超时
+    PROBE_TIMEOUT = 5
+
     def __init__(
         self,
         feeds: List[RSSFeedConfig],
@@ -42,6 +50,10 @@ class RSSFetcher:
         timezone: str = DEFAULT_TIMEZONE,
         freshness_enabled: bool = True,
         default_max_age_days: int = 3,
+        max_workers: int = 1,
+        feed_cache: Optional[Dict[str, Dict[str, Any]]] = None,
+        deferred_ids: Optional[Iterable[str]] = None,
+        breaker: Optional[CircuitBreaker] = None,
     ):
         """
         初始化抓取器
@@ -55,6 +67,12 @@ class RSSFetcher:
             timezone: 时区配置（如 'Asia/Shanghai'）
             freshness_enabled: 是否启用新鲜度过滤
             default_max_age_days: 默认最大文章年龄（天）
+            max_workers: 最大并发数（1=逐个抓取；>1 时并发抓取，
+                request_interval 作为同一域名相邻请求的最小间隔）
+            feed_cache: HTTP 缓存 {feed_id: {feed_url, etag, last_modified, content_hash, items}}
+                （可选，通常由存储后端 get_rss_feed_cache 提供；None 表示不使用缓存）
+            deferred_ids: 本次无需请求的源 ID（自适应调度未到期），有缓存时直接复用缓存结果
+            breaker: 熔断器（可选），熔断中的源直接跳过，冷却结束的源以较短超时探测
         """
         self.feeds = [f for f in feeds if f.enabled]
         self.request_interval = request_interval
@@ -64,13 +82,28 @@ class RSSFetcher:
         self.timezone = timezone
         self.freshness_enabled = freshness_enabled
         self.default_max_age_days = default_max_age_days
+        self.max_workers = max(1, max_workers)
+        self.feed_cache = feed_cache
+        self.deferred_ids = set(deferred_ids or ())
+        self.breaker = breaker
+        # 最近一次 fetch_all 中因熔断跳过的源 ID
+        self.breaker_skipped: List[str] = []
+        # 本次抓取中发生变化的缓存条目，由调用方写回存储
+        self.updated_feed_cache: Dict[str, Dict[str, Any]] = {}
+        # 本次因未到期而沿用缓存结果（未发请求）的源 ID
+        self.deferred_served: set = set()
 
         self.parser = RSSParser()
         self.session = self._create_session()
+        # 并发模式下由 fetch_all 设置，用于按域名限速
+        self._rate_limiter: Optional[HostRateLimiter] = None
 
     def _create_session(self) -> requests.Session:
         """创建请求会话"""
         session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max(10, self.max_workers))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
         session.headers.update({
             "User-Agent": "TrendRadar/2.0 RSS Reader (https://github.com/trendradar)",
             "Accept": "application/feed+json, application/json, application/rss+xml, application/atom+xml, application/xml, text/xml, */*",
@@ -138,10 +171,7 @@ class RSSFetcher:
             (条目列表, 错误信息) 元组
         """
         try:
-            response = self.session.get(feed.url, timeout=self.timeout)
-            response.raise_for_status()
-
-            parsed_items = self.parser.parse(response.text, feed.url)
+            parsed_items = self._fetch_parsed_items(feed)
 
             # 限制条目数量（0=不限制）
             if feed.max_items > 0:
@@ -193,6 +223,81 @@ class RSSFetcher:
             print(f"[RSS] {feed.name}: {error}")
             return [], error
 
+    def _get_cache_entry(self, feed: RSSFeedConfig) -> Optional[Dict[str, Any]]:
+        """获取源的缓存条目（URL 变化时视为无缓存）"""
+        if self.feed_cache is None:
+            return None
+        entry = self.feed_cache.get(feed.id)
+        if not entry or entry.get("feed_url") != feed.url:
+            return None
+        return entry
+
+    def _is_deferred(self, feed: RSSFeedConfig) -> bool:
+        """源是否未到抓取时间且有缓存可复用"""
+        return feed.id in self.deferred_ids and self._get_cache_entry(feed) is not None
+
+    def _fetch_parsed_items(self, feed: RSSFeedConfig) -> List[ParsedRSSItem]:
+        """
+        下载并解析单个源，支持条件请求
+
+        未到抓取时间（deferred_ids）且有缓存的源直接返回缓存结果，不发请求。
+        启用缓存时携带 If-None-Match / If-Modified-Since 请求头：
+        - 返回 304，或响应体哈希与上次相同 → 直接复用缓存的解析结果，跳过解析
+        - 否则正常解析，并记录新的缓存条目到 updated_feed_cache
+        """
+        entry = self._get_cache_entry(feed)
+
+        if entry and feed.id in self.deferred_ids:
+            print(f"[RSS] {feed.name}: 未到抓取时间，沿用上次结果")
+            self.deferred_served.add(feed.id)
+            return [ParsedRSSItem(**item) for item in entry["items"]]
+
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        timeout = self.timeout
+        if self.breaker and self.breaker.state(feed.id) == CircuitBreaker.HALF_OPEN:
+            timeout = min(self.timeout, self.PROBE_TIMEOUT)
+
+        if self._rate_limiter:
+            self._rate_limiter.acquire(feed.url)
+        response = self.session.get(feed.url, headers=headers or None, timeout=timeout)
+
+        if response.status_code == 304 and entry:
+            print(f"[RSS] {feed.name}: 未变化（304），复用缓存")
+            return [ParsedRSSItem(**item) for item in entry["items"]]
+
+        response.raise_for_status()
+
+        if self.feed_cache is None:
+            return self.parser.parse(response.text, feed.url)
+
+        content_hash = hashlib.sha1(response.content).hexdigest()
+        etag = response.headers.get("ETag", "")
+        last_modified = response.headers.get("Last-Modified", "")
+
+        if entry and entry.get("content_hash") == content_hash:
+            print(f"[RSS] {feed.name}: 内容未变化，复用缓存")
+            parsed_items = [ParsedRSSItem(**item) for item in entry["items"]]
+            # 内容相同但验证器变化时更新验证器，下次可直接命中 304
+            if etag != entry.get("etag", "") or last_modified != entry.get("last_modified", ""):
+                self.updated_feed_cache[feed.id] = dict(entry, etag=etag, last_modified=last_modified)
+            return parsed_items
+
+        parsed_items = self.parser.parse(response.text, feed.url)
+        self.updated_feed_cache[feed.id] = {
+            "feed_url": feed.url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_hash": content_hash,
+            "items": [asdict(item) for item in parsed_items],
+        }
+        return parsed_items
+
     def fetch_all(self) -> RSSData:
         """
         抓取所有 RSS 源
@@ -209,17 +314,22 @@ class RSSFetcher:
         crawl_time = now.strftime("%H:%M")
         crawl_date = now.strftime("%Y-%m-%d")
 
-        print(f"[RSS] 开始抓取 {len(self.feeds)} 个 RSS 源...")
+        feeds = self.feeds
+        self.breaker_skipped = []
+        if self.breaker:
+            allowed, self.breaker_skipped = self.breaker.partition(feed.id for feed in feeds)
+            allowed_set = set(allowed)
+            feeds = [feed for feed in feeds if feed.id in allowed_set]
 
-        for i, feed in enumerate(self.feeds):
-            # 请求间隔（带随机波动）
-            if i > 0:
-                interval = self.request_interval / 1000
-                jitter = random.uniform(-0.2, 0.2) * interval
-                time.sleep(interval + jitter)
+        print(f"[RSS] 开始抓取 {len(feeds)} 个 RSS 源...")
 
-            items, error = self.fetch_feed(feed)
+        if self.max_workers > 1 and len(feeds) > 1:
+            fetched = self._fetch_concurrently(feeds)
+        else:
+            fetched = self._fetch_sequentially(feeds)
 
+        # 按配置顺序汇总，保证结果确定
+        for feed, (items, error) in zip(feeds, fetched):
             id_to_name[feed.id] = feed.name
 
             if error:
@@ -238,6 +348,41 @@ class RSSFetcher:
             failed_ids=failed_ids,
         )
 
+    def _fetch_sequentially(self, feeds: List[RSSFeedConfig]) -> List[Tuple[List[RSSItem], Optional[str]]]:
+        """逐个抓取，实际发出的请求之间按 request_interval 休眠"""
+        fetched = []
+        requested = False
+        for feed in feeds:
+            deferred = self._is_deferred(feed)
+
+            # 请求间隔（带随机波动）
+            if requested and not deferred:
+                interval = self.request_interval / 1000
+                jitter = random.uniform(-0.2, 0.2) * interval
+                time.sleep(interval + jitter)
+
+            fetched.append(self.fetch_feed(feed))
+            requested = requested or not deferred
+        return fetched
+
+    def _fetch_concurrently(self, feeds: List[RSSFeedConfig]) -> List[Tuple[List[RSSItem], Optional[str]]]:
+        """
+        并发抓取，返回与 feeds 同序的结果
+
+        每个工作线程下载完成后立即解析，解析与其他源的下载重叠进行；
+        同一域名的请求按 request_interval 排队，不同域名互不阻塞。
+        """
+        workers = min(self.max_workers, len(feeds))
+        print(f"[RSS] 并发抓取（并发数 {workers}，同域名间隔 {self.request_interval} 毫秒）")
+
+        jitter_ms = int(self.request_interval * 0.2)
+        self._rate_limiter = HostRateLimiter(self.request_interval, jitter_ms=jitter_ms)
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rss") as executor:
+                return list(executor.map(self.fetch_feed, feeds))
+        finally:
+            self._rate_limiter = None
+
     @classmethod
     def from_config(cls, config: Dict) -> "RSSFetcher":
         """
@@ -248,6 +393,7 @@ class RSSFetcher:
                 {
                     "enabled": true,
                     "request_interval": 2000,
+                    "max_workers": 4,
                     "freshness_filter": {
                         "enabled": true,
                         "max_age_days": 3
@@ -302,4 +448,6 @@ class RSSFetcher:
             timezone=config.get("timezone", DEFAULT_TIMEZONE),
             freshness_enabled=freshness_enabled,
             default_max_age_days=default_max_age_days,
+            max_workers=config.get("max_workers", 1),
+            feed_cache=config.get("feed_cache"),
         )
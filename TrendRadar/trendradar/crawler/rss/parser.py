@@ -3,22 +3,26 @@
 RSS 解析器
 
 支持 RSS 2.0、Atom 和 JSON Feed 1.1 格式的解析
+
+解析流程：先按首字符识别格式，内容只解码一次
+- JSON Feed：json.loads 一次后直接提取条目
+- 格式良好的 RSS 2.0 / Atom：流式 XML 快速路径（XMLPullParser）
+- 其他格式或格式不良的 XML：回退到 feedparser
+
+feedparser 只在回退路径中按需导入，Feed 都走快速路径时不支付其导入开销。
 """
 
 import re
 import html
+import importlib.util
 import json
+import xml.etree.ElementTree as ET
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 from email.utils import parsedate_to_datetime
 
-try:
-    import feedparser
-    HAS_FEEDPARSER = True
-except ImportError:
-    HAS_FEEDPARSER = False
-    feedparser = None
+HAS_FEEDPARSER = importlib.util.find_spec("feedparser") is not None
 
 
 @dataclass
@@ -58,11 +62,23 @@ class RSSParser:
         Returns:
             解析后的条目列表
         """
-        # 先尝试检测 JSON Feed
-        if self._is_json_feed(content):
-            return self._parse_json_feed(content, feed_url)
+        text = content.lstrip("\ufeff \t\r\n")
+
+        if text.startswith("{"):
+            data = self._load_json_feed(text)
+            if data is not None:
+                return self._parse_json_feed(data)
+        elif text.startswith("<"):
+            items = self._parse_xml_fast(text)
+            if items is not None:
+                return items
+
+        return self._parse_with_feedparser(content, feed_url)
+
+    def _parse_with_feedparser(self, content: str, feed_url: str = "") -> List[ParsedRSSItem]:
+        """使用 feedparser 解析（兼容 RSS 1.0 及格式不良的 Feed）"""
+        import feedparser
 
-        # 使用 feedparser 解析 RSS/Atom
         feed = feedparser.parse(content)
 
         if feed.bozo and not feed.entries:
@@ -76,47 +92,44 @@ class RSSParser:
 
         return items
 
-    def _is_json_feed(self, content: str) -> bool:
+    def _load_json_feed(self, content: str) -> Optional[Dict[str, Any]]:
         """
-        检测内容是否为 JSON Feed 格式
+        解码并识别 JSON Feed，不是 JSON Feed 时返回 None
 
         JSON Feed 必须包含 version 字段，值为 https://jsonfeed.org/version/1 或 1.1
         """
-        content = content.strip()
-        if not content.startswith("{"):
-            return False
-
         try:
             data = json.loads(content)
-            version = data.get("version", "")
-            return "jsonfeed.org" in version
         except (json.JSONDecodeError, TypeError):
-            return False
+            return None
+
+        if not isinstance(data, dict):
+            return None
+        version = data.get("version", "")
+        if not isinstance(version, str) or "jsonfeed.org" not in version:
+            return None
+        return data
 
-    def _parse_json_feed(self, content: str, feed_url: str = "") -> List[ParsedRSSItem]:
+    def _parse_json_feed(self, data: Dict[str, Any]) -> List[ParsedRSSItem]:
         """
         解析 JSON Feed 1.1 格式
 
         JSON Feed 规范: https://www.jsonfeed.org/version/1.1/
 
         Args:
-            content: JSON Feed 内容
-            feed_url: Feed URL（用于错误提示）
+            data: 已解码的 JSON Feed 对象
 
         Returns:
             解析后的条目列表
         """
-        try:
-            data = json.loads(content)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"JSON Feed 解析失败 ({feed_url}): {e}")
-
         items_data = data.get("items", [])
         if not items_data:
             return []
 
         items = []
         for item_data in items_data:
+            if not isinstance(item_data, dict):
+                continue
             item = self._parse_json_feed_item(item_data)
             if item:
                 items.append(item)
@@ -193,6 +206,189 @@ class RSSParser:
 
         return None
 
+    # ========================================
+    # 流式 XML 快速路径（RSS 2.0 / Atom）
+    # ========================================
+
+    ATOM_NS = "{http://www.w3.org/2005/Atom}"
+    CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+    DC_NS = "{http://purl.org/dc/elements/1.1/}"
+
+    # 每次喂给解析器的字符数
+    XML_CHUNK_SIZE = 64 * 1024
+
+    def _parse_xml_fast(self, content: str) -> Optional[List[ParsedRSSItem]]:
+        """
+        流式解析格式良好的 RSS 2.0 / Atom
+
+        逐块喂入 XMLPullParser，每个条目解析完成后立即释放其子元素。
+        根元素不是 <rss> / Atom <feed>，或 XML 格式不良时返回 None，
+        由调用方回退到 feedparser。
+        """
+        parser = ET.XMLPullParser(events=("start", "end"))
+        item_tag = None
+        items: List[ParsedRSSItem] = []
+
+        try:
+            for offset in range(0, len(content), self.XML_CHUNK_SIZE):
+                parser.feed(content[offset:offset + self.XML_CHUNK_SIZE])
+
+                for event, elem in parser.read_events():
+                    if item_tag is None:
+                        # 第一个事件是根元素的 start，据此识别格式
+                        if elem.tag == "rss":
+                            item_tag = "item"
+                        elif elem.tag == self.ATOM_NS + "feed":
+                            item_tag = self.ATOM_NS + "entry"
+                        else:
+                            return None
+                        continue
+
+                    if event == "end" and elem.tag == item_tag:
+                        if item_tag == "item":
+                            item = self._parse_rss_element(elem)
+                        else:
+                            item = self._parse_atom_element(elem)
+                        if item:
+                            items.append(item)
+                        elem.clear()
+
+            parser.close()
+        except ET.ParseError:
+            return None
+
+        if item_tag is None:
+            return None
+        return items
+
+    @staticmethod
+    def _element_text(elem: Optional[ET.Element]) -> str:
+        """获取元素的全部文本（含子元素），元素不存在时返回空字符串"""
+        if elem is None:
+            return ""
+        return "".join(elem.itertext())
+
+    @staticmethod
+    def _first(fields: Dict[str, ET.Element], *tags: str) -> Optional[ET.Element]:
+        """按顺序返回第一个存在的子元素（Element 的真值取决于子元素数量，不能用 or）"""
+        for tag in tags:
+            elem = fields.get(tag)
+            if elem is not None:
+                return elem
+        return None
+
+    def _parse_rss_element(self, elem: ET.Element) -> Optional[ParsedRSSItem]:
+        """解析 RSS 2.0 <item> 元素"""
+        fields: Dict[str, ET.Element] = {}
+        for child in elem:
+            fields.setdefault(child.tag, child)
+
+        title = self._clean_text(self._element_text(fields.get("title")))
+        if not title:
+            return None
+
+        url = self._element_text(fields.get("link")).strip()
+        guid_elem = fields.get("guid")
+        guid = self._element_text(guid_elem).strip()
+        # 与 feedparser 一致：无 link 时使用永久链接形式的 guid
+        if not url and guid and guid_elem.get("isPermaLink", "true") != "false":
+            url = guid
+
+        date_str = self._element_text(self._first(fields, "pubDate", self.DC_NS + "date"))
+        summary = self._element_text(self._first(fields, "description", self.CONTENT_ENCODED))
+        author = self._element_text(self._first(fields, "author", self.DC_NS + "creator"))
+
+        return ParsedRSSItem(
+            title=title,
+            url=url,
+            published_at=self._normalize_date(date_str),
+            summary=self._truncate_summary(summary),
+            author=self._clean_text(author) or None,
+            guid=guid or url,
+        )
+
+    def _parse_atom_element(self, elem: ET.Element) -> Optional[ParsedRSSItem]:
+        """解析 Atom <entry> 元素"""
+        ns = self.ATOM_NS
+        fields: Dict[str, ET.Element] = {}
+        links: List[ET.Element] = []
+        for child in elem:
+            if child.tag == ns + "link":
+                links.append(child)
+            else:
+                fields.setdefault(child.tag, child)
+
+        title = self._clean_text(self._element_text(fields.get(ns + "title")))
+        if not title:
+            return None
+
+        # 优先 rel="alternate"（缺省即 alternate），否则取第一个链接
+        url = ""
+        for link in links:
+            if link.get("rel", "alternate") == "alternate" and link.get("href"):
+                url = link.get("href")
+                break
+        if not url and links:
+            url = links[0].get("href", "")
+
+        date_str = self._element_text(self._first(fields, ns + "published", ns + "updated"))
+        summary = self._element_text(self._first(fields, ns + "summary", ns + "content"))
+
+        author = None
+        author_elem = fields.get(ns + "author")
+        if author_elem is not None:
+            author = self._clean_text(self._element_text(author_elem.find(ns + "name"))) or None
+
+        guid = self._element_text(fields.get(ns + "id")).strip()
+
+        return ParsedRSSItem(
+            title=title,
+            url=url,
+            published_at=self._normalize_date(date_str),
+            summary=self._truncate_summary(summary),
+            author=author,
+            guid=guid or url,
+        )
+
+    def _normalize_date(self, date_str: str) -> Optional[str]:
+        """
+        解析 RFC 822 / ISO 8601 日期
+
+        与 feedparser 路径保持一致：统一转换为不带时区的 UTC 时间，精确到秒。
+        标准库无法解析的格式（如 Python 3.10 的 fromisoformat 不支持的 RFC 3339 写法）
+        交给 feedparser 的日期解析。
+        """
+        date_str = date_str.strip()
+        if not date_str:
+            return None
+
+        dt = None
+        try:
+            dt = parsedate_to_datetime(date_str)
+        except (ValueError, TypeError, IndexError):
+            try:
+                dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+            except (ValueError, TypeError):
+                from feedparser.datetimes import _parse_date
+
+                date_struct = _parse_date(date_str)
+                if not date_struct:
+                    return None
+                dt = datetime(*date_struct[:6])
+
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+        return dt.replace(microsecond=0).isoformat()
+
+    def _truncate_summary(self, summary: str) -> Optional[str]:
+        """清理并截断摘要"""
+        summary = self._clean_text(summary)
+        if not summary:
+            return None
+        if len(summary) > self.max_summary_length:
+            summary = summary[:self.max_summary_length] + "..."
+        return summary
+
     def parse_url(self, url: str, timeout: int = 10) -> List[ParsedRSSItem]:
         """
         从 URL 解析 RSS
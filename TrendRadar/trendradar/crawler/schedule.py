@@ -0,0 +1,204 @@
+# coding=utf-8
+"""
+自适应抓取调度模块
+
+根据每个数据源（热榜平台 / RSS 源）的历史表现决定本次运行是否需要抓取：
+- 更新率（两次抓取之间新出现条目的占比）高的源缩短抓取间隔
+- 更新率低的源拉长抓取间隔
+- 连续失败的源按指数退避
+
+调度状态按源保存在当日数据库的 crawl_schedule 表中，
+每天第一次运行时所有源都会被抓取，作为当日的基准。
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+@dataclass
+class SourceState:
+    """单个数据源的调度状态"""
+    source_id: str
+    interval: float = 0.0           # 当前抓取间隔（分钟）
+    churn: Optional[float] = None   # 平滑后的更新率（0~1），None 表示尚无观测
+    failures: int = 0               # 连续失败次数
+    last_crawl_at: str = ""         # 上次实际抓取时间（TIME_FORMAT）
+
+    @classmethod
+    def from_dict(cls, source_id: str, data: Dict[str, Any]) -> "SourceState":
+        return cls(
+            source_id=source_id,
+            interval=float(data.get("interval") or 0.0),
+            churn=data.get("churn"),
+            failures=int(data.get("failures") or 0),
+            last_crawl_at=data.get("last_crawl_at") or "",
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "interval": self.interval,
+            "churn": self.churn,
+            "failures": self.failures,
+            "last_crawl_at": self.last_crawl_at,
+        }
+
+
+class AdaptiveScheduler:
+    """自适应抓取调度器"""
+
+    TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+    # 已过时间达到间隔的该比例即视为到期（吸收定时任务的启动抖动）
+    DUE_TOLERANCE = 0.9
+
+    def __init__(
+        self,
+        min_interval: float = 0,
+        max_interval: float = 120,
+        failure_backoff: float = 30,
+        high_churn: float = 0.3,
+        low_churn: float = 0.05,
+        smoothing: float = 0.5,
+    ):
+        """
+        初始化调度器
+
+        Args:
+            min_interval: 最小抓取间隔（分钟），0 表示更新快的源每次运行都抓取
+            max_interval: 最大抓取间隔（分钟），同时也是失败退避的上限
+            failure_backoff: 连续失败时的退避基数（分钟），按 2 的幂次递增
+            high_churn: 更新率不低于该值时间隔减半
+            low_churn: 更新率不高于该值时间隔加倍
+            smoothing: 更新率的指数平滑系数（越大越看重最近一次）
+        """
+        self.min_interval = max(0.0, float(min_interval))
+        self.max_interval = max(self.min_interval, float(max_interval))
+        self.failure_backoff = max(0.0, float(failure_backoff))
+        self.high_churn = high_churn
+        self.low_churn = low_churn
+        self.smoothing = smoothing
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "AdaptiveScheduler":
+        """从 ADAPTIVE_SCHEDULE 配置创建调度器"""
+        return cls(
+            min_interval=config.get("MIN_INTERVAL", 0),
+            max_interval=config.get("MAX_INTERVAL", 120),
+            failure_backoff=config.get("FAILURE_BACKOFF", 30),
+            high_churn=config.get("HIGH_CHURN", 0.3),
+            low_churn=config.get("LOW_CHURN", 0.05),
+            smoothing=config.get("SMOOTHING", 0.5),
+        )
+
+    @staticmethod
+    def load_states(raw: Dict[str, Dict[str, Any]]) -> Dict[str, SourceState]:
+        """将存储后端返回的字典转换为 SourceState"""
+        return {source_id: SourceState.from_dict(source_id, data) for source_id, data in raw.items()}
+
+    @staticmethod
+    def dump_states(states: Dict[str, SourceState]) -> Dict[str, Dict[str, Any]]:
+        """将 SourceState 转换为可写入存储后端的字典"""
+        return {source_id: state.to_dict() for source_id, state in states.items()}
+
+    def _elapsed_minutes(self, state: SourceState, now: datetime) -> Optional[float]:
+        """距上次实际抓取的分钟数，无记录或时间异常时返回 None"""
+        if not state.last_crawl_at:
+            return None
+        try:
+            last = datetime.strptime(state.last_crawl_at, self.TIME_FORMAT)
+        except ValueError:
+            return None
+        elapsed = (now.replace(tzinfo=None) - last).total_seconds() / 60
+        return elapsed if elapsed >= 0 else None
+
+    def plan(
+        self,
+        source_ids: Iterable[str],
+        states: Dict[str, SourceState],
+        now: datetime,
+    ) -> Tuple[List[str], List[str], List[str]]:
+        """
+        计算本次运行的抓取计划
+
+        Args:
+            source_ids: 配置的数据源 ID（按配置顺序）
+            states: 调度状态
+            now: 当前时间（配置时区）
+
+        Returns:
+            (需要抓取, 未到期可复用上次结果, 失败退避中) 三个 ID 列表
+        """
+        due, deferred, backing_off = [], [], []
+        for source_id in source_ids:
+            state = states.get(source_id)
+            elapsed = self._elapsed_minutes(state, now) if state else None
+
+            if elapsed is None or elapsed >= state.interval * self.DUE_TOLERANCE:
+                due.append(source_id)
+            elif state.failures > 0:
+                backing_off.append(source_id)
+            else:
+                deferred.append(source_id)
+
+        return due, deferred, backing_off
+
+    def record(
+        self,
+        states: Dict[str, SourceState],
+        source_id: str,
+        now: datetime,
+        success: bool,
+        current_keys: Optional[Set[str]] = None,
+        previous_keys: Optional[Set[str]] = None,
+    ) -> SourceState:
+        """
+        根据一次实际抓取的结果更新调度状态
+
+        Args:
+            states: 调度状态（原地更新）
+            source_id: 数据源 ID
+            now: 抓取时间（配置时区）
+            success: 是否抓取成功
+            current_keys: 本次抓取到的条目标识（标题或 URL）
+            previous_keys: 上次抓取到的条目标识
+
+        Returns:
+            更新后的状态
+        """
+        state = states.get(source_id) or SourceState(source_id=source_id)
+        elapsed = self._elapsed_minutes(state, now)
+
+        if not success:
+            state.failures += 1
+            if state.failures == 1:
+                # 首次失败：下次运行立即重试
+                state.interval = self.min_interval
+            else:
+                backoff = self.failure_backoff * (2 ** (state.failures - 2))
+                state.interval = min(self.max_interval, max(self.min_interval, backoff))
+        else:
+            state.failures = 0
+
+            if current_keys and previous_keys:
+                ratio = len(current_keys - previous_keys) / len(current_keys)
+                if state.churn is None:
+                    state.churn = ratio
+                else:
+                    state.churn = self.smoothing * ratio + (1 - self.smoothing) * state.churn
+
+            if elapsed is None or state.churn is None:
+                state.interval = self.min_interval
+            else:
+                # 以实际间隔为基准调整，自然适配外部定时任务的运行粒度
+                if state.churn >= self.high_churn:
+                    interval = elapsed / 2
+                elif state.churn <= self.low_churn:
+                    interval = elapsed * 2
+                else:
+                    interval = elapsed
+                state.interval = min(self.max_interval, max(self.min_interval, interval))
+
+        state.last_crawl_at = now.strftime(self.TIME_FORMAT)
+        states[source_id] = state
+        return state
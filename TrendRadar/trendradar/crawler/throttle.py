@@ -0,0 +1,66 @@
+# coding=utf-8
+"""
+请求节流模块
+
+提供按主机限速的线程安全节流器，供并发抓取时使用：
+- 同一主机的相邻请求之间保持最小间隔
+- 不同主机之间互不影响
+"""
+
+import random
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+
+class HostRateLimiter:
+    """按主机限速器（线程安全）"""
+
+    def __init__(self, min_interval_ms: int = 0, jitter_ms: int = 0):
+        """
+        初始化限速器
+
+        Args:
+            min_interval_ms: 同一主机相邻请求的最小间隔（毫秒），0 表示不限速
+            jitter_ms: 每次间隔附加的随机抖动上限（毫秒）
+        """
+        self.min_interval = max(0, min_interval_ms) / 1000
+        self.jitter = max(0, jitter_ms) / 1000
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """提取 URL 的主机名（小写，含端口）"""
+        return urlparse(url).netloc.lower()
+
+    def acquire(self, url: str) -> float:
+        """
+        为指定 URL 的主机预约一个请求时间槽，必要时阻塞等待
+
+        时间槽在锁内预约、在锁外等待，因此多个线程访问同一主机时
+        会依次排队，而访问不同主机的线程不会互相阻塞。
+
+        Args:
+            url: 即将请求的 URL
+
+        Returns:
+            实际等待的秒数
+        """
+        if self.min_interval <= 0:
+            return 0.0
+
+        host = self.host_of(url)
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            interval = self.min_interval
+            if self.jitter > 0:
+                interval += random.uniform(0, self.jitter)
+            self._next_slot[host] = slot + interval
+
+        wait = slot - now
+        if wait > 0:
+            time.sleep(wait)
+        return max(0.0, wait)
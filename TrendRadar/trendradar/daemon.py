@@ -0,0 +1,136 @@
+# coding=utf-8
+"""
+常驻守护进程模式
+
+替代每次由 supercronic 拉起新进程的运行方式：进程常驻，内部按固定间隔
+触发抓取与分析，跨周期复用：
+- 已导入的模块（无需重复支付解释器启动与导入开销）
+- HTTP 会话与连接池（keep-alive）
+- SQLite 连接
+- 已加载的频率词配置（文件未修改时不重新解析）
+
+配置文件修改后，在下一个周期开始前自动重新加载（重建分析器）；
+新配置加载失败时继续使用旧配置运行。
+单个周期出错（包括 DEBUG 模式下重新抛出的异常）只打印堆栈，不会结束进程。
+"""
+
+import os
+import signal
+import threading
+import time
+import traceback
+from datetime import timedelta
+from typing import Any, Callable, Dict, Optional
+
+from trendradar.core import load_config
+
+
+class CrawlDaemon:
+    """抓取守护进程"""
+
+    def __init__(
+        self,
+        analyzer_factory: Callable[[Dict], Any],
+        interval_minutes: int = 30,
+        config_path: Optional[str] = None,
+        run_immediately: bool = True,
+    ):
+        """
+        初始化守护进程
+
+        Args:
+            analyzer_factory: 根据配置字典创建分析器的函数（通常为 NewsAnalyzer）
+            interval_minutes: 运行间隔（分钟），按整点对齐（如 30 → 每小时的 :00 和 :30）
+            config_path: 配置文件路径，默认从环境变量 CONFIG_PATH 获取或使用 config/config.yaml
+            run_immediately: 启动后是否立即执行一次
+        """
+        self.analyzer_factory = analyzer_factory
+        self.interval = max(1, int(interval_minutes)) * 60
+        self.config_path = config_path or os.environ.get("CONFIG_PATH", "config/config.yaml")
+        self.run_immediately = run_immediately
+
+        self.analyzer = None
+        self._config_mtime: Optional[float] = None
+        self._current_date: Optional[str] = None
+        self._stop_event = threading.Event()
+
+    def stop(self, *_: Any) -> None:
+        """请求停止（当前周期执行完后退出）"""
+        if not self._stop_event.is_set():
+            print("[守护进程] 收到停止信号，当前周期结束后退出")
+        self._stop_event.set()
+
+    def _get_config_mtime(self) -> Optional[float]:
+        try:
+            return os.path.getmtime(self.config_path)
+        except OSError:
+            return None
+
+    def _reload_if_changed(self) -> None:
+        """配置文件有变化（或尚未加载）时重建分析器"""
+        mtime = self._get_config_mtime()
+        if self.analyzer is not None and mtime == self._config_mtime:
+            return
+
+        try:
+            analyzer = self.analyzer_factory(load_config(self.config_path))
+        except Exception as e:
+            if self.analyzer is None:
+                raise
+            print(f"[守护进程] 配置重新加载失败，继续使用旧配置: {e}")
+            self._config_mtime = mtime
+            return
+
+        if self.analyzer is not None:
+            print("[守护进程] 检测到配置文件变化，已重新加载")
+            self.analyzer.close()
+        self.analyzer = analyzer
+        self._config_mtime = mtime
+
+    def _run_cycle(self) -> None:
+        """执行一个周期（跨天时先释放旧日期的数据库连接并清理过期数据），出错时打印堆栈后继续"""
+        started = time.monotonic()
+        try:
+            analyzer = self.analyzer
+            today = analyzer.ctx.format_date()
+            previous_date, self._current_date = self._current_date, today
+            if previous_date and today != previous_date:
+                print(f"[守护进程] 日期切换: {previous_date} → {today}")
+                analyzer.storage_manager.cleanup_old_data()
+                analyzer.storage_manager.cleanup()
+
+            analyzer.run_cycle()
+        except Exception as e:
+            print(f"[守护进程] 本周期执行出错，等待下一周期: {e}")
+            traceback.print_exc()
+        print(f"[守护进程] 本周期耗时 {time.monotonic() - started:.1f} 秒")
+
+    def _seconds_until_next_run(self) -> float:
+        """距离下一个对齐时间点的秒数"""
+        return self.interval - (time.time() % self.interval)
+
+    def run_forever(self) -> None:
+        """启动守护进程，直到收到 SIGTERM / SIGINT"""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        self._reload_if_changed()
+        print(f"[守护进程] 已启动，运行间隔 {self.interval // 60} 分钟")
+
+        try:
+            if self.run_immediately:
+                self._run_cycle()
+
+            while not self._stop_event.is_set():
+                delay = self._seconds_until_next_run()
+                next_run = (self.analyzer.ctx.get_time() + timedelta(seconds=delay)).strftime("%H:%M:%S")
+                print(f"[守护进程] 下次运行: {next_run}")
+                if self._stop_event.wait(delay):
+                    break
+
+                self._reload_if_changed()
+                self._run_cycle()
+        finally:
+            if self.analyzer is not None:
+                self.analyzer.close()
+            print("[守护进程] 已退出")
@@ -17,37 +17,49 @@
 - dispatcher: 多账号通知调度器
 """
 
-from trendradar.notification.push_manager import PushRecordManager
-from trendradar.notification.formatters import (
-    strip_markdown,
-    convert_markdown_to_mrkdwn,
-)
-from trendradar.notification.batch import (
-    get_batch_header,
-    get_max_batch_header_size,
-    truncate_to_bytes,
-    add_batch_headers,
-)
-from trendradar.notification.renderer import (
-    render_feishu_content,
-    render_dingtalk_content,
-)
-from trendradar.notification.splitter import (
-    split_content_into_batches,
-    DEFAULT_BATCH_SIZES,
-)
-from trendradar.notification.senders import (
-    send_to_feishu,
-    send_to_dingtalk,
-    send_to_wework,
-    send_to_telegram,
-    send_to_email,
-    send_to_ntfy,
-    send_to_bark,
-    send_to_slack,
-    SMTP_CONFIGS,
-)
-from trendradar.notification.dispatcher import NotificationDispatcher
+import importlib
+from typing import Any
+
+# 导出名称 → 所在子模块。子模块（尤其是 senders 依赖的 smtplib / email 等）在首次访问时才导入，
+# 未启用通知的运行不支付这部分启动开销
+_EXPORTS = {
+    "PushRecordManager": "push_manager",
+    "strip_markdown": "formatters",
+    "convert_markdown_to_mrkdwn": "formatters",
+    "get_batch_header": "batch",
+    "get_max_batch_header_size": "batch",
+    "truncate_to_bytes": "batch",
+    "add_batch_headers": "batch",
+    "render_feishu_content": "renderer",
+    "render_dingtalk_content": "renderer",
+    "split_content_into_batches": "splitter",
+    "DEFAULT_BATCH_SIZES": "splitter",
+    "send_to_feishu": "senders",
+    "send_to_dingtalk": "senders",
+    "send_to_wework": "senders",
+    "send_to_telegram": "senders",
+    "send_to_email": "senders",
+    "send_to_ntfy": "senders",
+    "send_to_bark": "senders",
+    "send_to_slack": "senders",
+    "SMTP_CONFIGS": "senders",
+    "NotificationDispatcher": "dispatcher",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """按需导入子模块并返回导出对象"""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     # 推送记录管理
@@ -8,6 +8,8 @@
 - auto: 根据环境自动选择（GitHub Actions 用 remote，其他用 local）
 """
 
+import importlib.util
+
 from trendradar.storage.base import (
     StorageBackend,
     NewsItem,
@@ -21,13 +23,19 @@ from trendradar.storage.sqlite_mixin import SQLiteStorageMixin
 from trendradar.storage.local import LocalStorageBackend
 from trendradar.storage.manager import StorageManager, get_storage_manager
 
-# 远程后端可选导入（需要 boto3）
-try:
-    from trendradar.storage.remote import RemoteStorageBackend
-    HAS_REMOTE = True
-except ImportError:
-    RemoteStorageBackend = None
-    HAS_REMOTE = False
+# 远程后端可选（需要 boto3）
+# boto3 导入耗时较长，仅检测是否已安装，RemoteStorageBackend 在首次访问时才导入
+HAS_REMOTE = importlib.util.find_spec("boto3") is not None
+
+
+def __getattr__(name):
+    if name == "RemoteStorageBackend":
+        if not HAS_REMOTE:
+            return None
+        from trendradar.storage.remote import RemoteStorageBackend
+        return RemoteStorageBackend
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # 基础类
@@ -0,0 +1,263 @@
+# coding=utf-8
+"""
+历史数据归档
+
+超过指定天数的日期数据库压缩为归档文件，与原数据库放在同一目录：
+- output/news/2025-12-28.db → output/news/2025-12-28.db.xz
+- 远程：news/2025-12-28.db（及增量）→ news/2025-12-28.db.xz
+
+归档流程：VACUUM INTO 生成紧凑副本（去掉空闲页和碎片）→ xz 压缩 → 删除原数据库。
+归档文件解压后就是普通 SQLite 数据库，读取时按需解压到缓存目录，查询语句无需改动。
+缓存目录按最近使用时间淘汰，总大小不超过 ARCHIVE_CACHE_MAX_BYTES；
+只需读取一遍的场景（导入数据仓库）使用临时解压副本，用完即删。
+"""
+
+import lzma
+import os
+import shutil
+import sqlite3
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Tuple, Union
+
+# 归档文件后缀（完整文件名为 {date}.db.xz）
+ARCHIVE_SUFFIX = ".xz"
+
+# xz 压缩等级（更高等级对数据库文件几乎没有额外收益，压缩耗时明显增加）
+_XZ_PRESET = 6
+
+# 归档解压缓存的总大小上限（字节），超出后按最近使用时间淘汰
+ARCHIVE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+def get_archive_path(db_path: Union[str, Path]) -> Path:
+    """获取数据库对应的归档文件路径"""
+    db_path = Path(db_path)
+    return db_path.with_name(db_path.name + ARCHIVE_SUFFIX)
+
+
+def is_archive(path: Union[str, Path]) -> bool:
+    """是否为数据库归档文件（*.db.xz）"""
+    return Path(path).name.endswith(".db" + ARCHIVE_SUFFIX)
+
+
+def compress_database(db_path: Union[str, Path], archive_path: Union[str, Path]) -> int:
+    """
+    把数据库压缩为归档文件（不删除原数据库）
+
+    Args:
+        db_path: 数据库文件路径
+        archive_path: 归档文件路径
+
+    Returns:
+        归档文件大小（字节）
+    """
+    db_path = Path(db_path)
+    archive_path = Path(archive_path)
+    compact_path = archive_path.with_name(archive_path.name + ".vacuum")
+    tmp_path = archive_path.with_name(archive_path.name + ".tmp")
+
+    try:
+        if compact_path.exists():
+            compact_path.unlink()
+
+        conn = sqlite3.connect(db_path)
+        try:
+            conn.execute("VACUUM INTO ?", (str(compact_path),))
+        finally:
+            conn.close()
+
+        # 归档内的数据库使用回滚日志模式，解压后可直接只读打开，不依赖 -wal / -shm 文件
+        conn = sqlite3.connect(compact_path)
+        try:
+            conn.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            conn.close()
+
+        with open(compact_path, "rb") as src, lzma.open(tmp_path, "wb", preset=_XZ_PRESET) as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+        tmp_path.replace(archive_path)
+        return archive_path.stat().st_size
+    finally:
+        for path in (compact_path, tmp_path):
+            if path.exists():
+                path.unlink()
+
+
+def extract_archive(archive_path: Union[str, Path], target_path: Union[str, Path]) -> Path:
+    """
+    解压归档文件为数据库（先写临时文件再替换）
+
+    Args:
+        archive_path: 归档文件路径
+        target_path: 解压后的数据库路径
+
+    Returns:
+        解压后的数据库路径
+    """
+    target_path = Path(target_path)
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=target_path.name + ".", suffix=".tmp", dir=target_path.parent)
+    try:
+        with lzma.open(archive_path, "rb") as src, os.fdopen(fd, "wb") as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+        os.replace(tmp_name, target_path)
+    finally:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+    return target_path
+
+
+def archive_database(db_path: Union[str, Path]) -> Tuple[int, int]:
+    """
+    归档数据库：压缩为 .db.xz 并删除原数据库（连同 -wal / -shm 文件）
+
+    调用前需关闭该数据库的所有连接。
+
+    Returns:
+        (原数据库大小, 归档文件大小)
+    """
+    db_path = Path(db_path)
+    original_size = db_path.stat().st_size
+    archive_size = compress_database(db_path, get_archive_path(db_path))
+
+    db_path.unlink()
+    for suffix in ("-wal", "-shm"):
+        sidecar = db_path.with_name(db_path.name + suffix)
+        if sidecar.exists():
+            sidecar.unlink()
+
+    return original_size, archive_size
+
+
+def get_cached_path(db_path: Union[str, Path], cache_dir: Union[str, Path]) -> Path:
+    """获取数据库在解压缓存目录中的路径（{cache_dir}/{type}/{date}.db）"""
+    db_path = Path(db_path)
+    return Path(cache_dir) / db_path.parent.name / db_path.name
+
+
+def remove_cached_database(db_path: Union[str, Path], cache_dir: Union[str, Path]) -> bool:
+    """
+    删除数据库在解压缓存目录中的副本（归档被删除或恢复为数据库时调用）
+
+    调用前需关闭该缓存副本的所有连接。
+
+    Returns:
+        是否删除了缓存副本
+    """
+    cached_path = get_cached_path(db_path, cache_dir)
+    if not cached_path.exists():
+        return False
+    cached_path.unlink()
+    return True
+
+
+def prune_archive_cache(
+    cache_dir: Union[str, Path],
+    max_bytes: int = ARCHIVE_CACHE_MAX_BYTES,
+    keep: Optional[Path] = None,
+) -> int:
+    """
+    按最近使用时间淘汰解压缓存，直到总大小不超过 max_bytes
+
+    缓存副本的修改时间即最近使用时间（resolve_database 命中时更新），
+    正在使用的副本被删除后已打开的连接仍可继续读取（无法删除时跳过）。
+
+    Args:
+        cache_dir: 解压缓存目录
+        max_bytes: 缓存总大小上限
+        keep: 不淘汰的缓存副本（刚解压、即将读取的文件）
+
+    Returns:
+        淘汰的文件数量
+    """
+    entries = []
+    for cached_path in Path(cache_dir).glob("*/*.db"):
+        try:
+            stat = cached_path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime_ns, stat.st_size, cached_path))
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, cached_path in sorted(entries, key=lambda entry: entry[0]):
+        if total <= max_bytes:
+            break
+        if keep is not None and cached_path == keep:
+            continue
+        try:
+            cached_path.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+def resolve_database(
+    db_path: Union[str, Path],
+    cache_dir: Union[str, Path],
+    max_cache_bytes: int = ARCHIVE_CACHE_MAX_BYTES,
+) -> Optional[Path]:
+    """
+    获取可读取的数据库路径：数据库存在时直接返回，已归档时解压到缓存目录后返回
+
+    缓存按归档文件的修改时间判断是否过期，归档更新后会重新解压；
+    每次解压后按最近使用时间淘汰旧副本，缓存总大小不超过 max_cache_bytes。
+
+    Args:
+        db_path: 数据库文件路径（output/{type}/{date}.db）
+        cache_dir: 解压缓存目录（按 {cache_dir}/{type}/{date}.db 存放）
+        max_cache_bytes: 缓存总大小上限
+
+    Returns:
+        数据库路径，数据库和归档都不存在时返回 None
+    """
+    db_path = Path(db_path)
+    if db_path.exists():
+        return db_path
+
+    archive_path = get_archive_path(db_path)
+    if not archive_path.exists():
+        return None
+
+    cached_path = get_cached_path(db_path, cache_dir)
+    archive_mtime = archive_path.stat().st_mtime_ns
+    if not cached_path.exists() or cached_path.stat().st_mtime_ns < archive_mtime:
+        extract_archive(archive_path, cached_path)
+        prune_archive_cache(cache_dir, max_cache_bytes, keep=cached_path)
+    else:
+        # 记录最近使用时间（仍不早于归档时间，不影响过期判断）
+        os.utime(cached_path)
+    return cached_path
+
+
+@contextmanager
+def temporary_database(db_path: Union[str, Path]) -> Iterator[Optional[Path]]:
+    """
+    只读一遍的场景下获取数据库路径：已归档时解压为临时文件，退出时删除
+
+    临时文件与归档放在同一目录（同一磁盘），文件名不匹配 {date}.db 格式。
+    调用方需在退出前关闭或 DETACH 该数据库。
+
+    Args:
+        db_path: 数据库文件路径（output/{type}/{date}.db）
+
+    Yields:
+        数据库路径，数据库和归档都不存在时为 None
+    """
+    db_path = Path(db_path)
+    archive_path = get_archive_path(db_path)
+    if db_path.exists() or not archive_path.exists():
+        yield db_path if db_path.exists() else None
+        return
+
+    fd, tmp_name = tempfile.mkstemp(prefix=db_path.name + ".", suffix=".extract", dir=db_path.parent)
+    os.close(fd)
+    try:
+        yield extract_archive(archive_path, tmp_name)
+    finally:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
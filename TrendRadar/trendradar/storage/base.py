@@ -3,6 +3,8 @@
 存储后端抽象基类和数据模型
 
 定义统一的存储接口，所有存储后端都需要实现这些方法
+
+数据模型使用 slots，单日 / 多日数据动辄数万个条目，省去每个实例的 __dict__
 """
 
 from abc import ABC, abstractmethod
@@ -10,7 +12,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsItem:
     """新闻条目数据模型（热榜数据）"""
 
@@ -67,7 +69,7 @@ class NewsItem:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RSSItem:
     """RSS 条目数据模型"""
 
@@ -119,7 +121,7 @@ class RSSItem:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RSSData:
     """
     RSS 数据集合
@@ -173,7 +175,7 @@ class RSSData:
         return sum(len(rss_list) for rss_list in self.items.values())
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsData:
     """
     新闻数据集合
@@ -184,6 +186,7 @@ class NewsData:
     - items: 按来源ID分组的新闻条目
     - id_to_name: 来源ID到名称的映射
     - failed_ids: 失败的来源ID列表
+    - carried_ids: 本次未抓取、沿用上次结果的来源ID列表（自适应调度）
     """
 
     date: str                                   # 日期
@@ -191,6 +194,7 @@ class NewsData:
     items: Dict[str, List[NewsItem]]            # 按来源分组的新闻
     id_to_name: Dict[str, str] = field(default_factory=dict)   # ID到名称映射
     failed_ids: List[str] = field(default_factory=list)        # 失败的ID
+    carried_ids: List[str] = field(default_factory=list)       # 沿用上次结果的ID
 
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
@@ -204,6 +208,7 @@ class NewsData:
             "items": items_dict,
             "id_to_name": self.id_to_name,
             "failed_ids": self.failed_ids,
+            "carried_ids": self.carried_ids,
         }
 
     @classmethod
@@ -220,6 +225,7 @@ class NewsData:
             items=items,
             id_to_name=data.get("id_to_name", {}),
             failed_ids=data.get("failed_ids", []),
+            carried_ids=data.get("carried_ids", []),
         )
 
     def get_total_count(self) -> int:
@@ -419,6 +425,19 @@ class StorageBackend(ABC):
         """
         pass
 
+    @abstractmethod
+    def archive_old_data(self, archive_days: int) -> int:
+        """
+        把超过指定天数的日期数据库压缩归档（归档后仍可读取）
+
+        Args:
+            archive_days: 超过多少天的数据归档（0 表示不归档）
+
+        Returns:
+            归档的数据库文件数量
+        """
+        pass
+
     @property
     @abstractmethod
     def backend_name(self) -> str:
@@ -498,6 +517,7 @@ def convert_crawl_results_to_news_data(
     failed_ids: List[str],
     crawl_time: str,
     crawl_date: str,
+    carried_ids: Optional[List[str]] = None,
 ) -> NewsData:
     """
     将爬虫结果转换为 NewsData 格式
@@ -508,6 +528,7 @@ def convert_crawl_results_to_news_data(
         failed_ids: 失败的来源ID
         crawl_time: 抓取时间（HH:MM）
         crawl_date: 抓取日期（YYYY-MM-DD）
+        carried_ids: 沿用上次结果的来源ID（results 中不包含这些来源）
 
     Returns:
         NewsData 对象
@@ -554,6 +575,7 @@ def convert_crawl_results_to_news_data(
         items=items,
         id_to_name=id_to_name,
         failed_ids=failed_ids,
+        carried_ids=list(carried_ids or []),
     )
 
 
@@ -0,0 +1,231 @@
+# coding=utf-8
+"""
+SQLite 连接池
+
+按数据库文件（每个日期、每种类型一个）缓存连接，供存储后端和 MCP 服务复用：
+- 写连接：journal_mode=WAL + synchronous=NORMAL，抓取写入与读取互不阻塞
+- 只读连接：以 mode=ro URI 打开，不会创建或修改数据库文件
+- 统一设置 mmap_size / cache_size / temp_store=MEMORY
+- 连接数超过上限时移除最久未使用的连接（LRU），常驻进程跨天运行时句柄数不会持续增长
+- 通过 connection() 借出的连接计数，借出期间不会被淘汰或关闭，文件被替换时在归还后关闭
+"""
+
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Union
+
+
+class _PooledConnection:
+    """池中的一个连接"""
+
+    __slots__ = ("conn", "lock", "inode", "refs", "retired")
+
+    def __init__(self, conn: sqlite3.Connection, inode: Optional[int]):
+        self.conn = conn
+        self.lock = threading.RLock()   # 只读连接跨线程使用时串行化
+        self.inode = inode              # 打开时的文件 inode，用于发现文件被替换
+        self.refs = 0                   # 通过 connection() 借出的次数，大于 0 时不会被关闭
+        self.retired = False            # 已移出连接池，最后一次借出归还时关闭
+
+
+class SQLiteConnectionPool:
+    """SQLite 连接池（按文件路径缓存，LRU 淘汰）"""
+
+    # 内存映射读取的上限（字节）
+    MMAP_SIZE = 256 * 1024 * 1024
+
+    # 每个连接的页缓存大小（KiB）
+    CACHE_SIZE_KIB = 16 * 1024
+
+    def __init__(self, max_connections: int = 8, readonly: bool = False):
+        """
+        初始化连接池
+
+        Args:
+            max_connections: 最多保持打开的连接数
+            readonly: 是否以只读方式打开（MCP 等只读取数据的场景）
+        """
+        self.max_connections = max(1, int(max_connections))
+        self.readonly = readonly
+        self._connections: "OrderedDict[str, _PooledConnection]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, path: Union[str, Path]) -> bool:
+        return str(path) in self._connections
+
+    def __len__(self) -> int:
+        return len(self._connections)
+
+    @staticmethod
+    def _get_inode(path: str) -> Optional[int]:
+        try:
+            return os.stat(path).st_ino
+        except OSError:
+            return None
+
+    def _open(self, path: str) -> sqlite3.Connection:
+        """打开连接并设置连接参数"""
+        if self.readonly:
+            uri = f"{Path(path).resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(path)
+            # WAL：写入追加到 -wal 文件，读写互不阻塞
+            # synchronous=NORMAL：只在检查点时 fsync，WAL 模式下仍保证数据库一致性
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA mmap_size={self.MMAP_SIZE}")
+        conn.execute(f"PRAGMA cache_size=-{self.CACHE_SIZE_KIB}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    def _retire(self, key: str, close: bool = True) -> None:
+        """
+        把连接移出连接池（需持有 self._lock，不等待连接锁）
+
+        借出中的连接只做标记，最后一次归还时关闭。
+
+        Args:
+            key: 数据库路径
+            close: 是否立即关闭未借出的连接；为 False 时只移除引用，
+                   仍被 get() 调用方持有的连接在其引用释放后由 sqlite3 自动关闭
+        """
+        entry = self._connections.pop(key)
+        if entry.refs > 0:
+            entry.retired = True
+        elif close:
+            entry.conn.close()
+
+    def _evict(self, keep: str) -> None:
+        """移除超出上限的最久未使用连接（刚打开的和借出中的连接跳过）"""
+        for path in list(self._connections):
+            if len(self._connections) <= self.max_connections:
+                break
+            if path == keep or self._connections[path].refs > 0:
+                continue
+            # get() 返回的连接可能仍被调用方使用，不显式关闭
+            self._retire(path, close=False)
+
+    def _get_entry(
+        self,
+        key: str,
+        on_open: Optional[Callable[[sqlite3.Connection], None]] = None,
+    ) -> _PooledConnection:
+        """获取连接池条目，不存在时打开（需持有 self._lock）"""
+        entry = self._connections.get(key)
+        if entry is not None:
+            if not self.readonly or self._get_inode(key) == entry.inode:
+                self._connections.move_to_end(key)
+                return entry
+            # 文件已被删除或替换（如远程同步下载了新文件），重新打开
+            self._retire(key)
+
+        conn = self._open(key)
+        try:
+            if on_open is not None:
+                on_open(conn)
+        except Exception:
+            conn.close()
+            raise
+
+        entry = _PooledConnection(conn, self._get_inode(key))
+        self._connections[key] = entry
+        self._evict(keep=key)
+        return entry
+
+    def get(
+        self,
+        path: Union[str, Path],
+        on_open: Optional[Callable[[sqlite3.Connection], None]] = None,
+    ) -> sqlite3.Connection:
+        """
+        获取连接，不存在时打开
+
+        Args:
+            path: 数据库文件路径
+            on_open: 新建连接后调用（如初始化表结构），失败时连接会被关闭
+
+        Returns:
+            数据库连接
+        """
+        with self._lock:
+            return self._get_entry(str(path), on_open).conn
+
+    @contextmanager
+    def connection(
+        self,
+        path: Union[str, Path],
+        on_open: Optional[Callable[[sqlite3.Connection], None]] = None,
+    ) -> Iterator[sqlite3.Connection]:
+        """
+        借出连接并在使用期间独占（多线程读取时使用）
+
+        借出期间连接不会被淘汰或关闭，文件被替换时在归还后关闭。
+
+        Args:
+            path: 数据库文件路径
+            on_open: 新建连接后调用（如注册自定义函数），失败时连接会被关闭
+        """
+        key = str(path)
+        while True:
+            with self._lock:
+                entry = self._get_entry(key, on_open)
+                entry.refs += 1
+            try:
+                with entry.lock:
+                    # 等待期间文件被替换时改用新连接
+                    if not entry.retired:
+                        yield entry.conn
+                        return
+            finally:
+                self._release(entry)
+
+    def _release(self, entry: _PooledConnection) -> None:
+        """归还借出的连接，已移出连接池的在最后一次归还时关闭"""
+        with self._lock:
+            entry.refs -= 1
+            if entry.refs == 0 and entry.retired:
+                entry.conn.close()
+
+    def peek(self, path: Union[str, Path]) -> Optional[sqlite3.Connection]:
+        """获取已打开的连接，不存在时返回 None（不会打开新连接）"""
+        entry = self._connections.get(str(path))
+        return entry.conn if entry is not None else None
+
+    def close(self, path: Union[str, Path]) -> bool:
+        """
+        关闭指定文件的连接（借出中的连接在归还后关闭）
+
+        Returns:
+            是否关闭了连接
+        """
+        key = str(path)
+        with self._lock:
+            if key not in self._connections:
+                return False
+            self._retire(key)
+            return True
+
+    def close_all(self) -> List[str]:
+        """
+        关闭所有连接（借出中的连接在归还后关闭）
+
+        Returns:
+            已关闭的数据库路径列表（关闭失败的会打印日志并跳过）
+        """
+        closed = []
+        with self._lock:
+            for key in list(self._connections):
+                try:
+                    self._retire(key)
+                    closed.append(key)
+                except Exception as e:
+                    self._connections.pop(key, None)
+                    print(f"[存储] 关闭连接失败 {key}: {e}")
+        return closed
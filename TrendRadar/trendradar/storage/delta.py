@@ -0,0 +1,201 @@
+# coding=utf-8
+"""
+SQLite 页级增量同步
+
+远程存储的增量模式下，每次同步只上传自上次同步以来发生变化的数据库页：
+- 基础文件：{type}/{date}.db（完整数据库，压缩合并时重写）
+- 增量文件：{type}/{date}.db.delta/{序号}.bin（按序号追加）
+
+每个增量记录其基于的文件摘要（parent）与应用后的文件摘要（digest），
+读取时从基础文件开始按序号依次应用，摘要对不上的增量会被跳过，
+保证多个写入方冲突时不会拼出损坏的数据库。
+
+增量格式（整体 zlib 压缩）：
+    MAGIC | 4 字节头部长度 | JSON 头部 | 变化页的内容（按头部 pages 顺序拼接）
+"""
+
+import hashlib
+import json
+import shutil
+import struct
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+MAGIC = b"TRDELTA1"
+
+# SQLite 文件头中页大小字段的偏移（2 字节大端，值 1 表示 65536）
+_PAGE_SIZE_OFFSET = 16
+_DEFAULT_PAGE_SIZE = 4096
+
+
+class DeltaError(Exception):
+    """增量文件无法应用（格式错误或与当前文件不匹配）"""
+    pass
+
+
+@dataclass
+class SyncState:
+    """单个数据库文件的同步状态（对应远程上已有的 基础文件 + 增量）"""
+    page_digests: List[bytes] = field(default_factory=list)  # 每页摘要
+    file_digest: str = ""           # 整个文件的 SHA-256
+    next_seq: int = 1               # 下一个增量序号
+    delta_count: int = 0            # 基础文件之后的增量数量
+    delta_bytes: int = 0            # 增量累计大小（压缩后）
+    base_size: int = 0              # 基础文件大小
+    needs_compaction: bool = False  # 增量链有缺口或损坏，下次需要完整上传
+
+
+def read_page_size(path: Union[str, Path]) -> int:
+    """从 SQLite 文件头读取页大小，无法读取时返回默认值"""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(100)
+    except OSError:
+        return _DEFAULT_PAGE_SIZE
+
+    if len(header) < _PAGE_SIZE_OFFSET + 2 or not header.startswith(b"SQLite format 3\x00"):
+        return _DEFAULT_PAGE_SIZE
+
+    page_size = struct.unpack(">H", header[_PAGE_SIZE_OFFSET:_PAGE_SIZE_OFFSET + 2])[0]
+    return 65536 if page_size == 1 else (page_size or _DEFAULT_PAGE_SIZE)
+
+
+def scan_file(path: Union[str, Path], page_size: Optional[int] = None) -> Tuple[List[bytes], str]:
+    """
+    计算文件的逐页摘要和整体摘要
+
+    Returns:
+        (每页摘要列表, 文件 SHA-256)
+    """
+    page_size = page_size or read_page_size(path)
+    page_digests = []
+    file_hash = hashlib.sha256()
+
+    with open(path, "rb") as f:
+        while True:
+            page = f.read(page_size)
+            if not page:
+                break
+            file_hash.update(page)
+            page_digests.append(hashlib.blake2b(page, digest_size=16).digest())
+
+    return page_digests, file_hash.hexdigest()
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """计算文件 SHA-256"""
+    return scan_file(path)[1]
+
+
+def build_delta(
+    path: Union[str, Path], state: SyncState
+) -> Tuple[Optional[bytes], List[bytes], str]:
+    """
+    生成相对于上次同步状态的增量
+
+    Args:
+        path: 数据库文件路径（需已执行 WAL 检查点）
+        state: 上次同步后的状态
+
+    Returns:
+        (增量内容，无变化时为 None, 新的逐页摘要, 新的文件摘要)
+    """
+    page_size = read_page_size(path)
+    page_digests, digest = scan_file(path, page_size)
+    if digest == state.file_digest:
+        return None, page_digests, digest
+
+    old_digests = state.page_digests
+    changed = [
+        page_no for page_no, page_digest in enumerate(page_digests)
+        if page_no >= len(old_digests) or old_digests[page_no] != page_digest
+    ]
+
+    header = json.dumps({
+        "parent": state.file_digest,
+        "digest": digest,
+        "page_size": page_size,
+        "size": Path(path).stat().st_size,
+        "pages": changed,
+    }).encode("utf-8")
+
+    chunks = [MAGIC, struct.pack(">I", len(header)), header]
+    with open(path, "rb") as f:
+        for page_no in changed:
+            f.seek(page_no * page_size)
+            chunks.append(f.read(page_size))
+
+    return zlib.compress(b"".join(chunks)), page_digests, digest
+
+
+def read_delta_header(blob: bytes) -> Tuple[dict, bytes]:
+    """
+    解析增量内容
+
+    Returns:
+        (头部字典, 页内容)
+    """
+    try:
+        data = zlib.decompress(blob)
+    except zlib.error as e:
+        raise DeltaError(f"增量解压失败: {e}")
+
+    if not data.startswith(MAGIC) or len(data) < len(MAGIC) + 4:
+        raise DeltaError("增量格式错误")
+
+    offset = len(MAGIC)
+    header_len = struct.unpack(">I", data[offset:offset + 4])[0]
+    offset += 4
+    try:
+        header = json.loads(data[offset:offset + header_len].decode("utf-8"))
+    except ValueError as e:
+        raise DeltaError(f"增量头部解析失败: {e}")
+
+    return header, data[offset + header_len:]
+
+
+def apply_delta(path: Union[str, Path], blob: bytes, current_digest: str) -> str:
+    """
+    把增量应用到数据库文件
+
+    Args:
+        path: 数据库文件路径
+        blob: 增量内容
+        current_digest: 文件当前的 SHA-256
+
+    Returns:
+        应用后的文件 SHA-256
+
+    Raises:
+        DeltaError: 增量不是基于当前文件生成的，或应用后摘要不符（文件未被修改）
+    """
+    header, pages = read_delta_header(blob)
+    if header.get("parent") != current_digest:
+        raise DeltaError("增量与当前文件不匹配")
+
+    page_size = header["page_size"]
+    page_nos = header["pages"]
+
+    # 先写入临时文件，校验通过后再替换，避免留下半应用的数据库
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".delta-tmp")
+    try:
+        shutil.copyfile(path, tmp_path)
+
+        with open(tmp_path, "r+b") as f:
+            for index, page_no in enumerate(page_nos):
+                f.seek(page_no * page_size)
+                f.write(pages[index * page_size:(index + 1) * page_size])
+            f.truncate(header["size"])
+
+        new_digest = file_digest(tmp_path)
+        if new_digest != header.get("digest"):
+            raise DeltaError("应用增量后文件摘要不符")
+
+        tmp_path.replace(path)
+        return new_digest
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
@@ -13,8 +13,18 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from trendradar.storage.archive import (
+    archive_database,
+    extract_archive,
+    get_archive_path,
+    get_cached_path,
+    remove_cached_database,
+    resolve_database,
+)
 from trendradar.storage.base import StorageBackend, NewsItem, NewsData, RSSItem, RSSData
+from trendradar.storage.connection import SQLiteConnectionPool
 from trendradar.storage.sqlite_mixin import SQLiteStorageMixin
+from trendradar.storage.warehouse import NewsWarehouse
 from trendradar.utils.time import (
     get_configured_time,
     format_date_folder,
@@ -28,6 +38,7 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
 
     使用 SQLite 数据库存储新闻数据，支持：
     - 按日期组织的 SQLite 数据库文件
+    - 历史数据库压缩归档（读取已归档的日期时解压到缓存，写入时解压恢复）
     - 可选的 TXT 快照（用于调试）
     - HTML 报告生成
     """
@@ -38,6 +49,7 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
         enable_txt: bool = True,
         enable_html: bool = True,
         timezone: str = "Asia/Shanghai",
+        warehouse: Optional[NewsWarehouse] = None,
     ):
         """
         初始化本地存储后端
@@ -47,12 +59,14 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
             enable_txt: 是否启用 TXT 快照
             enable_html: 是否启用 HTML 报告
             timezone: 时区配置（默认 Asia/Shanghai）
+            warehouse: 数据仓库（None 表示不维护多日合并数据库）
         """
         self.data_dir = Path(data_dir)
         self.enable_txt = enable_txt
         self.enable_html = enable_html
         self.timezone = timezone
-        self._db_connections: Dict[str, sqlite3.Connection] = {}
+        self.warehouse = warehouse
+        self._db_pool = SQLiteConnectionPool()
 
     @property
     def backend_name(self) -> str:
@@ -91,33 +105,56 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
             db_type: 数据库类型 ("news" 或 "rss")
 
         Returns:
-            数据库文件路径
+            数据库文件路径（该日期已归档时文件可能不存在）
         """
         date_str = self._format_date_folder(date)
         db_dir = self.data_dir / db_type
         db_dir.mkdir(parents=True, exist_ok=True)
         return db_dir / f"{date_str}.db"
 
-    def _get_connection(self, date: Optional[str] = None, db_type: str = "news") -> sqlite3.Connection:
+    def _has_database(self, date: Optional[str] = None, db_type: str = "news") -> bool:
+        """指定日期是否有数据库（包括已归档的日期）"""
+        db_path = self._get_db_path(date, db_type)
+        return db_path.exists() or get_archive_path(db_path).exists()
+
+    def _remove_cached_database(self, db_path: Path) -> bool:
+        """关闭并删除数据库在 output/.archive_cache/ 中的解压副本"""
+        cache_dir = self.data_dir / ".archive_cache"
+        self._db_pool.close(get_cached_path(db_path, cache_dir))
+        return remove_cached_database(db_path, cache_dir)
+
+    def _get_connection(
+        self, date: Optional[str] = None, db_type: str = "news", write: bool = False
+    ) -> sqlite3.Connection:
         """
-        获取数据库连接（带缓存）
+        获取数据库连接（由连接池缓存，长时间未使用的日期连接会被关闭）
+
+        该日期已归档（{date}.db.xz）时：
+        - 读取：解压到 output/.archive_cache/ 后读取缓存副本，归档保持不变
+        - 写入：解压恢复为数据库并删除归档（之后超过归档天数时会重新归档）
 
         Args:
             date: 日期字符串
             db_type: 数据库类型 ("news" 或 "rss")
+            write: 是否用于写入
 
         Returns:
             数据库连接
         """
-        db_path = str(self._get_db_path(date, db_type))
+        db_path = self._get_db_path(date, db_type)
 
-        if db_path not in self._db_connections:
-            conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row
-            self._init_tables(conn, db_type)
-            self._db_connections[db_path] = conn
-
-        return self._db_connections[db_path]
+        if not db_path.exists():
+            archive_path = get_archive_path(db_path)
+            if archive_path.exists():
+                if write:
+                    extract_archive(archive_path, db_path)
+                    archive_path.unlink()
+                    self._remove_cached_database(db_path)
+                    print(f"[本地存储] 已从归档恢复: {db_type}/{db_path.name}")
+                else:
+                    db_path = resolve_database(db_path, self.data_dir / ".archive_cache")
+
+        return self._db_pool.get(db_path, on_open=lambda conn: self._init_tables(conn, db_type))
 
     # ========================================
     # StorageBackend 接口实现（委托给 mixin）
@@ -148,15 +185,13 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
 
     def get_today_all_data(self, date: Optional[str] = None) -> Optional[NewsData]:
         """获取指定日期的所有新闻数据（合并后）"""
-        db_path = self._get_db_path(date)
-        if not db_path.exists():
+        if not self._has_database(date):
             return None
         return self._get_today_all_data_impl(date)
 
     def get_latest_crawl_data(self, date: Optional[str] = None) -> Optional[NewsData]:
         """获取最新一次抓取的数据"""
-        db_path = self._get_db_path(date)
-        if not db_path.exists():
+        if not self._has_database(date):
             return None
         return self._get_latest_crawl_data_impl(date)
 
@@ -166,15 +201,13 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
 
     def is_first_crawl_today(self, date: Optional[str] = None) -> bool:
         """检查是否是当天第一次抓取"""
-        db_path = self._get_db_path(date)
-        if not db_path.exists():
+        if not self._has_database(date):
             return True
         return self._is_first_crawl_today_impl(date)
 
     def get_crawl_times(self, date: Optional[str] = None) -> List[str]:
         """获取指定日期的所有抓取时间列表"""
-        db_path = self._get_db_path(date)
-        if not db_path.exists():
+        if not self._has_database(date):
             return []
         return self._get_crawl_times_impl(date)
 
@@ -229,11 +262,50 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
 
     def get_latest_rss_data(self, date: Optional[str] = None) -> Optional[RSSData]:
         """获取最新一次抓取的 RSS 数据"""
-        db_path = self._get_db_path(date, db_type="rss")
-        if not db_path.exists():
+        if not self._has_database(date, db_type="rss"):
             return None
         return self._get_latest_rss_data_impl(date)
 
+    def get_rss_feed_cache(self, date: Optional[str] = None) -> Dict[str, Dict]:
+        """获取 RSS 源的 HTTP 缓存"""
+        return self._get_rss_feed_cache_impl(date)
+
+    def save_rss_feed_cache(self, cache: Dict[str, Dict], date: Optional[str] = None) -> bool:
+        """保存 RSS 源的 HTTP 缓存（立即提交）"""
+        return self._save_rss_feed_cache_impl(cache, date)
+
+    # ========================================
+    # 自适应抓取调度
+    # ========================================
+
+    def get_crawl_schedule(self, date: Optional[str] = None) -> Dict[str, Dict]:
+        """获取热榜平台的调度状态"""
+        return self._get_crawl_schedule_impl(date)
+
+    def save_crawl_schedule(self, states: Dict[str, Dict], date: Optional[str] = None) -> bool:
+        """保存热榜平台的调度状态（立即提交）"""
+        return self._save_crawl_schedule_impl(states, date)
+
+    def get_rss_schedule(self, date: Optional[str] = None) -> Dict[str, Dict]:
+        """获取 RSS 源的调度状态"""
+        return self._get_crawl_schedule_impl(date, db_type="rss")
+
+    def save_rss_schedule(self, states: Dict[str, Dict], date: Optional[str] = None) -> bool:
+        """保存 RSS 源的调度状态（立即提交）"""
+        return self._save_crawl_schedule_impl(states, date, db_type="rss")
+
+    def get_latest_platform_titles(self, platform_ids: List[str], date: Optional[str] = None) -> Dict[str, Dict]:
+        """获取各平台最近一次在榜的标题"""
+        return self._get_latest_platform_titles_impl(platform_ids, date)
+
+    def get_source_failure_stats(self, date: Optional[str] = None) -> Dict[str, Dict]:
+        """获取热榜平台的连续失败统计"""
+        return self._get_source_failure_stats_impl(date)
+
+    def get_rss_failure_stats(self, date: Optional[str] = None) -> Dict[str, Dict]:
+        """获取 RSS 源的连续失败统计"""
+        return self._get_source_failure_stats_impl(date, db_type="rss")
+
     # ========================================
     # 本地特有功能：TXT/HTML 快照
     # ========================================
@@ -336,22 +408,17 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
 
     def cleanup(self) -> None:
         """清理资源（关闭数据库连接）"""
-        for db_path, conn in self._db_connections.items():
-            try:
-                conn.close()
-                print(f"[本地存储] 关闭数据库连接: {db_path}")
-            except Exception as e:
-                print(f"[本地存储] 关闭连接失败 {db_path}: {e}")
-
-        self._db_connections.clear()
+        for db_path in self._db_pool.close_all():
+            print(f"[本地存储] 关闭数据库连接: {db_path}")
 
     def cleanup_old_data(self, retention_days: int) -> int:
         """
         清理过期数据
 
         新结构清理逻辑：
-        - output/news/{date}.db  -> 删除过期的 .db 文件
-        - output/rss/{date}.db   -> 删除过期的 .db 文件
+        - output/news/{date}.db  -> 删除过期的 .db 文件（及已归档的 .db.xz 文件）
+        - output/rss/{date}.db   -> 删除过期的 .db 文件（及已归档的 .db.xz 文件）
+        - output/.archive_cache/ -> 删除过期日期的归档解压副本
         - output/txt/{date}/     -> 删除过期的日期目录
         - output/html/{date}/    -> 删除过期的日期目录
 
@@ -399,21 +466,45 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
                     if file_date and file_date < cutoff_date:
                         # 先关闭数据库连接
                         db_path = str(db_file)
-                        if db_path in self._db_connections:
-                            try:
-                                self._db_connections[db_path].close()
-                                del self._db_connections[db_path]
-                            except Exception:
-                                pass
+                        try:
+                            self._db_pool.close(db_path)
+                        except Exception:
+                            pass
 
-                        # 删除文件
+                        # 删除文件（连同 WAL 模式可能残留的 -wal / -shm 文件）
                         try:
                             db_file.unlink()
+                            for suffix in ("-wal", "-shm"):
+                                sidecar = Path(f"{db_path}{suffix}")
+                                if sidecar.exists():
+                                    sidecar.unlink()
                             deleted_count += 1
                             print(f"[本地存储] 清理过期数据: {db_type}/{db_file.name}")
                         except Exception as e:
                             print(f"[本地存储] 删除文件失败 {db_file}: {e}")
 
+                for archive_file in db_dir.glob("*.db.xz"):
+                    file_date = parse_date_from_name(archive_file.name)
+                    if file_date and file_date < cutoff_date:
+                        try:
+                            archive_file.unlink()
+                            deleted_count += 1
+                            print(f"[本地存储] 清理过期数据: {db_type}/{archive_file.name}")
+                        except Exception as e:
+                            print(f"[本地存储] 删除文件失败 {archive_file}: {e}")
+
+                # 归档解压副本随归档一起清理（包括归档已被删除后残留的副本）
+                cache_type_dir = self.data_dir / ".archive_cache" / db_type
+                if cache_type_dir.exists():
+                    for cached_file in cache_type_dir.glob("*.db"):
+                        file_date = parse_date_from_name(cached_file.name)
+                        if file_date and file_date < cutoff_date:
+                            try:
+                                self._remove_cached_database(db_dir / cached_file.name)
+                                print(f"[本地存储] 清理归档解压副本: {db_type}/{cached_file.name}")
+                            except Exception as e:
+                                print(f"[本地存储] 删除文件失败 {cached_file}: {e}")
+
             # 清理快照目录 (txt/, html/)
             for snapshot_type in ["txt", "html"]:
                 snapshot_dir = self.data_dir / snapshot_type
@@ -442,6 +533,59 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
             print(f"[本地存储] 清理过期数据失败: {e}")
             return deleted_count
 
+    def archive_old_data(self, archive_days: int) -> int:
+        """
+        归档历史数据库
+
+        output/{type}/{date}.db 超过归档天数后压缩为 output/{type}/{date}.db.xz，
+        读取时按需解压到缓存目录，本地后端写入该日期时解压恢复。
+
+        Args:
+            archive_days: 超过多少天的数据归档（0 表示不归档）
+
+        Returns:
+            归档的数据库文件数量
+        """
+        if archive_days <= 0:
+            return 0
+
+        archived_count = 0
+        total_before = 0
+        total_after = 0
+        cutoff_date = (self._get_configured_time() - timedelta(days=archive_days)).strftime("%Y-%m-%d")
+
+        for db_type in ["news", "rss"]:
+            db_dir = self.data_dir / db_type
+            if not db_dir.exists():
+                continue
+
+            for db_file in sorted(db_dir.glob("*.db")):
+                date_match = re.match(r'(\d{4}-\d{2}-\d{2})\.db$', db_file.name)
+                # ISO 日期字符串可直接按字典序比较
+                if not date_match or date_match.group(1) >= cutoff_date:
+                    continue
+
+                try:
+                    self._db_pool.close(db_file)
+                    original_size, archive_size = archive_database(db_file)
+                    archived_count += 1
+                    total_before += original_size
+                    total_after += archive_size
+                    print(
+                        f"[本地存储] 已归档: {db_type}/{db_file.name} "
+                        f"({original_size} -> {archive_size} bytes)"
+                    )
+                except Exception as e:
+                    print(f"[本地存储] 归档失败 {db_file}: {e}")
+
+        if archived_count > 0:
+            print(
+                f"[本地存储] 共归档 {archived_count} 个数据库文件，"
+                f"{total_before} -> {total_after} bytes"
+            )
+
+        return archived_count
+
     def __del__(self):
         """析构函数，确保关闭连接"""
         self.cleanup()
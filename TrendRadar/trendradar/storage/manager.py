@@ -6,9 +6,12 @@
 """
 
 import os
+from pathlib import Path
 from typing import Optional
 
 from trendradar.storage.base import StorageBackend, NewsData, RSSData
+from trendradar.storage.warehouse import NewsWarehouse, get_warehouse_path
+from trendradar.utils.time import get_configured_time
 
 
 # 存储管理器单例
@@ -35,9 +38,12 @@ class StorageManager:
         remote_config: Optional[dict] = None,
         local_retention_days: int = 0,
         remote_retention_days: int = 0,
+        local_archive_days: int = 0,
+        remote_archive_days: int = 0,
         pull_enabled: bool = False,
         pull_days: int = 0,
         timezone: str = "Asia/Shanghai",
+        warehouse_enabled: bool = False,
     ):
         """
         初始化存储管理器
@@ -50,9 +56,12 @@ class StorageManager:
             remote_config: 远程存储配置（endpoint_url, bucket_name, access_key_id 等）
             local_retention_days: 本地数据保留天数（0 = 无限制）
             remote_retention_days: 远程数据保留天数（0 = 无限制）
+            local_archive_days: 本地数据超过多少天压缩归档（0 = 不归档）
+            remote_archive_days: 远程数据超过多少天压缩归档（0 = 不归档）
             pull_enabled: 是否启用启动时自动拉取
             pull_days: 拉取最近 N 天的数据
             timezone: 时区配置（默认 Asia/Shanghai）
+            warehouse_enabled: 是否维护多日合并数据库（{data_dir}/warehouse.db）
         """
         self.backend_type = backend_type
         self.data_dir = data_dir
@@ -61,12 +70,16 @@ class StorageManager:
         self.remote_config = remote_config or {}
         self.local_retention_days = local_retention_days
         self.remote_retention_days = remote_retention_days
+        self.local_archive_days = local_archive_days
+        self.remote_archive_days = remote_archive_days
         self.pull_enabled = pull_enabled
         self.pull_days = pull_days
         self.timezone = timezone
+        self.warehouse_enabled = warehouse_enabled
 
         self._backend: Optional[StorageBackend] = None
         self._remote_backend: Optional[StorageBackend] = None
+        self._warehouse: Optional[NewsWarehouse] = None
 
     @staticmethod
     def is_github_actions() -> bool:
@@ -123,7 +136,23 @@ class StorageManager:
 
         return has_config
 
-    def _create_remote_backend(self) -> Optional[StorageBackend]:
+    def _get_warehouse(self) -> Optional[NewsWarehouse]:
+        """获取数据仓库（未启用时返回 None，首次创建时导入尚未汇总的历史日期）"""
+        if not self.warehouse_enabled:
+            return None
+
+        if self._warehouse is None:
+            # 保留天数取本地 / 远程中已配置的较长者（仅远程存储的部署同样会清理）
+            retention_days = max(self.local_retention_days, self.remote_retention_days)
+            self._warehouse = NewsWarehouse(get_warehouse_path(self.data_dir), retention_days=retention_days)
+            try:
+                self._warehouse.backfill(Path(self.data_dir) / "news")
+            except Exception as e:
+                print(f"[存储管理器] 数据仓库导入历史数据失败: {e}")
+
+        return self._warehouse
+
+    def _create_remote_backend(self, warehouse: Optional[NewsWarehouse] = None) -> Optional[StorageBackend]:
         """创建远程存储后端"""
         try:
             from trendradar.storage.remote import RemoteStorageBackend
@@ -137,6 +166,11 @@ class StorageManager:
                 enable_txt=self.enable_txt,
                 enable_html=self.enable_html,
                 timezone=self.timezone,
+                sync_mode=self.remote_config.get("sync_mode", "full"),
+                compact_every=self.remote_config.get("compact_every", 24),
+                max_workers=self.remote_config.get("max_workers", 8),
+                background_upload=self.remote_config.get("background_upload", False),
+                warehouse=warehouse,
             )
         except ImportError as e:
             print(f"[存储管理器] 远程后端导入失败: {e}")
@@ -152,7 +186,7 @@ class StorageManager:
             resolved_type = self._resolve_backend_type()
 
             if resolved_type == "remote":
-                self._backend = self._create_remote_backend()
+                self._backend = self._create_remote_backend(warehouse=self._get_warehouse())
                 if self._backend:
                     print(f"[存储管理器] 使用远程存储后端")
                 else:
@@ -167,6 +201,7 @@ class StorageManager:
                     enable_txt=self.enable_txt,
                     enable_html=self.enable_html,
                     timezone=self.timezone,
+                    warehouse=self._get_warehouse(),
                 )
                 print(f"[存储管理器] 使用本地存储后端 (数据目录: {self.data_dir})")
 
@@ -186,9 +221,9 @@ class StorageManager:
             print("[存储管理器] 未配置远程存储，无法拉取")
             return 0
 
-        # 创建远程后端（如果还没有）
+        # 创建远程后端（如果还没有），拉取到的热榜数据同步更新到数据仓库
         if self._remote_backend is None:
-            self._remote_backend = self._create_remote_backend()
+            self._remote_backend = self._create_remote_backend(warehouse=self._get_warehouse())
 
         if self._remote_backend is None:
             print("[存储管理器] 无法创建远程后端，拉取失败")
@@ -217,6 +252,42 @@ class StorageManager:
         """检测新增的 RSS 条目（增量模式）"""
         return self.get_backend().detect_new_rss_items(current_data)
 
+    def get_rss_feed_cache(self, date: Optional[str] = None) -> dict:
+        """获取 RSS 源的 HTTP 缓存"""
+        return self.get_backend().get_rss_feed_cache(date)
+
+    def save_rss_feed_cache(self, cache: dict, date: Optional[str] = None) -> bool:
+        """保存 RSS 源的 HTTP 缓存"""
+        return self.get_backend().save_rss_feed_cache(cache, date)
+
+    def get_crawl_schedule(self, date: Optional[str] = None) -> dict:
+        """获取热榜平台的调度状态"""
+        return self.get_backend().get_crawl_schedule(date)
+
+    def save_crawl_schedule(self, states: dict, date: Optional[str] = None) -> bool:
+        """保存热榜平台的调度状态"""
+        return self.get_backend().save_crawl_schedule(states, date)
+
+    def get_rss_schedule(self, date: Optional[str] = None) -> dict:
+        """获取 RSS 源的调度状态"""
+        return self.get_backend().get_rss_schedule(date)
+
+    def save_rss_schedule(self, states: dict, date: Optional[str] = None) -> bool:
+        """保存 RSS 源的调度状态"""
+        return self.get_backend().save_rss_schedule(states, date)
+
+    def get_latest_platform_titles(self, platform_ids: list, date: Optional[str] = None) -> dict:
+        """获取各平台最近一次在榜的标题"""
+        return self.get_backend().get_latest_platform_titles(platform_ids, date)
+
+    def get_source_failure_stats(self, date: Optional[str] = None) -> dict:
+        """获取热榜平台的连续失败统计"""
+        return self.get_backend().get_source_failure_stats(date)
+
+    def get_rss_failure_stats(self, date: Optional[str] = None) -> dict:
+        """获取 RSS 源的连续失败统计"""
+        return self.get_backend().get_rss_failure_stats(date)
+
     def get_today_all_data(self, date: Optional[str] = None) -> Optional[NewsData]:
         """获取当天所有数据"""
         return self.get_backend().get_today_all_data(date)
@@ -247,6 +318,8 @@ class StorageManager:
             self._backend.cleanup()
         if self._remote_backend:
             self._remote_backend.cleanup()
+        if self._warehouse:
+            self._warehouse.close()
 
     def cleanup_old_data(self) -> int:
         """
@@ -261,15 +334,43 @@ class StorageManager:
         if self.local_retention_days > 0:
             total_deleted += self.get_backend().cleanup_old_data(self.local_retention_days)
 
+        # 数据仓库按自身的保留天数清理（每次更新时也会清理）
+        if self._warehouse is not None:
+            removed = self._warehouse.prune(get_configured_time(self.timezone).strftime("%Y-%m-%d"))
+            if removed > 0:
+                print(f"[存储管理器] 数据仓库已删除 {removed} 天的过期数据")
+
         # 清理远程数据（如果配置了）
         if self.remote_retention_days > 0 and self._has_remote_config():
             if self._remote_backend is None:
-                self._remote_backend = self._create_remote_backend()
+                self._remote_backend = self._create_remote_backend(warehouse=self._get_warehouse())
             if self._remote_backend:
                 total_deleted += self._remote_backend.cleanup_old_data(self.remote_retention_days)
 
+        self.archive_old_data()
+
         return total_deleted
 
+    def archive_old_data(self) -> int:
+        """
+        压缩归档历史数据（在清理过期数据之后执行，即将被删除的数据不再归档）
+
+        Returns:
+            归档的数据库文件数量
+        """
+        total_archived = 0
+
+        if self.local_archive_days > 0:
+            total_archived += self.get_backend().archive_old_data(self.local_archive_days)
+
+        if self.remote_archive_days > 0 and self._has_remote_config():
+            if self._remote_backend is None:
+                self._remote_backend = self._create_remote_backend(warehouse=self._get_warehouse())
+            if self._remote_backend:
+                total_archived += self._remote_backend.archive_old_data(self.remote_archive_days)
+
+        return total_archived
+
     @property
     def backend_name(self) -> str:
         """获取当前后端名称"""
@@ -341,9 +442,12 @@ def get_storage_manager(
     remote_config: Optional[dict] = None,
     local_retention_days: int = 0,
     remote_retention_days: int = 0,
+    local_archive_days: int = 0,
+    remote_archive_days: int = 0,
     pull_enabled: bool = False,
     pull_days: int = 0,
     timezone: str = "Asia/Shanghai",
+    warehouse_enabled: bool = False,
     force_new: bool = False,
 ) -> StorageManager:
     """
@@ -357,9 +461,12 @@ def get_storage_manager(
         remote_config: 远程存储配置
         local_retention_days: 本地数据保留天数（0 = 无限制）
         remote_retention_days: 远程数据保留天数（0 = 无限制）
+        local_archive_days: 本地数据超过多少天压缩归档（0 = 不归档）
+        remote_archive_days: 远程数据超过多少天压缩归档（0 = 不归档）
         pull_enabled: 是否启用启动时自动拉取
         pull_days: 拉取最近 N 天的数据
         timezone: 时区配置（默认 Asia/Shanghai）
+        warehouse_enabled: 是否维护多日合并数据库（{data_dir}/warehouse.db）
         force_new: 是否强制创建新实例
 
     Returns:
@@ -376,9 +483,12 @@ def get_storage_manager(
             remote_config=remote_config,
             local_retention_days=local_retention_days,
             remote_retention_days=remote_retention_days,
+            local_archive_days=local_archive_days,
+            remote_archive_days=remote_archive_days,
             pull_enabled=pull_enabled,
             pull_days=pull_days,
             timezone=timezone,
+            warehouse_enabled=warehouse_enabled,
         )
 
     return _storage_manager
@@ -0,0 +1,170 @@
+# coding=utf-8
+"""
+数据库结构版本迁移
+
+schema.sql / rss_schema.sql 始终描述最新的表结构，新建的数据库直接得到最终状态；
+已存在的数据库按版本号顺序执行这里追加的迁移，升级到同一状态。
+每个数据库已应用到的版本记录在 PRAGMA user_version 中。
+
+新增迁移时：
+1. 同步修改 schema.sql / rss_schema.sql，使新库直接是最终结构
+2. 在对应列表末尾追加 (版本号, 说明, SQL)，版本号递增
+3. SQL 需可重复执行（IF NOT EXISTS / IF EXISTS）
+4. SQL 无法表达的数据迁移可以用函数代替 SQL，函数接收游标，在迁移事务内执行
+"""
+
+import sqlite3
+from typing import Callable, Dict, List, Tuple, Union
+
+# (版本号, 说明, SQL 脚本或数据迁移函数)
+Migration = Tuple[int, str, Union[str, Callable[[sqlite3.Cursor], None]]]
+
+
+def rebuild_rank_stats(cursor: sqlite3.Cursor) -> None:
+    """
+    为缺少聚合记录的条目从 rank_history 补建排名聚合（news_item_stats）
+
+    用于排名聚合表出现之前创建的数据库，之后由保存数据时增量维护。
+    """
+    cursor.execute("""
+        SELECT rh.news_item_id, rh.rank, rh.crawl_time
+        FROM rank_history rh
+        WHERE NOT EXISTS (
+            SELECT 1 FROM news_item_stats s WHERE s.news_item_id = rh.news_item_id
+        )
+        ORDER BY rh.news_item_id, rh.crawl_time
+    """)
+    timelines: Dict[int, List[Tuple[str, int]]] = {}
+    for news_id, rank, crawl_time in cursor.fetchall():
+        timelines.setdefault(news_id, []).append((crawl_time, rank))
+
+    rows = []
+    for news_id, timeline in timelines.items():
+        # 去重后的在榜排名（按出现顺序，排除脱榜记录 rank=0）
+        ranks: List[int] = []
+        for _, rank in timeline:
+            if rank != 0 and rank not in ranks:
+                ranks.append(rank)
+        rows.append((
+            news_id,
+            ",".join(str(rank) for rank in ranks),
+            ";".join(f"{rank}@{crawl_time}" for crawl_time, rank in timeline),
+        ))
+    cursor.executemany("""
+        INSERT OR REPLACE INTO news_item_stats (news_item_id, ranks, rank_timeline)
+        VALUES (?, ?, ?)
+    """, rows)
+
+    # 没有排名历史的条目也写入空记录
+    cursor.execute("""
+        INSERT OR IGNORE INTO news_item_stats (news_item_id)
+        SELECT id FROM news_items
+    """)
+
+
+NEWS_MIGRATIONS: List[Migration] = [
+    (
+        1,
+        "复合索引替换单列索引",
+        """
+        -- 按条目读取排名历史（ORDER BY news_item_id, crawl_time）无需临时排序，且覆盖 rank 列
+        CREATE INDEX IF NOT EXISTS idx_rank_history_news_time
+            ON rank_history(news_item_id, crawl_time, rank);
+        DROP INDEX IF EXISTS idx_rank_history_news;
+
+        -- 平台 + 最后抓取时间（脱榜检测、按平台读取最新数据）
+        CREATE INDEX IF NOT EXISTS idx_news_platform_last_crawl
+            ON news_items(platform_id, last_crawl_time);
+        DROP INDEX IF EXISTS idx_news_platform;
+
+        -- 标题匹配在 Python 中进行，标题索引只增加写入开销
+        DROP INDEX IF EXISTS idx_news_title;
+        """,
+    ),
+    (
+        2,
+        "从排名历史补建排名聚合",
+        rebuild_rank_stats,
+    ),
+]
+
+
+RSS_MIGRATIONS: List[Migration] = [
+    (
+        1,
+        "复合索引替换单列索引",
+        """
+        -- 按最后抓取时间筛选并按发布时间排序（获取最新 RSS 数据）
+        CREATE INDEX IF NOT EXISTS idx_rss_crawl_time_published
+            ON rss_items(last_crawl_time, published_at DESC);
+        DROP INDEX IF EXISTS idx_rss_crawl_time;
+
+        -- 标题匹配在 Python 中进行，标题索引只增加写入开销
+        DROP INDEX IF EXISTS idx_rss_title;
+        """,
+    ),
+]
+
+
+MIGRATIONS: Dict[str, List[Migration]] = {
+    "news": NEWS_MIGRATIONS,
+    "rss": RSS_MIGRATIONS,
+}
+
+
+def get_latest_version(db_type: str = "news") -> int:
+    """获取指定数据库类型的最新结构版本"""
+    migrations = MIGRATIONS.get(db_type, [])
+    return migrations[-1][0] if migrations else 0
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """读取数据库当前的结构版本"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def set_schema_version(conn: sqlite3.Connection, version: int) -> None:
+    """写入数据库结构版本"""
+    conn.execute(f"PRAGMA user_version = {int(version)}")
+
+
+def apply_migrations(conn: sqlite3.Connection, db_type: str = "news") -> List[Migration]:
+    """
+    依次执行数据库尚未应用的迁移
+
+    每个迁移连同版本号更新在同一个事务中执行，失败时回滚并抛出异常，
+    数据库停留在上一个成功的版本。
+
+    Args:
+        conn: 数据库连接
+        db_type: 数据库类型 ("news" 或 "rss")
+
+    Returns:
+        本次执行的迁移列表
+    """
+    current = get_schema_version(conn)
+    applied = []
+
+    for migration in MIGRATIONS.get(db_type, []):
+        version, _, script = migration
+        if version <= current:
+            continue
+
+        try:
+            if callable(script):
+                if conn.in_transaction:
+                    conn.commit()
+                cursor = conn.cursor()
+                cursor.execute("BEGIN")
+                script(cursor)
+                set_schema_version(conn, version)
+                conn.commit()
+            else:
+                conn.executescript(f"BEGIN;\n{script}\nPRAGMA user_version = {version};\nCOMMIT;")
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        applied.append(migration)
+
+    return applied
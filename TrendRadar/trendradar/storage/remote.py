@@ -7,15 +7,19 @@
 数据流程：下载当天 SQLite → 合并新数据 → 上传回远程
 """
 
+import json
+import os
 import pytz
 import re
 import shutil
 import sys
 import tempfile
+import threading
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 try:
     import boto3
@@ -28,8 +32,12 @@ except ImportError:
     BotoConfig = None
     ClientError = Exception
 
+from trendradar.storage.archive import ARCHIVE_SUFFIX, compress_database, temporary_database
 from trendradar.storage.base import StorageBackend, NewsItem, NewsData, RSSItem, RSSData
+from trendradar.storage.connection import SQLiteConnectionPool
+from trendradar.storage.delta import DeltaError, SyncState, apply_delta, build_delta, scan_file
 from trendradar.storage.sqlite_mixin import SQLiteStorageMixin
+from trendradar.storage.warehouse import NewsWarehouse
 from trendradar.utils.time import (
     get_configured_time,
     format_date_folder,
@@ -37,6 +45,40 @@ from trendradar.utils.time import (
 )
 
 
+class _FilePart:
+    """
+    文件中的一段（分段上传的请求体）
+
+    按需从磁盘读取，支持 seek/tell 以便 botocore 计算长度、签名和重试时回退
+    """
+
+    def __init__(self, f, offset: int, length: int):
+        self._f = f
+        self._offset = offset
+        self._length = length
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        remaining = self._length - self._pos
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        self._f.seek(self._offset + self._pos)
+        data = self._f.read(size)
+        self._pos += len(data)
+        return data
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        base = (0, self._pos, self._length)[whence]
+        self._pos = max(0, min(self._length, base + offset))
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+
 class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
     """
     远程云存储后端（S3 兼容协议）
@@ -46,10 +88,22 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
     - 支持 Cloudflare R2、阿里云 OSS、腾讯云 COS、AWS S3、MinIO 等
     - 下载 SQLite 到临时目录进行操作
     - 支持数据合并和上传
-    - 支持从远程拉取历史数据到本地
+    - 支持增量同步：只上传变化的数据库页，定期压缩合并为完整文件
+    - 支持从远程拉取历史数据到本地（多线程并行，大文件分段下载，按清单跳过未变化的文件）
     - 运行结束后自动清理临时文件
     """
 
+    # 超过该大小的数据库文件分段并行下载
+    RANGED_DOWNLOAD_THRESHOLD = 16 * 1024 * 1024
+    RANGED_DOWNLOAD_PART_SIZE = 8 * 1024 * 1024
+
+    # 超过该大小的数据库文件使用分段上传（multipart upload）
+    MULTIPART_UPLOAD_THRESHOLD = 32 * 1024 * 1024
+    MULTIPART_UPLOAD_PART_SIZE = 8 * 1024 * 1024
+
+    # 拉取清单文件名（位于本地数据目录下，记录每个已拉取文件对应的远程版本）
+    PULL_MANIFEST_NAME = ".remote_manifest.json"
+
     def __init__(
         self,
         bucket_name: str,
@@ -61,6 +115,11 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         enable_html: bool = True,
         temp_dir: Optional[str] = None,
         timezone: str = "Asia/Shanghai",
+        sync_mode: str = "full",
+        compact_every: int = 24,
+        max_workers: int = 8,
+        background_upload: bool = False,
+        warehouse: Optional[NewsWarehouse] = None,
     ):
         """
         初始化远程存储后端
@@ -75,6 +134,11 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
             enable_html: 是否启用 HTML 报告
             temp_dir: 临时目录路径（默认使用系统临时目录）
             timezone: 时区配置（默认 Asia/Shanghai）
+            sync_mode: 上传方式，full 每次上传完整数据库，delta 只上传变化的数据库页
+            compact_every: 增量模式下累计多少个增量后重新上传完整数据库
+            max_workers: 拉取数据时的最大并发下载数
+            background_upload: 是否在后台线程上传（生成快照后立即返回，清理资源时等待上传完成）
+            warehouse: 数据仓库（None 表示不维护多日合并数据库）
         """
         if not HAS_BOTO3:
             raise ImportError("远程存储后端需要安装 boto3: pip install boto3")
@@ -85,6 +149,11 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         self.enable_txt = enable_txt
         self.enable_html = enable_html
         self.timezone = timezone
+        self.sync_mode = "delta" if str(sync_mode).lower() == "delta" else "full"
+        self.compact_every = max(1, int(compact_every))
+        self.max_workers = max(1, int(max_workers))
+        self.background_upload = bool(background_upload)
+        self.warehouse = warehouse
 
         # 创建临时目录
         self.temp_dir = Path(temp_dir) if temp_dir else Path(tempfile.mkdtemp(prefix="trendradar_"))
@@ -98,10 +167,20 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         is_tencent_cos = "myqcloud.com" in endpoint_url.lower()
         signature_version = 's3' if is_tencent_cos else 's3v4'
 
-        s3_config = BotoConfig(
-            s3={"addressing_style": "virtual"},
-            signature_version=signature_version,
-        )
+        config_kwargs = {
+            "s3": {"addressing_style": "virtual"},
+            "signature_version": signature_version,
+            # 并行拉取时每个线程占用一个连接，连接池需大于并发数
+            "max_pool_connections": max(10, self.max_workers * 2),
+        }
+        # botocore 1.36+ 默认为上传计算 CRC32 校验，HTTPS + SigV4 时以 aws-chunked 尾部校验发送
+        # （Transfer-Encoding: chunked），部分 S3 兼容服务无法处理；只在接口要求时计算校验，
+        # 上传始终以固定 Content-Length 发送
+        if "request_checksum_calculation" in BotoConfig.OPTION_DEFAULTS:
+            config_kwargs["request_checksum_calculation"] = "when_required"
+            config_kwargs["response_checksum_validation"] = "when_required"
+
+        s3_config = BotoConfig(**config_kwargs)
 
         client_kwargs = {
             "endpoint_url": endpoint_url,
@@ -116,9 +195,20 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
 
         # 跟踪下载的文件（用于清理）
         self._downloaded_files: List[Path] = []
-        self._db_connections: Dict[str, sqlite3.Connection] = {}
-
-        print(f"[远程存储] 初始化完成，存储桶: {bucket_name}，签名版本: {signature_version}")
+        self._db_pool = SQLiteConnectionPool()
+        # 各本地数据库与远程（基础文件 + 增量）的同步状态 {本地路径: SyncState}
+        self._sync_states: Dict[str, SyncState] = {}
+        # 限制同时进行的下载请求数（分段下载与多文件并行共用）
+        self._transfer_slots = threading.BoundedSemaphore(self.max_workers)
+        # 后台上传（单线程，保证同一数据库的增量按顺序上传）
+        self._upload_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="remote-upload")
+        self._pending_uploads = []
+        self._snapshot_seq = 0
+
+        print(
+            f"[远程存储] 初始化完成，存储桶: {bucket_name}，签名版本: {signature_version}，"
+            f"同步方式: {self.sync_mode}"
+        )
 
     @property
     def backend_name(self) -> str:
@@ -199,64 +289,272 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
             print(f"[远程存储] 检查对象存在性异常 ({r2_key}): {e}")
             return False
 
-    def _download_sqlite(self, date: Optional[str] = None, db_type: str = "news") -> Optional[Path]:
+    def _get_object_bytes(self, key: str) -> bytes:
         """
-        从远程存储下载当天的 SQLite 文件到本地临时目录
+        读取远程对象内容
 
         使用 get_object + iter_chunks 替代 download_file，
         以正确处理腾讯云 COS 的 chunked transfer encoding。
+        """
+        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+        return b"".join(response['Body'].iter_chunks(chunk_size=1024*1024))
+
+    def _list_db_objects(
+        self, db_key: str
+    ) -> Tuple[Optional[dict], List[Tuple[int, str, int]], Optional[dict]]:
+        """
+        一次列举取得数据库的基础文件、增量文件和归档文件
 
         Args:
-            date: 日期字符串
-            db_type: 数据库类型 ("news" 或 "rss")
+            db_key: 基础文件的远程对象键（如 "news/2025-12-28.db"）
 
         Returns:
-            本地文件路径，如果不存在返回 None
+            (基础文件对象信息（Key/Size/ETag），不存在时为 None,
+             [(序号, 对象键, 大小)] 按序号升序,
+             归档文件对象信息，不存在时为 None)
         """
-        r2_key = self._get_remote_db_key(date, db_type)
-        local_path = self._get_local_db_path(date, db_type)
+        base = None
+        archive = None
+        archive_key = db_key + ARCHIVE_SUFFIX
+        deltas = []
+        delta_pattern = re.compile(rf'{re.escape(db_key)}\.delta/(\d+)\.bin$')
+
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=db_key):
+            for obj in page.get('Contents', []):
+                if obj['Key'] == db_key:
+                    base = obj
+                    continue
+                if obj['Key'] == archive_key:
+                    archive = obj
+                    continue
+                match = delta_pattern.match(obj['Key'])
+                if match:
+                    deltas.append((int(match.group(1)), obj['Key'], obj.get('Size', 0)))
+
+        return base, sorted(deltas), archive
+
+    def _list_delta_keys(self, db_key: str) -> List[Tuple[int, str, int]]:
+        """
+        列出数据库的增量文件
+
+        Args:
+            db_key: 基础文件的远程对象键（如 "news/2025-12-28.db"）
 
-        # 确保目录存在
+        Returns:
+            [(序号, 对象键, 大小)]，按序号升序
+        """
+        return self._list_db_objects(db_key)[1]
+
+    def _download_object(self, key: str, local_path: Path, obj: Optional[dict] = None) -> None:
+        """
+        下载远程对象到本地文件
+
+        已知大小且超过阈值时分段并行下载，各分段通过 IfMatch 绑定同一版本，
+        下载途中对象被覆盖时请求失败，不会拼出新旧混合的文件；
+        其余情况使用 get_object + iter_chunks 流式写入（兼容腾讯云 COS 的 chunked transfer encoding）。
+
+        Args:
+            key: 远程对象键
+            local_path: 本地保存路径
+            obj: 列举得到的对象信息（Size/ETag），未知时为 None
+        """
         local_path.parent.mkdir(parents=True, exist_ok=True)
+        size = obj.get('Size') if obj else None
 
-        # 先检查文件是否存在
-        if not self._check_object_exists(r2_key):
-            print(f"[远程存储] 文件不存在，将创建新数据库: {r2_key}")
+        if not size or size < self.RANGED_DOWNLOAD_THRESHOLD:
+            with self._transfer_slots:
+                response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+                with open(local_path, 'wb') as f:
+                    for chunk in response['Body'].iter_chunks(chunk_size=1024*1024):
+                        f.write(chunk)
+            return
+
+        etag = obj.get('ETag')
+        part_size = self.RANGED_DOWNLOAD_PART_SIZE
+        ranges = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+
+        with open(local_path, 'wb') as f:
+            f.truncate(size)
+
+        def fetch(byte_range: Tuple[int, int]) -> None:
+            start, end = byte_range
+            params = {'Bucket': self.bucket_name, 'Key': key, 'Range': f"bytes={start}-{end}"}
+            if etag:
+                params['IfMatch'] = etag
+            with self._transfer_slots:
+                response = self.s3_client.get_object(**params)
+                with open(local_path, 'r+b') as f:
+                    f.seek(start)
+                    for chunk in response['Body'].iter_chunks(chunk_size=1024*1024):
+                        f.write(chunk)
+                    written = f.tell() - start
+            if written != end - start + 1:
+                raise IOError(f"分段下载不完整: {key} bytes={start}-{end}")
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(ranges))) as executor:
+            list(executor.map(fetch, ranges))
+
+    def _delete_keys(self, keys: List[str]) -> None:
+        """批量删除对象（每次最多 1000 个）"""
+        for i in range(0, len(keys), 1000):
+            batch = [{'Key': key} for key in keys[i:i + 1000]]
+            self.s3_client.delete_objects(Bucket=self.bucket_name, Delete={'Objects': batch})
+
+    def _download_with_deltas(
+        self,
+        db_key: str,
+        local_path: Path,
+        listing: Optional[Tuple[Optional[dict], List[Tuple[int, str, int]]]] = None,
+    ) -> Optional[SyncState]:
+        """
+        下载基础文件并依次应用增量，得到最新的数据库
+
+        Args:
+            db_key: 基础文件的远程对象键
+            local_path: 本地保存路径
+            listing: 已列举的 (基础文件, 增量列表)，为 None 时直接下载并单独列出增量
+
+        Returns:
+            同步状态，远程不存在该数据库时返回 None
+        """
+        base, deltas = listing if listing is not None else (None, None)
+        if listing is not None and base is None:
             return None
 
         try:
-            # 使用 get_object + iter_chunks 替代 download_file
-            # iter_chunks 会自动处理 chunked transfer encoding
-            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=r2_key)
-            with open(local_path, 'wb') as f:
-                for chunk in response['Body'].iter_chunks(chunk_size=1024*1024):
-                    f.write(chunk)
-            self._downloaded_files.append(local_path)
-            print(f"[远程存储] 已下载: {r2_key} -> {local_path}")
-            return local_path
+            self._download_object(db_key, local_path, base)
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "")
             # S3 兼容存储可能返回不同的错误码
             if error_code in ("404", "NoSuchKey", "Not Found"):
-                print(f"[远程存储] 文件不存在，将创建新数据库: {r2_key}")
                 return None
-            else:
-                print(f"[远程存储] 下载失败 (错误码: {error_code}): {e}")
-                raise
+            raise
+
+        page_digests, digest = scan_file(local_path)
+        state = SyncState(
+            page_digests=page_digests, file_digest=digest, base_size=local_path.stat().st_size
+        )
+
+        if deltas is None:
+            deltas = self._list_delta_keys(db_key)
+
+        applied = 0
+        for seq, key, size in deltas:
+            state.next_seq = seq + 1
+            state.delta_count += 1
+            state.delta_bytes += size
+            try:
+                digest = apply_delta(local_path, self._get_object_bytes(key), digest)
+                applied += 1
+            except DeltaError as e:
+                # 增量链断开（如多个写入方同时同步），下次上传时重写完整数据库
+                print(f"[远程存储] 跳过增量 {key}: {e}")
+                state.needs_compaction = True
+
+        if applied:
+            state.page_digests, state.file_digest = scan_file(local_path)
+            print(f"[远程存储] 已合并 {applied} 个增量: {db_key}")
+
+        return state
+
+    def download_database(self, date: str, local_path: Path, db_type: str = "news") -> bool:
+        """
+        下载指定日期的数据库（合并增量）到本地路径
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD）
+            local_path: 本地保存路径
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            是否下载成功（远程不存在时返回 False）
+        """
+        return self._download_with_deltas(f"{db_type}/{date}.db", Path(local_path)) is not None
+
+    def _download_sqlite(self, date: Optional[str] = None, db_type: str = "news") -> Optional[Path]:
+        """
+        从远程存储下载当天的 SQLite 文件到本地临时目录（合并增量）
+
+        Args:
+            date: 日期字符串
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            本地文件路径，如果不存在返回 None
+        """
+        r2_key = self._get_remote_db_key(date, db_type)
+        local_path = self._get_local_db_path(date, db_type)
+
+        try:
+            state = self._download_with_deltas(r2_key, local_path)
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "")
+            print(f"[远程存储] 下载失败 (错误码: {error_code}): {e}")
+            raise
         except Exception as e:
             print(f"[远程存储] 下载异常: {e}")
             raise
 
+        if state is None:
+            print(f"[远程存储] 文件不存在，将创建新数据库: {r2_key}")
+            return None
+
+        self._sync_states[str(local_path)] = state
+        self._downloaded_files.append(local_path)
+        print(f"[远程存储] 已下载: {r2_key} -> {local_path}")
+        return local_path
+
+    def _should_compact(self, state: SyncState) -> bool:
+        """增量累积过多（数量超限或总量超过基础文件）时重新上传完整数据库"""
+        return (
+            state.needs_compaction
+            or state.delta_count >= self.compact_every
+            or state.delta_bytes >= state.base_size
+        )
+
+    def _create_snapshot(self, local_path: Path, db_type: str) -> Tuple[Path, int]:
+        """
+        生成数据库的一致性快照用于上传
+
+        快照在一个读事务中完成，包含 WAL 中已提交的数据，无需先执行检查点：
+        - 完整上传模式：VACUUM INTO 生成紧凑副本（不含空闲页，体积更小）
+        - 增量模式：backup API 逐页复制，页号与本地数据库一致，增量只包含真正变化的页
+
+        Returns:
+            (快照文件路径（上传后由调用方删除）, 数据库当前大小（页数 × 页大小）)
+        """
+        self._snapshot_seq += 1
+        snapshot_path = local_path.with_name(f"{local_path.name}.snapshot-{self._snapshot_seq}")
+        if snapshot_path.exists():
+            snapshot_path.unlink()
+
+        conn = self._db_pool.get(local_path, on_open=lambda c: self._init_tables(c, db_type))
+        db_size = conn.execute("PRAGMA page_count").fetchone()[0] * conn.execute("PRAGMA page_size").fetchone()[0]
+        if self.sync_mode == "full" and sqlite3.sqlite_version_info >= (3, 27, 0):
+            conn.execute("VACUUM INTO ?", (str(snapshot_path),))
+        else:
+            snapshot_conn = sqlite3.connect(snapshot_path)
+            try:
+                conn.backup(snapshot_conn)
+            finally:
+                snapshot_conn.close()
+
+        return snapshot_path, db_size
+
     def _upload_sqlite(self, date: Optional[str] = None, db_type: str = "news") -> bool:
         """
         上传本地 SQLite 文件到远程存储
 
+        先生成一致性快照再上传快照文件；增量模式下只上传变化的数据库页，增量累积过多时重新上传完整数据库。
+        启用后台上传时快照生成后立即返回，上传在后台线程中按提交顺序执行。
+
         Args:
             date: 日期字符串
             db_type: 数据库类型 ("news" 或 "rss")
 
         Returns:
-            是否上传成功
+            是否上传成功（后台上传时为是否成功提交）
         """
         local_path = self._get_local_db_path(date, db_type)
         r2_key = self._get_remote_db_key(date, db_type)
@@ -266,53 +564,214 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
             return False
 
         try:
-            # 获取本地文件大小
-            local_size = local_path.stat().st_size
-            print(f"[远程存储] 准备上传: {local_path} ({local_size} bytes) -> {r2_key}")
+            snapshot_path, db_size = self._create_snapshot(local_path, db_type)
+        except Exception as e:
+            print(f"[远程存储] 生成上传快照失败: {e}")
+            return False
 
-            # 读取文件内容为 bytes 后上传
-            # 避免传入文件对象时 requests 库使用 chunked transfer encoding
-            # 腾讯云 COS 等 S3 兼容服务可能无法正确处理 chunked encoding
-            with open(local_path, 'rb') as f:
-                file_content = f.read()
+        snapshot_size = snapshot_path.stat().st_size
+        print(
+            f"[远程存储] 上传快照: {snapshot_size} bytes（数据库 {db_size} bytes，"
+            f"减少 {db_size - snapshot_size} bytes）"
+        )
 
-            # 使用 put_object 并明确设置 ContentLength，确保不使用 chunked encoding
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=r2_key,
-                Body=file_content,
-                ContentLength=local_size,
-                ContentType='application/x-sqlite3',
+        if self.background_upload:
+            future = self._upload_executor.submit(
+                self._upload_snapshot, snapshot_path, str(local_path), r2_key
             )
-            print(f"[远程存储] 已上传: {local_path} -> {r2_key}")
+            self._pending_uploads.append(future)
+            print(f"[远程存储] 已提交后台上传: {r2_key}")
+            return True
 
-            # 验证上传成功
-            if self._check_object_exists(r2_key):
-                print(f"[远程存储] 上传验证成功: {r2_key}")
-                return True
-            else:
-                print(f"[远程存储] 上传验证失败: 文件未在远程存储中找到")
+        return self._upload_snapshot(snapshot_path, str(local_path), r2_key)
+
+    def _upload_snapshot(self, snapshot_path: Path, state_key: str, r2_key: str) -> bool:
+        """上传快照（增量或完整），完成后删除快照文件"""
+        try:
+            state = self._sync_states.get(state_key)
+            if self.sync_mode == "delta" and state is not None and not self._should_compact(state):
+                return self._upload_delta(snapshot_path, r2_key, state)
+
+            new_state = self._upload_full(snapshot_path, r2_key, state)
+            if new_state is None:
                 return False
+            self._sync_states[state_key] = new_state
+            return True
 
         except Exception as e:
             print(f"[远程存储] 上传失败: {e}")
             return False
+        finally:
+            if snapshot_path.exists():
+                snapshot_path.unlink()
+
+    def wait_for_uploads(self) -> bool:
+        """
+        等待后台上传全部完成
+
+        Returns:
+            所有后台上传是否都成功
+        """
+        pending = getattr(self, "_pending_uploads", None)
+        if not pending:
+            return True
+
+        results = [future.result() for future in pending]
+        pending.clear()
+        if not all(results):
+            print(f"[远程存储] {results.count(False)} 个后台上传失败")
+            return False
+        return True
+
+    def _upload_delta(self, local_path: Path, r2_key: str, state: SyncState) -> bool:
+        """上传自上次同步以来变化的数据库页"""
+        blob, page_digests, digest = build_delta(local_path, state)
+        if blob is None:
+            print(f"[远程存储] 数据库无变化，跳过上传: {r2_key}")
+            return True
 
-    def _get_connection(self, date: Optional[str] = None, db_type: str = "news") -> sqlite3.Connection:
+        delta_key = f"{r2_key}.delta/{state.next_seq:06d}.bin"
+        self.s3_client.put_object(
+            Bucket=self.bucket_name,
+            Key=delta_key,
+            Body=blob,
+            ContentLength=len(blob),
+            ContentType='application/octet-stream',
+        )
+        print(
+            f"[远程存储] 已上传增量: {delta_key} ({len(blob)} bytes，"
+            f"完整文件 {local_path.stat().st_size} bytes)"
+        )
+
+        state.page_digests = page_digests
+        state.file_digest = digest
+        state.next_seq += 1
+        state.delta_count += 1
+        state.delta_bytes += len(blob)
+        return True
+
+    def _upload_full(
+        self, local_path: Path, r2_key: str, state: Optional[SyncState]
+    ) -> Optional[SyncState]:
+        """
+        上传完整数据库，并删除已合并进来的增量
+
+        Returns:
+            上传后的同步状态，验证失败时返回 None
+        """
+        # 获取本地文件大小
+        local_size = local_path.stat().st_size
+        print(f"[远程存储] 准备上传: {local_path} ({local_size} bytes) -> {r2_key}")
+
+        self._upload_file(local_path, r2_key, local_size, 'application/x-sqlite3')
+        print(f"[远程存储] 已上传: {local_path} -> {r2_key}")
+
+        # 验证上传成功
+        if not self._check_object_exists(r2_key):
+            print(f"[远程存储] 上传验证失败: 文件未在远程存储中找到")
+            return None
+        print(f"[远程存储] 上传验证成功: {r2_key}")
+
+        # 完整文件已包含所有增量，删除旧增量（序号继续递增，残留的旧增量因摘要不匹配会被跳过）
+        if state is not None and (state.delta_count or state.needs_compaction):
+            try:
+                delta_keys = [key for _, key, _ in self._list_delta_keys(r2_key)]
+                if delta_keys:
+                    self._delete_keys(delta_keys)
+                    print(f"[远程存储] 已压缩合并 {len(delta_keys)} 个增量: {r2_key}")
+            except Exception as e:
+                print(f"[远程存储] 删除旧增量失败: {e}")
+
+        page_digests, digest = scan_file(local_path)
+        return SyncState(
+            page_digests=page_digests,
+            file_digest=digest,
+            next_seq=state.next_seq if state is not None else 1,
+            base_size=local_size,
+        )
+
+    def _upload_file(self, local_path: Path, key: str, size: int, content_type: str) -> None:
+        """
+        以文件流上传本地文件，内存占用与文件大小无关
+
+        - 小文件：put_object 直接传入文件句柄并明确设置 ContentLength
+          （文件句柄可 seek，botocore 据此计算签名和重试，不会改用 chunked encoding）
+        - 大文件：分段并行上传，每段以文件区间作为请求体，失败时中止并清理已上传的分段
+
+        Args:
+            local_path: 本地文件路径
+            key: 远程对象键
+            size: 文件大小
+            content_type: 内容类型
+        """
+        if size < self.MULTIPART_UPLOAD_THRESHOLD:
+            with open(local_path, 'rb') as f:
+                self.s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    Body=f,
+                    ContentLength=size,
+                    ContentType=content_type,
+                )
+            return
+
+        part_size = self.MULTIPART_UPLOAD_PART_SIZE
+        upload_id = self.s3_client.create_multipart_upload(
+            Bucket=self.bucket_name, Key=key, ContentType=content_type
+        )['UploadId']
+
+        def upload_part(part: Tuple[int, int]) -> dict:
+            part_number, offset = part
+            length = min(part_size, size - offset)
+            with self._transfer_slots, open(local_path, 'rb') as f:
+                response = self.s3_client.upload_part(
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=_FilePart(f, offset, length),
+                    ContentLength=length,
+                )
+            return {'PartNumber': part_number, 'ETag': response['ETag']}
+
+        parts = [(index + 1, offset) for index, offset in enumerate(range(0, size, part_size))]
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(parts))) as executor:
+                uploaded = list(executor.map(upload_part, parts))
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': uploaded},
+            )
+        except Exception:
+            try:
+                self.s3_client.abort_multipart_upload(
+                    Bucket=self.bucket_name, Key=key, UploadId=upload_id
+                )
+            except Exception as e:
+                print(f"[远程存储] 中止分段上传失败 ({key}): {e}")
+            raise
+
+        print(f"[远程存储] 分段上传完成: {key} ({len(parts)} 段)")
+
+    def _get_connection(
+        self, date: Optional[str] = None, db_type: str = "news", write: bool = False
+    ) -> sqlite3.Connection:
         """
         获取数据库连接
 
         Args:
             date: 日期字符串
             db_type: 数据库类型 ("news" 或 "rss")
+            write: 是否用于写入（读写都使用本地临时数据库，无需区分）
 
         Returns:
             数据库连接
         """
         local_path = self._get_local_db_path(date, db_type)
-        db_path = str(local_path)
 
-        if db_path not in self._db_connections:
+        if local_path not in self._db_pool:
             # 确保目录存在
             local_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -320,12 +779,7 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
             if not local_path.exists():
                 self._download_sqlite(date, db_type)
 
-            conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row
-            self._init_tables(conn, db_type)
-            self._db_connections[db_path] = conn
-
-        return self._db_connections[db_path]
+        return self._db_pool.get(local_path, on_open=lambda conn: self._init_tables(conn, db_type))
 
     # ========================================
     # StorageBackend 接口实现（委托给 mixin + 上传）
@@ -478,6 +932,46 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         """获取最新一次抓取的 RSS 数据"""
         return self._get_latest_rss_data_impl(date)
 
+    def get_rss_feed_cache(self, date: Optional[str] = None) -> Dict[str, Dict]:
+        """获取 RSS 源的 HTTP 缓存"""
+        return self._get_rss_feed_cache_impl(date)
+
+    def save_rss_feed_cache(self, cache: Dict[str, Dict], date: Optional[str] = None) -> bool:
+        """保存 RSS 源的 HTTP 缓存（立即写入本地临时数据库，随下一次 RSS 数据保存上传）"""
+        return self._save_rss_feed_cache_impl(cache, date)
+
+    # ========================================
+    # 自适应抓取调度
+    # ========================================
+
+    def get_crawl_schedule(self, date: Optional[str] = None) -> Dict[str, Dict]:
+        """获取热榜平台的调度状态"""
+        return self._get_crawl_schedule_impl(date)
+
+    def save_crawl_schedule(self, states: Dict[str, Dict], date: Optional[str] = None) -> bool:
+        """保存热榜平台的调度状态（立即写入本地临时数据库，随下一次新闻数据保存上传）"""
+        return self._save_crawl_schedule_impl(states, date)
+
+    def get_rss_schedule(self, date: Optional[str] = None) -> Dict[str, Dict]:
+        """获取 RSS 源的调度状态"""
+        return self._get_crawl_schedule_impl(date, db_type="rss")
+
+    def save_rss_schedule(self, states: Dict[str, Dict], date: Optional[str] = None) -> bool:
+        """保存 RSS 源的调度状态（立即写入本地临时数据库，随下一次 RSS 数据保存上传）"""
+        return self._save_crawl_schedule_impl(states, date, db_type="rss")
+
+    def get_latest_platform_titles(self, platform_ids: List[str], date: Optional[str] = None) -> Dict[str, Dict]:
+        """获取各平台最近一次在榜的标题"""
+        return self._get_latest_platform_titles_impl(platform_ids, date)
+
+    def get_source_failure_stats(self, date: Optional[str] = None) -> Dict[str, Dict]:
+        """获取热榜平台的连续失败统计"""
+        return self._get_source_failure_stats_impl(date)
+
+    def get_rss_failure_stats(self, date: Optional[str] = None) -> Dict[str, Dict]:
+        """获取 RSS 源的连续失败统计"""
+        return self._get_source_failure_stats_impl(date, db_type="rss")
+
     # ========================================
     # 远程特有功能：TXT/HTML 快照（临时目录）
     # ========================================
@@ -560,17 +1054,20 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         if sys.meta_path is None:
             return
 
+        # 等待后台上传完成（上传的是快照文件，但临时目录需在上传结束后才能删除）
+        try:
+            self.wait_for_uploads()
+        except Exception as e:
+            print(f"[远程存储] 等待后台上传失败: {e}")
+        upload_executor = getattr(self, "_upload_executor", None)
+        if upload_executor is not None:
+            upload_executor.shutdown(wait=False)
+
         # 关闭数据库连接
-        db_connections = getattr(self, "_db_connections", {})
-        for db_path, conn in list(db_connections.items()):
-            try:
-                conn.close()
+        db_pool = getattr(self, "_db_pool", None)
+        if db_pool is not None:
+            for db_path in db_pool.close_all():
                 print(f"[远程存储] 关闭数据库连接: {db_path}")
-            except Exception as e:
-                print(f"[远程存储] 关闭连接失败 {db_path}: {e}")
-
-        if db_connections:
-            db_connections.clear()
 
         # 删除临时目录
         temp_dir = getattr(self, "temp_dir", None)
@@ -588,6 +1085,10 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         if downloaded_files:
             downloaded_files.clear()
 
+        sync_states = getattr(self, "_sync_states", None)
+        if sync_states:
+            sync_states.clear()
+
     def cleanup_old_data(self, retention_days: int) -> int:
         """
         清理远程存储上的过期数据
@@ -620,11 +1121,11 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
                 for obj in page['Contents']:
                     key = obj['Key']
 
-                    # 解析日期（格式: news/YYYY-MM-DD.db）
+                    # 解析日期（格式: news/YYYY-MM-DD.db、增量 news/YYYY-MM-DD.db.delta/*.bin、归档 news/YYYY-MM-DD.db.xz）
                     folder_date = None
                     date_str = None
                     try:
-                        date_match = re.match(r'news/(\d{4})-(\d{2})-(\d{2})\.db$', key)
+                        date_match = re.match(r'news/(\d{4})-(\d{2})-(\d{2})\.db(?:$|\.xz$|\.delta/)', key)
                         if date_match:
                             folder_date = datetime(
                                 int(date_match.group(1)),
@@ -666,6 +1167,74 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
             print(f"[远程存储] 清理过期数据失败: {e}")
             return deleted_count
 
+    def archive_old_data(self, archive_days: int) -> int:
+        """
+        归档远程存储上的历史数据库
+
+        {type}/{date}.db（合并增量后）超过归档天数后压缩为 {type}/{date}.db.xz 上传，
+        验证成功后删除原数据库及其增量。
+
+        Args:
+            archive_days: 超过多少天的数据归档（0 表示不归档）
+
+        Returns:
+            归档的数据库文件数量
+        """
+        if archive_days <= 0:
+            return 0
+
+        archived_count = 0
+        cutoff_date = (self._get_configured_time() - timedelta(days=archive_days)).strftime("%Y-%m-%d")
+        work_dir = self.temp_dir / "archive"
+
+        for db_type in ["news", "rss"]:
+            try:
+                db_keys = []
+                paginator = self.s3_client.get_paginator('list_objects_v2')
+                for page in paginator.paginate(Bucket=self.bucket_name, Prefix=f"{db_type}/", Delimiter="/"):
+                    for obj in page.get('Contents', []):
+                        date_match = re.match(rf'{db_type}/(\d{{4}}-\d{{2}}-\d{{2}})\.db$', obj['Key'])
+                        # ISO 日期字符串可直接按字典序比较
+                        if date_match and date_match.group(1) < cutoff_date:
+                            db_keys.append(obj['Key'])
+            except Exception as e:
+                print(f"[远程存储] 列出待归档数据失败 ({db_type}): {e}")
+                continue
+
+            for db_key in sorted(db_keys):
+                local_path = work_dir / db_key
+                archive_path = local_path.with_name(local_path.name + ARCHIVE_SUFFIX)
+                archive_key = db_key + ARCHIVE_SUFFIX
+                try:
+                    base, deltas, _ = self._list_db_objects(db_key)
+                    if self._download_with_deltas(db_key, local_path, (base, deltas)) is None:
+                        continue
+
+                    original_size = local_path.stat().st_size
+                    archive_size = compress_database(local_path, archive_path)
+                    self._upload_file(archive_path, archive_key, archive_size, 'application/x-xz')
+                    if not self._check_object_exists(archive_key):
+                        print(f"[远程存储] 归档验证失败: {archive_key}")
+                        continue
+
+                    self._delete_keys([db_key] + [key for _, key, _ in deltas])
+                    archived_count += 1
+                    print(
+                        f"[远程存储] 已归档: {db_key} -> {archive_key} "
+                        f"({original_size} -> {archive_size} bytes，删除 {len(deltas)} 个增量)"
+                    )
+                except Exception as e:
+                    print(f"[远程存储] 归档失败 ({db_key}): {e}")
+                finally:
+                    for path in (local_path, archive_path):
+                        if path.exists():
+                            path.unlink()
+
+        if archived_count > 0:
+            print(f"[远程存储] 共归档 {archived_count} 个数据库文件")
+
+        return archived_count
+
     def __del__(self):
         """析构函数"""
         # 检查 Python 是否正在关闭
@@ -681,62 +1250,217 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
     # 远程特有功能：数据拉取和列表
     # ========================================
 
-    def pull_recent_days(self, days: int, local_data_dir: str = "output") -> int:
+    def _load_pull_manifest(self, local_dir: Path) -> Dict[str, dict]:
+        """读取拉取清单 {远程对象键: {"remote": 远程版本, "size": 本地大小, "mtime_ns": 本地修改时间}}"""
+        manifest_path = local_dir / self.PULL_MANIFEST_NAME
+        if not manifest_path.exists():
+            return {}
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            return manifest if isinstance(manifest, dict) else {}
+        except (OSError, ValueError) as e:
+            print(f"[远程存储] 读取拉取清单失败，将按本地文件是否存在判断: {e}")
+            return {}
+
+    def _save_pull_manifest(self, local_dir: Path, manifest: Dict[str, dict]) -> None:
+        """写入拉取清单（先写临时文件再替换）"""
+        manifest_path = local_dir / self.PULL_MANIFEST_NAME
+        tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+            tmp_path.replace(manifest_path)
+        except OSError as e:
+            print(f"[远程存储] 写入拉取清单失败: {e}")
+
+    @staticmethod
+    def _remote_version(base: dict, deltas: List[Tuple[int, str, int]]) -> List[list]:
+        """远程数据库的版本标识（基础文件 ETag/大小 + 增量文件列表）"""
+        version = [[base['Key'], base.get('ETag', ''), base.get('Size', 0)]]
+        version.extend([key, "", size] for _, key, size in deltas)
+        return version
+
+    @staticmethod
+    def _local_unchanged(local_path: Path, entry: dict) -> bool:
+        """本地文件自上次拉取后是否未被修改（WAL 中有未合并的写入也视为已修改）"""
+        wal_path = local_path.with_name(local_path.name + "-wal")
+        if wal_path.exists() and wal_path.stat().st_size > 0:
+            return False
+        stat = local_path.stat()
+        return stat.st_size == entry.get("size") and stat.st_mtime_ns == entry.get("mtime_ns")
+
+    def _pull_database(
+        self, db_type: str, date: str, local_dir: Path, manifest: Dict[str, dict]
+    ) -> Dict:
         """
-        从远程拉取最近 N 天的数据到本地
+        拉取单个数据库文件（在线程池中执行）
+
+        判断规则：
+        - 远程不存在 → missing
+        - 本地不存在 → 下载
+        - 本地存在且清单中的远程版本与当前一致 → skipped
+        - 本地存在、远程已更新且本地自上次拉取后未修改 → 重新下载
+        - 其他情况（本地自行写入过的数据）保留本地文件 → skipped
+
+        Returns:
+            {"db_type", "date", "key", "status": pulled/skipped/missing/failed, "error", "entry"}
+        """
+        db_key = f"{db_type}/{date}.db"
+        local_path = local_dir / db_type / f"{date}.db"
+        result = {"db_type": db_type, "date": date, "key": db_key, "status": "skipped"}
+
+        try:
+            base, deltas, archive = self._list_db_objects(db_key)
+            if base is None and archive is not None:
+                return self._pull_archive(archive, local_path, manifest, result)
+            if base is None:
+                result["status"] = "missing"
+                return result
+
+            version = self._remote_version(base, deltas)
+            if local_path.exists():
+                entry = manifest.get(db_key)
+                if entry is None or entry.get("remote") == version:
+                    return result
+                if not self._local_unchanged(local_path, entry):
+                    return result
+
+            # 先下载到临时文件，完整合并增量后再替换，中途失败不会留下不完整的数据库
+            part_path = local_path.with_name(local_path.name + ".part")
+            try:
+                if self._download_with_deltas(db_key, part_path, (base, deltas)) is None:
+                    result["status"] = "missing"
+                    return result
+                os.replace(part_path, local_path)
+            finally:
+                if part_path.exists():
+                    part_path.unlink()
+
+            # 旧文件的 -shm 与新文件无关，删除以免被误用
+            shm_path = local_path.with_name(local_path.name + "-shm")
+            if shm_path.exists():
+                shm_path.unlink()
+
+            stat = local_path.stat()
+            result["status"] = "pulled"
+            result["entry"] = {"remote": version, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+        except Exception as e:
+            result["status"] = "failed"
+            result["error"] = str(e)
+
+        return result
+
+    def _pull_archive(
+        self, archive: dict, local_path: Path, manifest: Dict[str, dict], result: Dict
+    ) -> Dict:
+        """
+        拉取已归档的日期：下载归档文件到 output/{type}/{date}.db.xz（本地有该日期的数据库时保留本地）
+        """
+        archive_path = local_path.with_name(local_path.name + ARCHIVE_SUFFIX)
+        version = [[archive['Key'], archive.get('ETag', ''), archive.get('Size', 0)]]
+        result["key"] = archive['Key']
+
+        if local_path.exists():
+            return result
+        if archive_path.exists() and manifest.get(archive['Key'], {}).get("remote") == version:
+            return result
+
+        part_path = archive_path.with_name(archive_path.name + ".part")
+        try:
+            self._download_object(archive['Key'], part_path, archive)
+            os.replace(part_path, archive_path)
+        finally:
+            if part_path.exists():
+                part_path.unlink()
+
+        stat = archive_path.stat()
+        result["status"] = "pulled"
+        result["entry"] = {"remote": version, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        return result
+
+    def pull_dates(
+        self,
+        dates: List[str],
+        local_data_dir: str = "output",
+        db_types: Tuple[str, ...] = ("news", "rss"),
+    ) -> List[Dict]:
+        """
+        并行拉取指定日期的数据库到本地（output/{db_type}/{date}.db）
+
+        每个文件只需一次列举请求（同时取得基础文件的 ETag/大小和增量列表），
+        与本地拉取清单对比后跳过未变化的文件，其余由线程池并行下载。
 
         Args:
-            days: 拉取天数
+            dates: 日期字符串列表（YYYY-MM-DD）
             local_data_dir: 本地数据目录
+            db_types: 要拉取的数据库类型
 
         Returns:
-            成功拉取的数据库文件数量
+            每个文件的拉取结果列表（见 _pull_database）
         """
-        if days <= 0:
-            return 0
-
         local_dir = Path(local_data_dir)
-        local_dir.mkdir(parents=True, exist_ok=True)
+        for db_type in db_types:
+            (local_dir / db_type).mkdir(parents=True, exist_ok=True)
 
-        pulled_count = 0
-        now = self._get_configured_time()
+        manifest = self._load_pull_manifest(local_dir)
+        tasks = [(db_type, date) for date in dates for db_type in db_types]
+        if not tasks:
+            return []
 
-        print(f"[远程存储] 开始拉取最近 {days} 天的数据...")
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as executor:
+            results = list(executor.map(
+                lambda task: self._pull_database(task[0], task[1], local_dir, manifest),
+                tasks,
+            ))
+
+        changed = False
+        for result in results:
+            if result["status"] == "pulled":
+                manifest[result["key"]] = result.pop("entry")
+                changed = True
+                print(f"[远程存储] 已拉取: {result['key']}")
+            elif result["status"] == "failed":
+                print(f"[远程存储] 拉取失败 ({result['key']}): {result['error']}")
+
+        if changed:
+            self._save_pull_manifest(local_dir, manifest)
+
+        # 拉取到的热榜数据同步更新到数据仓库（已归档的日期解压为临时文件读取）
+        if self.warehouse is not None:
+            for result in results:
+                if result["status"] != "pulled" or result["db_type"] != "news":
+                    continue
+                with temporary_database(local_dir / "news" / f"{result['date']}.db") as db_path:
+                    if db_path is not None:
+                        self.warehouse.refresh(result["date"], db_path)
 
-        for i in range(days):
-            date = now - timedelta(days=i)
-            date_str = date.strftime("%Y-%m-%d")
+        return results
 
-            # 本地目标路径
-            local_date_dir = local_dir / date_str
-            local_db_path = local_date_dir / "news.db"
+    def pull_recent_days(self, days: int, local_data_dir: str = "output") -> int:
+        """
+        从远程拉取最近 N 天的数据到本地
 
-            # 如果本地已存在，跳过
-            if local_db_path.exists():
-                print(f"[远程存储] 跳过（本地已存在）: {date_str}")
-                continue
+        Args:
+            days: 拉取天数
+            local_data_dir: 本地数据目录
 
-            # 远程对象键
-            remote_key = f"news/{date_str}.db"
+        Returns:
+            成功拉取的数据库文件数量
+        """
+        if days <= 0:
+            return 0
 
-            # 检查远程是否存在
-            if not self._check_object_exists(remote_key):
-                print(f"[远程存储] 跳过（远程不存在）: {date_str}")
-                continue
+        now = self._get_configured_time()
+        dates = [(now - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days)]
 
-            # 下载（使用 get_object + iter_chunks 处理 chunked encoding）
-            try:
-                local_date_dir.mkdir(parents=True, exist_ok=True)
-                response = self.s3_client.get_object(Bucket=self.bucket_name, Key=remote_key)
-                with open(local_db_path, 'wb') as f:
-                    for chunk in response['Body'].iter_chunks(chunk_size=1024*1024):
-                        f.write(chunk)
-                print(f"[远程存储] 已拉取: {remote_key} -> {local_db_path}")
-                pulled_count += 1
-            except Exception as e:
-                print(f"[远程存储] 拉取失败 ({date_str}): {e}")
+        print(f"[远程存储] 开始拉取最近 {days} 天的数据（并发数: {self.max_workers}）...")
+        results = self.pull_dates(dates, local_data_dir)
 
-        print(f"[远程存储] 拉取完成，共下载 {pulled_count} 个数据库文件")
+        pulled_count = sum(1 for r in results if r["status"] == "pulled")
+        skipped_count = sum(1 for r in results if r["status"] == "skipped")
+        print(f"[远程存储] 拉取完成，共下载 {pulled_count} 个数据库文件，跳过 {skipped_count} 个（本地已是最新或有本地数据）")
         return pulled_count
 
     def list_remote_dates(self) -> List[str]:
@@ -750,20 +1474,17 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
 
         try:
             paginator = self.s3_client.get_paginator('list_objects_v2')
-            pages = paginator.paginate(Bucket=self.bucket_name, Prefix="news/")
+            # 使用分隔符，增量目录（news/日期.db.delta/）折叠为一条公共前缀，不逐个列出增量文件
+            pages = paginator.paginate(Bucket=self.bucket_name, Prefix="news/", Delimiter="/")
 
             for page in pages:
-                if 'Contents' not in page:
-                    continue
-
-                for obj in page['Contents']:
-                    key = obj['Key']
-                    # 解析日期
-                    date_match = re.match(r'news/(\d{4}-\d{2}-\d{2})\.db$', key)
+                for obj in page.get('Contents', []):
+                    # 解析日期（含已归档的 news/日期.db.xz）
+                    date_match = re.match(r'news/(\d{4}-\d{2}-\d{2})\.db(?:\.xz)?$', obj['Key'])
                     if date_match:
                         dates.append(date_match.group(1))
 
-            return sorted(dates, reverse=True)
+            return sorted(set(dates), reverse=True)
 
         except Exception as e:
             print(f"[远程存储] 列出远程日期失败: {e}")
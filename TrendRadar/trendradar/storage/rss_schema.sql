@@ -1,5 +1,6 @@
 -- TrendRadar RSS 数据库表结构
 -- 用于存储 RSS/Atom 订阅源数据
+-- 已有数据库的结构升级见 migrations.py，修改本文件时需同步追加迁移
 
 -- ============================================
 -- RSS 源配置表
@@ -78,6 +79,35 @@ CREATE TABLE IF NOT EXISTS rss_push_records (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- ============================================
+-- 订阅源 HTTP 缓存表
+-- 保存条件请求验证器与上次解析结果
+-- 返回 304 或响应体未变化时直接复用，跳过解析
+-- ============================================
+CREATE TABLE IF NOT EXISTS rss_feed_cache (
+    feed_id TEXT PRIMARY KEY,                 -- 源 ID
+    feed_url TEXT NOT NULL,                   -- 缓存对应的 URL（URL 变化时缓存失效）
+    etag TEXT DEFAULT '',                     -- 响应头 ETag
+    last_modified TEXT DEFAULT '',            -- 响应头 Last-Modified
+    content_hash TEXT DEFAULT '',             -- 响应体 SHA-1
+    items_json TEXT NOT NULL,                 -- 解析后的条目（JSON 数组）
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (feed_id) REFERENCES rss_feeds(id)
+);
+
+-- ============================================
+-- 自适应抓取调度表
+-- 记录每个源的抓取间隔、更新率和连续失败次数
+-- ============================================
+CREATE TABLE IF NOT EXISTS crawl_schedule (
+    source_id TEXT PRIMARY KEY,
+    interval_minutes REAL DEFAULT 0,      -- 当前抓取间隔（分钟）
+    churn REAL,                           -- 平滑后的更新率（0~1）
+    consecutive_failures INTEGER DEFAULT 0,
+    last_crawl_at TEXT DEFAULT '',        -- 上次实际抓取时间
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 -- ============================================
 -- 索引定义
 -- ============================================
@@ -88,11 +118,8 @@ CREATE INDEX IF NOT EXISTS idx_rss_feed ON rss_items(feed_id);
 -- 发布时间索引（用于按时间排序）
 CREATE INDEX IF NOT EXISTS idx_rss_published ON rss_items(published_at DESC);
 
--- 抓取时间索引（用于查询最新数据）
-CREATE INDEX IF NOT EXISTS idx_rss_crawl_time ON rss_items(last_crawl_time);
-
--- 标题索引（用于标题搜索）
-CREATE INDEX IF NOT EXISTS idx_rss_title ON rss_items(title);
+-- 抓取时间 + 发布时间索引（用于查询最新数据并按发布时间排序）
+CREATE INDEX IF NOT EXISTS idx_rss_crawl_time_published ON rss_items(last_crawl_time, published_at DESC);
 
 -- URL + feed_id 唯一索引（实现去重）
 CREATE UNIQUE INDEX IF NOT EXISTS idx_rss_url_feed
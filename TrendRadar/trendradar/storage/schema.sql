@@ -1,4 +1,5 @@
 -- TrendRadar 数据库表结构
+-- 已有数据库的结构升级见 migrations.py，修改本文件时需同步追加迁移
 
 -- ============================================
 -- 平台信息表
@@ -56,6 +57,20 @@ CREATE TABLE IF NOT EXISTS rank_history (
     FOREIGN KEY (news_item_id) REFERENCES news_items(id)
 );
 
+-- ============================================
+-- 排名聚合表
+-- 每次保存时把本次抓取的排名变化折叠进来，
+-- 读取当日数据时无需再扫描整个 rank_history
+-- 数据库按日期分库，时间线每次抓取最多追加一项（HH-MM 粒度，一天最多 1440 项，
+-- 单条目不超过约 14KB；按 30 分钟抓取约 48 项），排名去重后不超过榜单长度
+-- ============================================
+CREATE TABLE IF NOT EXISTS news_item_stats (
+    news_item_id INTEGER PRIMARY KEY,
+    ranks TEXT NOT NULL DEFAULT '',            -- 去重后的在榜排名，按出现顺序（如 "3,1,2"）
+    rank_timeline TEXT NOT NULL DEFAULT '',    -- 排名时间线（如 "3@08-00;0@08-30"，rank=0 表示脱榜）
+    FOREIGN KEY (news_item_id) REFERENCES news_items(id)
+);
+
 -- ============================================
 -- 抓取记录表
 -- 记录每次抓取的时间和数量
@@ -97,19 +112,29 @@ CREATE TABLE IF NOT EXISTS push_records (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- ============================================
+-- 自适应抓取调度表
+-- 记录每个源的抓取间隔、更新率和连续失败次数
+-- ============================================
+CREATE TABLE IF NOT EXISTS crawl_schedule (
+    source_id TEXT PRIMARY KEY,
+    interval_minutes REAL DEFAULT 0,      -- 当前抓取间隔（分钟）
+    churn REAL,                           -- 平滑后的更新率（0~1）
+    consecutive_failures INTEGER DEFAULT 0,
+    last_crawl_at TEXT DEFAULT '',        -- 上次实际抓取时间
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 -- ============================================
 -- 索引定义
 -- ============================================
 
--- 平台索引
-CREATE INDEX IF NOT EXISTS idx_news_platform ON news_items(platform_id);
+-- 平台 + 最后抓取时间索引（用于脱榜检测、按平台查询最新数据）
+CREATE INDEX IF NOT EXISTS idx_news_platform_last_crawl ON news_items(platform_id, last_crawl_time);
 
 -- 时间索引（用于查询最新数据）
 CREATE INDEX IF NOT EXISTS idx_news_crawl_time ON news_items(last_crawl_time);
 
--- 标题索引（用于标题搜索）
-CREATE INDEX IF NOT EXISTS idx_news_title ON news_items(title);
-
 -- URL + platform_id 唯一索引（仅对非空 URL，实现去重）
 CREATE UNIQUE INDEX IF NOT EXISTS idx_news_url_platform
     ON news_items(url, platform_id) WHERE url != '';
@@ -117,5 +142,5 @@ CREATE UNIQUE INDEX IF NOT EXISTS idx_news_url_platform
 -- 抓取状态索引
 CREATE INDEX IF NOT EXISTS idx_crawl_status_record ON crawl_source_status(crawl_record_id);
 
--- 排名历史索引
-CREATE INDEX IF NOT EXISTS idx_rank_history_news ON rank_history(news_item_id);
+-- 排名历史索引（按条目、抓取时间顺序读取，覆盖 rank 列）
+CREATE INDEX IF NOT EXISTS idx_rank_history_news_time ON rank_history(news_item_id, crawl_time, rank);
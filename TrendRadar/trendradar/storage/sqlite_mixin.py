@@ -5,13 +5,16 @@ SQLite 存储 Mixin
 提供共用的 SQLite 数据库操作逻辑，供 LocalStorageBackend 和 RemoteStorageBackend 复用。
 """
 
+import json
 import sqlite3
 from abc import abstractmethod
+from sys import intern
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from trendradar.storage.base import NewsItem, NewsData, RSSItem, RSSData
+from trendradar.storage.migrations import apply_migrations, get_latest_version, set_schema_version
 from trendradar.utils.url import normalize_url
 
 
@@ -20,19 +23,27 @@ class SQLiteStorageMixin:
     SQLite 存储操作 Mixin
 
     子类需要实现以下抽象方法：
-    - _get_connection(date, db_type) -> sqlite3.Connection
+    - _get_connection(date, db_type, write) -> sqlite3.Connection
     - _get_configured_time() -> datetime
     - _format_date_folder(date) -> str
     - _format_time_filename() -> str
+
+    子类需要提供属性 warehouse（NewsWarehouse 或 None），
+    不为 None 时每次保存热榜数据后同步更新数据仓库中该日期的汇总数据。
     """
 
+    # 单条 SQL 中 IN 参数的最大数量（低于 SQLite 默认上限 999）
+    _SQL_BATCH_SIZE = 500
+
     # ========================================
     # 抽象方法 - 子类必须实现
     # ========================================
 
     @abstractmethod
-    def _get_connection(self, date: Optional[str] = None, db_type: str = "news") -> sqlite3.Connection:
-        """获取数据库连接"""
+    def _get_connection(
+        self, date: Optional[str] = None, db_type: str = "news", write: bool = False
+    ) -> sqlite3.Connection:
+        """获取数据库连接（write 表示用于写入）"""
         pass
 
     @abstractmethod
@@ -70,7 +81,7 @@ class SQLiteStorageMixin:
 
     def _init_tables(self, conn: sqlite3.Connection, db_type: str = "news") -> None:
         """
-        从 schema.sql 初始化数据库表结构
+        从 schema.sql 初始化数据库表结构，并把已有数据库迁移到最新版本
 
         Args:
             conn: 数据库连接
@@ -78,6 +89,9 @@ class SQLiteStorageMixin:
         """
         schema_path = self._get_schema_path(db_type)
 
+        # 新建的数据库由 schema 直接得到最新结构，无需执行迁移
+        is_new = conn.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchone() is None
+
         if schema_path.exists():
             with open(schema_path, "r", encoding="utf-8") as f:
                 schema_sql = f.read()
@@ -85,6 +99,12 @@ class SQLiteStorageMixin:
         else:
             raise FileNotFoundError(f"Schema file not found: {schema_path}")
 
+        if is_new:
+            set_schema_version(conn, get_latest_version(db_type))
+        else:
+            for version, description, _ in apply_migrations(conn, db_type):
+                print(f"[存储] 数据库结构已升级到 v{version}（{db_type}）: {description}")
+
         conn.commit()
 
     # ========================================
@@ -95,6 +115,9 @@ class SQLiteStorageMixin:
         """
         保存新闻数据到 SQLite（核心实现）
 
+        批量写入：先一次性加载涉及平台的已有条目，在内存中区分新增 / 更新 / 标题变更，
+        再用 executemany 分批写入，全部操作在一个显式事务中完成。
+
         Args:
             data: 新闻数据
             log_prefix: 日志前缀
@@ -102,214 +125,324 @@ class SQLiteStorageMixin:
         Returns:
             (success, new_count, updated_count, title_changed_count, off_list_count)
         """
+        conn = None
         try:
-            conn = self._get_connection(data.date)
+            conn = self._get_connection(data.date, write=True)
             cursor = conn.cursor()
 
             # 获取配置时区的当前时间
             now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
+            crawl_time = data.crawl_time
+
+            if conn.in_transaction:
+                conn.commit()
+            cursor.execute("BEGIN IMMEDIATE")
 
             # 首先同步平台信息到 platforms 表
-            for source_id, source_name in data.id_to_name.items():
-                cursor.execute("""
-                    INSERT INTO platforms (id, name, updated_at)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(id) DO UPDATE SET
-                        name = excluded.name,
-                        updated_at = excluded.updated_at
-                """, (source_id, source_name, now_str))
+            cursor.executemany("""
+                INSERT INTO platforms (id, name, updated_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    name = excluded.name,
+                    updated_at = excluded.updated_at
+            """, [(source_id, source_name, now_str) for source_id, source_name in data.id_to_name.items()])
+
+            success_sources = list(data.items.keys())
+
+            # 一次性加载涉及平台的已有条目：(标准化 URL, platform_id) → [id, 当前标题]
+            existing: Dict[Tuple[str, str], List] = {}
+            for start in range(0, len(success_sources), self._SQL_BATCH_SIZE):
+                batch = success_sources[start:start + self._SQL_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                cursor.execute(f"""
+                    SELECT id, title, url, platform_id FROM news_items
+                    WHERE platform_id IN ({placeholders}) AND url != ''
+                """, batch)
+                for news_id, title, url, platform_id in cursor.fetchall():
+                    existing[(url, platform_id)] = [news_id, title]
+
+            # 各平台上一次在榜的抓取时间（须在写入本次数据之前读取）
+            prev_crawl_times = self._get_prev_crawl_times(
+                cursor, success_sources + list(data.carried_ids), crawl_time
+            )
 
-            # 统计计数器
-            new_count = 0
-            updated_count = 0
-            title_changed_count = 0
-            success_sources = []
+            # 新条目预先分配 ID（事务内独占写入，与逐条 INSERT 得到的 ID 一致）
+            cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'news_items'")
+            seq_row = cursor.fetchone()
+            cursor.execute("SELECT MAX(id) FROM news_items")
+            max_row = cursor.fetchone()
+            next_id = max(seq_row[0] if seq_row else 0, max_row[0] or 0) + 1
+
+            new_rows = []
+            update_rows = []
+            title_change_rows = []
+            # 本次写入 rank_history 的在榜记录 [(news_item_id, rank, crawl_time)]，同时用于更新排名聚合
+            rank_updates: List[Tuple[int, int, str]] = []
+            # 每个平台本次在榜的标准化 URL（用于脱榜检测）
+            current_urls: Dict[str, set] = {}
 
             for source_id, news_list in data.items.items():
-                success_sources.append(source_id)
+                source_urls = current_urls.setdefault(source_id, set())
 
                 for item in news_list:
-                    try:
-                        # 标准化 URL（去除动态参数，如微博的 band_rank）
-                        normalized_url = normalize_url(item.url, source_id) if item.url else ""
-
-                        # 检查是否已存在（通过标准化 URL + platform_id）
+                    # 标准化 URL（去除动态参数，如微博的 band_rank）
+                    normalized_url = normalize_url(item.url, source_id) if item.url else ""
+
+                    entry = existing.get((normalized_url, source_id)) if normalized_url else None
+                    if entry is not None:
+                        # 已存在，更新记录
+                        existing_id, existing_title = entry
+
+                        # 检查标题是否变化
+                        if existing_title != item.title:
+                            title_change_rows.append((existing_id, existing_title, item.title, now_str))
+                            entry[1] = item.title
+
+                        update_rows.append((item.title, item.rank, item.mobile_url,
+                                            crawl_time, now_str, existing_id))
+                        rank_updates.append((existing_id, item.rank, crawl_time))
+                    else:
+                        # 不存在，插入新记录（存储标准化后的 URL；URL 为空时不做去重）
+                        new_id = next_id
+                        next_id += 1
+                        new_rows.append((new_id, item.title, source_id, item.rank, normalized_url,
+                                         item.mobile_url, crawl_time, crawl_time, now_str, now_str))
+                        rank_updates.append((new_id, item.rank, crawl_time))
                         if normalized_url:
-                            cursor.execute("""
-                                SELECT id, title FROM news_items
-                                WHERE url = ? AND platform_id = ?
-                            """, (normalized_url, source_id))
-                            existing = cursor.fetchone()
-
-                            if existing:
-                                # 已存在，更新记录
-                                existing_id, existing_title = existing
-
-                                # 检查标题是否变化
-                                if existing_title != item.title:
-                                    # 记录标题变更
-                                    cursor.execute("""
-                                        INSERT INTO title_changes
-                                        (news_item_id, old_title, new_title, changed_at)
-                                        VALUES (?, ?, ?, ?)
-                                    """, (existing_id, existing_title, item.title, now_str))
-                                    title_changed_count += 1
-
-                                # 记录排名历史
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (existing_id, item.rank, data.crawl_time, now_str))
-
-                                # 更新现有记录
-                                cursor.execute("""
-                                    UPDATE news_items SET
-                                        title = ?,
-                                        rank = ?,
-                                        mobile_url = ?,
-                                        last_crawl_time = ?,
-                                        crawl_count = crawl_count + 1,
-                                        updated_at = ?
-                                    WHERE id = ?
-                                """, (item.title, item.rank, item.mobile_url,
-                                      data.crawl_time, now_str, existing_id))
-                                updated_count += 1
-                            else:
-                                # 不存在，插入新记录（存储标准化后的 URL）
-                                cursor.execute("""
-                                    INSERT INTO news_items
-                                    (title, platform_id, rank, url, mobile_url,
-                                     first_crawl_time, last_crawl_time, crawl_count,
-                                     created_at, updated_at)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                                """, (item.title, source_id, item.rank, normalized_url,
-                                      item.mobile_url, data.crawl_time, data.crawl_time,
-                                      now_str, now_str))
-                                new_id = cursor.lastrowid
-                                # 记录初始排名
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (new_id, item.rank, data.crawl_time, now_str))
-                                new_count += 1
-                        else:
-                            # URL 为空的情况，直接插入（不做去重）
-                            cursor.execute("""
-                                INSERT INTO news_items
-                                (title, platform_id, rank, url, mobile_url,
-                                 first_crawl_time, last_crawl_time, crawl_count,
-                                 created_at, updated_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                            """, (item.title, source_id, item.rank, "",
-                                  item.mobile_url, data.crawl_time, data.crawl_time,
-                                  now_str, now_str))
-                            new_id = cursor.lastrowid
-                            # 记录初始排名
-                            cursor.execute("""
-                                INSERT INTO rank_history
-                                (news_item_id, rank, crawl_time, created_at)
-                                VALUES (?, ?, ?, ?)
-                            """, (new_id, item.rank, data.crawl_time, now_str))
-                            new_count += 1
-
-                    except sqlite3.Error as e:
-                        print(f"{log_prefix} 保存新闻条目失败 [{item.title[:30]}...]: {e}")
-
+                            existing[(normalized_url, source_id)] = [new_id, item.title]
+
+                    if normalized_url:
+                        source_urls.add(normalized_url)
+
+            cursor.executemany("""
+                INSERT INTO news_items
+                (id, title, platform_id, rank, url, mobile_url,
+                 first_crawl_time, last_crawl_time, crawl_count,
+                 created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+            """, new_rows)
+
+            # 记录标题变更
+            cursor.executemany("""
+                INSERT INTO title_changes
+                (news_item_id, old_title, new_title, changed_at)
+                VALUES (?, ?, ?, ?)
+            """, title_change_rows)
+
+            # 更新现有记录
+            cursor.executemany("""
+                UPDATE news_items SET
+                    title = ?,
+                    rank = ?,
+                    mobile_url = ?,
+                    last_crawl_time = ?,
+                    crawl_count = crawl_count + 1,
+                    updated_at = ?
+                WHERE id = ?
+            """, update_rows)
+
+            # 沿用上次结果的平台：在榜条目顺延最后抓取时间（仍计入当前榜单），
+            # 不写排名历史、不增加抓取次数
+            cursor.executemany("""
+                UPDATE news_items SET last_crawl_time = ?
+                WHERE platform_id = ? AND last_crawl_time = ?
+            """, [(crawl_time, platform_id, prev_crawl_times[platform_id])
+                  for platform_id in data.carried_ids if platform_id in prev_crawl_times])
+
+            new_count = len(new_rows)
+            updated_count = len(update_rows)
+            title_changed_count = len(title_change_rows)
             total_items = new_count + updated_count
 
-            # ========================================
-            # 脱榜检测：检测上次在榜但这次不在榜的新闻
-            # ========================================
-            off_list_count = 0
+            # 记录排名历史
+            cursor.executemany("""
+                INSERT INTO rank_history
+                (news_item_id, rank, crawl_time, created_at)
+                VALUES (?, ?, ?, ?)
+            """, [(news_id, rank, time_str, now_str) for news_id, rank, time_str in rank_updates])
 
-            # 获取上一次抓取时间
-            cursor.execute("""
-                SELECT crawl_time FROM crawl_records
-                WHERE crawl_time < ?
-                ORDER BY crawl_time DESC
-                LIMIT 1
-            """, (data.crawl_time,))
-            prev_record = cursor.fetchone()
-
-            if prev_record:
-                prev_crawl_time = prev_record[0]
-
-                # 对于每个成功抓取的平台，检测脱榜
-                for source_id in success_sources:
-                    # 获取当前抓取中该平台的所有标准化 URL
-                    current_urls = set()
-                    for item in data.items.get(source_id, []):
-                        normalized_url = normalize_url(item.url, source_id) if item.url else ""
-                        if normalized_url:
-                            current_urls.add(normalized_url)
+            # 把本次抓取的排名变化折叠进排名聚合
+            self._fold_rank_stats(cursor, rank_updates)
 
-                    # 查询上次在榜（last_crawl_time = prev_crawl_time）但这次不在榜的新闻
-                    # 这些新闻是"第一次脱榜"，需要记录
-                    cursor.execute("""
-                        SELECT id, url FROM news_items
-                        WHERE platform_id = ?
-                          AND last_crawl_time = ?
-                          AND url != ''
-                    """, (source_id, prev_crawl_time))
-
-                    for row in cursor.fetchall():
-                        news_id, url = row[0], row[1]
-                        if url not in current_urls:
-                            # 插入脱榜记录（rank=0 表示脱榜）
-                            cursor.execute("""
-                                INSERT INTO rank_history
-                                (news_item_id, rank, crawl_time, created_at)
-                                VALUES (?, 0, ?, ?)
-                            """, (news_id, data.crawl_time, now_str))
-                            off_list_count += 1
+            # 脱榜检测：各平台上次在榜但这次不在榜的新闻
+            off_list_count = self._record_off_list(
+                cursor, current_urls, prev_crawl_times, crawl_time, now_str
+            )
 
             # 记录抓取信息
             cursor.execute("""
                 INSERT OR REPLACE INTO crawl_records
                 (crawl_time, total_items, created_at)
                 VALUES (?, ?, ?)
-            """, (data.crawl_time, total_items, now_str))
+            """, (crawl_time, total_items, now_str))
 
             # 获取刚插入的 crawl_record 的 ID
             cursor.execute("""
                 SELECT id FROM crawl_records WHERE crawl_time = ?
-            """, (data.crawl_time,))
+            """, (crawl_time,))
             record_row = cursor.fetchone()
             if record_row:
                 crawl_record_id = record_row[0]
 
-                # 记录成功的来源
-                for source_id in success_sources:
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO crawl_source_status
-                        (crawl_record_id, platform_id, status)
-                        VALUES (?, ?, 'success')
-                    """, (crawl_record_id, source_id))
-
-                # 记录失败的来源
-                for failed_id in data.failed_ids:
-                    # 确保失败的平台也在 platforms 表中
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO platforms (id, name, updated_at)
-                        VALUES (?, ?, ?)
-                    """, (failed_id, failed_id, now_str))
+                # 确保失败的平台也在 platforms 表中
+                cursor.executemany("""
+                    INSERT OR IGNORE INTO platforms (id, name, updated_at)
+                    VALUES (?, ?, ?)
+                """, [(failed_id, failed_id, now_str) for failed_id in data.failed_ids])
 
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO crawl_source_status
-                        (crawl_record_id, platform_id, status)
-                        VALUES (?, ?, 'failed')
-                    """, (crawl_record_id, failed_id))
+                # 记录成功 / 失败的来源
+                cursor.executemany("""
+                    INSERT OR REPLACE INTO crawl_source_status
+                    (crawl_record_id, platform_id, status)
+                    VALUES (?, ?, ?)
+                """, [(crawl_record_id, source_id, "success") for source_id in success_sources]
+                     + [(crawl_record_id, failed_id, "failed") for failed_id in data.failed_ids])
 
             conn.commit()
 
+            if self.warehouse is not None:
+                db_file = conn.execute("PRAGMA database_list").fetchone()[2]
+                self.warehouse.refresh(self._format_date_folder(data.date), db_file)
+
             return True, new_count, updated_count, title_changed_count, off_list_count
 
         except Exception as e:
+            if conn is not None and conn.in_transaction:
+                conn.rollback()
             print(f"{log_prefix} 保存失败: {e}")
             return False, 0, 0, 0, 0
 
+    def _get_prev_crawl_times(
+        self, cursor: sqlite3.Cursor, platform_ids: List[str], crawl_time: str
+    ) -> Dict[str, str]:
+        """
+        获取各平台在本次之前最近一次抓取的时间
+
+        取在榜条目的最后抓取时间与成功抓取记录中较晚的一个：
+        上次抓取失败的平台与最近一次成功的榜单比较；
+        沿用上次结果的平台，其在榜条目已顺延到沿用时的抓取时间；
+        上次抓取成功但榜单为空的平台不会重复记录更早的脱榜。
+
+        Args:
+            cursor: 数据库游标
+            platform_ids: 平台 ID 列表
+            crawl_time: 本次抓取时间
+
+        Returns:
+            {platform_id: 上一次抓取时间}，当天尚未抓取过的平台不包含在内
+        """
+        prev_times: Dict[str, str] = {}
+        for start in range(0, len(platform_ids), self._SQL_BATCH_SIZE):
+            batch = platform_ids[start:start + self._SQL_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            cursor.execute(f"""
+                SELECT platform_id, MAX(prev_time) FROM (
+                    SELECT platform_id, MAX(last_crawl_time) AS prev_time
+                    FROM news_items
+                    WHERE platform_id IN ({placeholders}) AND last_crawl_time < ?
+                    GROUP BY platform_id
+                    UNION ALL
+                    SELECT s.platform_id, MAX(r.crawl_time)
+                    FROM crawl_source_status s
+                    JOIN crawl_records r ON r.id = s.crawl_record_id
+                    WHERE s.platform_id IN ({placeholders}) AND s.status = 'success'
+                      AND r.crawl_time < ?
+                    GROUP BY s.platform_id
+                )
+                GROUP BY platform_id
+            """, batch + [crawl_time] + batch + [crawl_time])
+            prev_times.update(cursor.fetchall())
+        return prev_times
+
+    def _record_off_list(
+        self,
+        cursor: sqlite3.Cursor,
+        current_urls: Dict[str, set],
+        prev_crawl_times: Dict[str, str],
+        crawl_time: str,
+        now_str: str,
+    ) -> int:
+        """
+        脱榜检测：记录各平台上次在榜（last_crawl_time = 该平台上一次抓取时间）但这次不在榜的新闻
+
+        本次成功抓取的平台及其上一次抓取时间、在榜 URL 暂存到临时表，
+        用一条 INSERT ... SELECT ... WHERE NOT EXISTS 写入脱榜记录（rank=0），
+        再把这些记录折叠进排名聚合。
+
+        Args:
+            cursor: 数据库游标
+            current_urls: {platform_id: 本次在榜的标准化 URL 集合}，只包含成功抓取的平台
+            prev_crawl_times: {platform_id: 上一次抓取时间}
+            crawl_time: 本次抓取时间
+            now_str: 当前时间字符串
+
+        Returns:
+            脱榜记录数
+        """
+        platforms = [
+            (platform_id, prev_crawl_times[platform_id])
+            for platform_id in current_urls if platform_id in prev_crawl_times
+        ]
+        if not platforms:
+            return 0
+
+        cursor.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS crawl_platforms (
+                platform_id TEXT PRIMARY KEY,
+                prev_crawl_time TEXT NOT NULL
+            ) WITHOUT ROWID
+        """)
+        cursor.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS crawl_urls (
+                platform_id TEXT NOT NULL,
+                url TEXT NOT NULL,
+                PRIMARY KEY (platform_id, url)
+            ) WITHOUT ROWID
+        """)
+        cursor.execute("DELETE FROM temp.crawl_platforms")
+        cursor.execute("DELETE FROM temp.crawl_urls")
+        cursor.executemany(
+            "INSERT INTO temp.crawl_platforms (platform_id, prev_crawl_time) VALUES (?, ?)",
+            platforms,
+        )
+        cursor.executemany(
+            "INSERT INTO temp.crawl_urls (platform_id, url) VALUES (?, ?)",
+            [(platform_id, url) for platform_id, urls in current_urls.items() for url in urls],
+        )
+
+        cursor.execute("SELECT COALESCE(MAX(id), 0) FROM rank_history")
+        last_history_id = cursor.fetchone()[0]
+
+        cursor.execute("""
+            INSERT INTO rank_history (news_item_id, rank, crawl_time, created_at)
+            SELECT n.id, 0, ?, ?
+            FROM temp.crawl_platforms p
+            JOIN news_items n
+              ON n.platform_id = p.platform_id
+             AND n.last_crawl_time = p.prev_crawl_time
+            WHERE n.url != ''
+              AND NOT EXISTS (
+                  SELECT 1 FROM temp.crawl_urls c
+                  WHERE c.platform_id = n.platform_id AND c.url = n.url
+              )
+        """, (crawl_time, now_str))
+        off_list_count = cursor.rowcount
+
+        if off_list_count > 0:
+            # 脱榜只追加时间线，不影响在榜排名
+            cursor.execute("""
+                UPDATE news_item_stats SET
+                    rank_timeline = CASE
+                        WHEN rank_timeline = '' THEN '0@' || ?
+                        ELSE rank_timeline || ';0@' || ?
+                    END
+                WHERE news_item_id IN (
+                    SELECT news_item_id FROM rank_history WHERE id > ?
+                )
+            """, (crawl_time, crawl_time, last_history_id))
+
+        return off_list_count
+
     def _get_today_all_data_impl(self, date: Optional[str] = None) -> Optional[NewsData]:
         """
         获取指定日期的所有新闻数据（合并后）
@@ -324,76 +457,47 @@ class SQLiteStorageMixin:
             conn = self._get_connection(date)
             cursor = conn.cursor()
 
-            # 获取所有新闻数据（包含 id 用于查询排名历史）
-            cursor.execute("""
+            # 获取所有新闻数据（连同排名聚合）
+            query = """
                 SELECT n.id, n.title, n.platform_id, p.name as platform_name,
                        n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
+                       n.first_crawl_time, n.last_crawl_time, n.crawl_count,
+                       s.ranks, s.rank_timeline
                 FROM news_items n
                 LEFT JOIN platforms p ON n.platform_id = p.id
+                LEFT JOIN news_item_stats s ON s.news_item_id = n.id
                 ORDER BY n.platform_id, n.last_crawl_time
-            """)
+            """
 
+            cursor.execute(query)
             rows = cursor.fetchall()
             if not rows:
                 return None
 
-            # 收集所有 news_item_id
-            news_ids = [row[0] for row in rows]
-
-            # 批量查询排名历史（同时获取时间和排名）
-            # 过滤逻辑：只保留 last_crawl_time 之前的脱榜记录（rank=0）
-            # 这样可以避免显示新闻永久脱榜后的无意义记录
-            rank_history_map: Dict[int, List[int]] = {}
-            rank_timeline_map: Dict[int, List[Dict[str, Any]]] = {}
-            if news_ids:
-                placeholders = ",".join("?" * len(news_ids))
-                cursor.execute(f"""
-                    SELECT rh.news_item_id, rh.rank, rh.crawl_time
-                    FROM rank_history rh
-                    JOIN news_items ni ON rh.news_item_id = ni.id
-                    WHERE rh.news_item_id IN ({placeholders})
-                      AND NOT (rh.rank = 0 AND rh.crawl_time > ni.last_crawl_time)
-                    ORDER BY rh.news_item_id, rh.crawl_time
-                """, news_ids)
-                for rh_row in cursor.fetchall():
-                    news_id, rank, crawl_time = rh_row[0], rh_row[1], rh_row[2]
-
-                    # 构建 ranks 列表（去重，排除脱榜记录 rank=0）
-                    if news_id not in rank_history_map:
-                        rank_history_map[news_id] = []
-                    if rank != 0 and rank not in rank_history_map[news_id]:
-                        rank_history_map[news_id].append(rank)
-
-                    # 构建 rank_timeline 列表（完整时间线，包含脱榜）
-                    if news_id not in rank_timeline_map:
-                        rank_timeline_map[news_id] = []
-                    # 提取时间部分（HH:MM）
-                    time_part = crawl_time.split()[1][:5] if ' ' in crawl_time else crawl_time[:5]
-                    rank_timeline_map[news_id].append({
-                        "time": time_part,
-                        "rank": rank if rank != 0 else None  # 0 转为 None 表示脱榜
-                    })
-
             # 按 platform_id 分组
             items: Dict[str, List[NewsItem]] = {}
             id_to_name: Dict[str, str] = {}
             crawl_date = self._format_date_folder(date)
 
+            # 同一平台 / 抓取时间的字符串和时间线节点在各条目间共享
+            timeline_entries: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
             for row in rows:
                 news_id = row[0]
-                platform_id = row[2]
+                platform_id = intern(row[2])
                 title = row[1]
-                platform_name = row[3] or platform_id
+                platform_name = intern(row[3] or platform_id)
 
                 id_to_name[platform_id] = platform_name
 
                 if platform_id not in items:
                     items[platform_id] = []
 
-                # 获取排名历史，如果没有则使用当前排名
-                ranks = rank_history_map.get(news_id, [row[4]])
-                rank_timeline = rank_timeline_map.get(news_id, [])
+                # 从排名聚合获取排名历史和时间线，如果没有则使用当前排名
+                ranks, rank_timeline = self._rank_fields(
+                    row[4], row[8], row[10], row[11], timeline_entries
+                )
+                last_crawl_time = intern(row[8])
 
                 items[platform_id].append(NewsItem(
                     title=title,
@@ -402,10 +506,10 @@ class SQLiteStorageMixin:
                     rank=row[4],
                     url=row[5] or "",
                     mobile_url=row[6] or "",
-                    crawl_time=row[8],  # last_crawl_time
+                    crawl_time=last_crawl_time,
                     ranks=ranks,
-                    first_time=row[7],  # first_crawl_time
-                    last_time=row[8],   # last_crawl_time
+                    first_time=intern(row[7]),  # first_crawl_time
+                    last_time=last_crawl_time,
                     count=row[9],       # crawl_count
                     rank_timeline=rank_timeline,
                 ))
@@ -470,73 +574,44 @@ class SQLiteStorageMixin:
 
             latest_time = time_row[0]
 
-            # 获取该时间的新闻数据（包含 id 用于查询排名历史）
-            cursor.execute("""
+            # 获取该时间的新闻数据（连同排名聚合）
+            query = """
                 SELECT n.id, n.title, n.platform_id, p.name as platform_name,
                        n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
+                       n.first_crawl_time, n.last_crawl_time, n.crawl_count,
+                       s.ranks, s.rank_timeline
                 FROM news_items n
                 LEFT JOIN platforms p ON n.platform_id = p.id
+                LEFT JOIN news_item_stats s ON s.news_item_id = n.id
                 WHERE n.last_crawl_time = ?
-            """, (latest_time,))
+            """
 
+            cursor.execute(query, (latest_time,))
             rows = cursor.fetchall()
             if not rows:
                 return None
 
-            # 收集所有 news_item_id
-            news_ids = [row[0] for row in rows]
-
-            # 批量查询排名历史（同时获取时间和排名）
-            # 过滤逻辑：只保留 last_crawl_time 之前的脱榜记录（rank=0）
-            # 这样可以避免显示新闻永久脱榜后的无意义记录
-            rank_history_map: Dict[int, List[int]] = {}
-            rank_timeline_map: Dict[int, List[Dict[str, Any]]] = {}
-            if news_ids:
-                placeholders = ",".join("?" * len(news_ids))
-                cursor.execute(f"""
-                    SELECT rh.news_item_id, rh.rank, rh.crawl_time
-                    FROM rank_history rh
-                    JOIN news_items ni ON rh.news_item_id = ni.id
-                    WHERE rh.news_item_id IN ({placeholders})
-                      AND NOT (rh.rank = 0 AND rh.crawl_time > ni.last_crawl_time)
-                    ORDER BY rh.news_item_id, rh.crawl_time
-                """, news_ids)
-                for rh_row in cursor.fetchall():
-                    news_id, rank, crawl_time = rh_row[0], rh_row[1], rh_row[2]
-
-                    # 构建 ranks 列表（去重，排除脱榜记录 rank=0）
-                    if news_id not in rank_history_map:
-                        rank_history_map[news_id] = []
-                    if rank != 0 and rank not in rank_history_map[news_id]:
-                        rank_history_map[news_id].append(rank)
-
-                    # 构建 rank_timeline 列表（完整时间线，包含脱榜）
-                    if news_id not in rank_timeline_map:
-                        rank_timeline_map[news_id] = []
-                    # 提取时间部分（HH:MM）
-                    time_part = crawl_time.split()[1][:5] if ' ' in crawl_time else crawl_time[:5]
-                    rank_timeline_map[news_id].append({
-                        "time": time_part,
-                        "rank": rank if rank != 0 else None  # 0 转为 None 表示脱榜
-                    })
-
             items: Dict[str, List[NewsItem]] = {}
             id_to_name: Dict[str, str] = {}
             crawl_date = self._format_date_folder(date)
 
+            # 同一平台 / 抓取时间的字符串和时间线节点在各条目间共享
+            timeline_entries: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
             for row in rows:
                 news_id = row[0]
-                platform_id = row[2]
-                platform_name = row[3] or platform_id
+                platform_id = intern(row[2])
+                platform_name = intern(row[3] or platform_id)
                 id_to_name[platform_id] = platform_name
 
                 if platform_id not in items:
                     items[platform_id] = []
 
-                # 获取排名历史，如果没有则使用当前排名
-                ranks = rank_history_map.get(news_id, [row[4]])
-                rank_timeline = rank_timeline_map.get(news_id, [])
+                # 从排名聚合获取排名历史和时间线，如果没有则使用当前排名
+                ranks, rank_timeline = self._rank_fields(
+                    row[4], row[8], row[10], row[11], timeline_entries
+                )
+                last_crawl_time = intern(row[8])
 
                 items[platform_id].append(NewsItem(
                     title=row[1],
@@ -545,10 +620,10 @@ class SQLiteStorageMixin:
                     rank=row[4],
                     url=row[5] or "",
                     mobile_url=row[6] or "",
-                    crawl_time=row[8],  # last_crawl_time
+                    crawl_time=last_crawl_time,
                     ranks=ranks,
-                    first_time=row[7],  # first_crawl_time
-                    last_time=row[8],   # last_crawl_time
+                    first_time=intern(row[7]),  # first_crawl_time
+                    last_time=last_crawl_time,
                     count=row[9],       # crawl_count
                     rank_timeline=rank_timeline,
                 ))
@@ -575,6 +650,108 @@ class SQLiteStorageMixin:
             print(f"[存储] 获取最新数据失败: {e}")
             return None
 
+    # ========================================
+    # 排名聚合（news_item_stats）
+    # ========================================
+
+    @staticmethod
+    def _distinct_ranks(timeline: List[Tuple[str, int]]) -> List[int]:
+        """从时间线提取去重后的在榜排名（排除脱榜记录 rank=0）"""
+        ranks: List[int] = []
+        for _, rank in timeline:
+            if rank != 0 and rank not in ranks:
+                ranks.append(rank)
+        return ranks
+
+    def _fold_rank_stats(
+        self, cursor: sqlite3.Cursor, rank_updates: List[Tuple[int, int, str]]
+    ) -> None:
+        """
+        把本次抓取写入 rank_history 的记录折叠进排名聚合
+
+        在 SQL 中直接追加时间线和新出现的排名，不读取已有聚合，
+        耗时只与本次抓取的条目数有关，与当天累计的数据量无关。
+        聚合文本的长度受单日抓取次数限制（见 schema.sql 中 news_item_stats 的说明），
+        跨日不会累积。
+
+        Args:
+            cursor: 数据库游标
+            rank_updates: [(news_item_id, rank, crawl_time)]，rank=0 表示脱榜
+        """
+        if not rank_updates:
+            return
+
+        cursor.executemany("""
+            INSERT INTO news_item_stats (news_item_id, ranks, rank_timeline)
+            VALUES (?, ?, ?)
+            ON CONFLICT(news_item_id) DO UPDATE SET
+                rank_timeline = CASE
+                    WHEN rank_timeline = '' THEN excluded.rank_timeline
+                    ELSE rank_timeline || ';' || excluded.rank_timeline
+                END,
+                ranks = CASE
+                    WHEN excluded.ranks = ''
+                      OR instr(',' || ranks || ',', ',' || excluded.ranks || ',') > 0 THEN ranks
+                    WHEN ranks = '' THEN excluded.ranks
+                    ELSE ranks || ',' || excluded.ranks
+                END
+        """, [
+            (news_id, str(rank) if rank != 0 else "", f"{rank}@{crawl_time}")
+            for news_id, rank, crawl_time in rank_updates
+        ])
+
+    def _rank_fields(
+        self,
+        current_rank: int,
+        last_crawl_time: str,
+        ranks_text: Optional[str],
+        timeline_text: Optional[str],
+        entry_cache: Optional[Dict[Tuple[str, int], Dict[str, Any]]] = None,
+    ) -> Tuple[List[int], List[Dict[str, Any]]]:
+        """
+        将排名聚合转换为 NewsItem 的 ranks 和 rank_timeline
+
+        Args:
+            entry_cache: 时间线节点缓存 {(时间, 排名): 节点}。一次读取内相同的
+                (时间, 排名) 节点只创建一次，由各条目共享（节点只读）
+
+        Returns:
+            (ranks, rank_timeline)，没有排名历史时 ranks 为 [current_rank]
+        """
+        if entry_cache is None:
+            entry_cache = {}
+
+        timeline: List[Tuple[str, int]] = []
+        for entry in timeline_text.split(";") if timeline_text else []:
+            rank, crawl_time = entry.split("@", 1)
+            timeline.append((crawl_time, int(rank)))
+
+        if any(timeline[i][0] < timeline[i - 1][0] for i in range(1, len(timeline))):
+            # 补录过更早的抓取：按时间重新排序并重算排名
+            timeline.sort(key=lambda entry: entry[0])
+            ranks = self._distinct_ranks(timeline)
+        else:
+            ranks = [int(rank) for rank in ranks_text.split(",")] if ranks_text else []
+
+        rank_timeline: List[Dict[str, Any]] = []
+        for crawl_time, rank in timeline:
+            # 只保留 last_crawl_time 之前的脱榜记录（rank=0），避免显示新闻永久脱榜后的无意义记录
+            if rank == 0 and crawl_time > last_crawl_time:
+                continue
+            entry = entry_cache.get((crawl_time, rank))
+            if entry is None:
+                # 提取时间部分（HH:MM）
+                time_part = crawl_time.split()[1][:5] if ' ' in crawl_time else crawl_time[:5]
+                entry = entry_cache[(crawl_time, rank)] = {
+                    "time": intern(time_part),
+                    "rank": rank if rank != 0 else None  # 0 转为 None 表示脱榜
+                }
+            rank_timeline.append(entry)
+
+        if not rank_timeline:
+            return [current_rank], rank_timeline
+        return ranks, rank_timeline
+
     def _detect_new_titles_impl(self, current_data: NewsData) -> Dict[str, Dict]:
         """
         检测新增的标题
@@ -733,7 +910,7 @@ class SQLiteStorageMixin:
             是否记录成功
         """
         try:
-            conn = self._get_connection(date)
+            conn = self._get_connection(date, write=True)
             cursor = conn.cursor()
 
             target_date = self._format_date_folder(date)
@@ -796,7 +973,7 @@ class SQLiteStorageMixin:
             是否记录成功
         """
         try:
-            conn = self._get_connection(date)
+            conn = self._get_connection(date, write=True)
             cursor = conn.cursor()
 
             target_date = self._format_date_folder(date)
@@ -834,7 +1011,7 @@ class SQLiteStorageMixin:
             (success, new_count, updated_count)
         """
         try:
-            conn = self._get_connection(data.date, db_type="rss")
+            conn = self._get_connection(data.date, db_type="rss", write=True)
             cursor = conn.cursor()
 
             now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
@@ -999,8 +1176,8 @@ class SQLiteStorageMixin:
             crawl_date = self._format_date_folder(date)
 
             for row in rows:
-                feed_id = row[2]
-                feed_name = row[3] or feed_id
+                feed_id = intern(row[2])
+                feed_name = intern(row[3] or feed_id)
 
                 id_to_name[feed_id] = feed_name
 
@@ -1015,9 +1192,9 @@ class SQLiteStorageMixin:
                     published_at=row[5] or "",
                     summary=row[6] or "",
                     author=row[7] or "",
-                    crawl_time=row[9],
-                    first_time=row[8],
-                    last_time=row[9],
+                    crawl_time=intern(row[9]),
+                    first_time=intern(row[8]),
+                    last_time=intern(row[9]),
                     count=row[10],
                 ))
 
@@ -1155,8 +1332,8 @@ class SQLiteStorageMixin:
             crawl_date = self._format_date_folder(date)
 
             for row in rows:
-                feed_id = row[2]
-                feed_name = row[3] or feed_id
+                feed_id = intern(row[2])
+                feed_name = intern(row[3] or feed_id)
 
                 id_to_name[feed_id] = feed_name
 
@@ -1171,9 +1348,9 @@ class SQLiteStorageMixin:
                     published_at=row[5] or "",
                     summary=row[6] or "",
                     author=row[7] or "",
-                    crawl_time=row[9],
-                    first_time=row[8],
-                    last_time=row[9],
+                    crawl_time=intern(row[9]),
+                    first_time=intern(row[8]),
+                    last_time=intern(row[9]),
                     count=row[10],
                 ))
 
@@ -1198,3 +1375,271 @@ class SQLiteStorageMixin:
         except Exception as e:
             print(f"[存储] 获取最新 RSS 数据失败: {e}")
             return None
+
+    def _get_rss_feed_cache_impl(self, date: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        获取 RSS 源的 HTTP 缓存
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            {feed_id: {feed_url, etag, last_modified, content_hash, items}}
+        """
+        try:
+            conn = self._get_connection(date, db_type="rss")
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT feed_id, feed_url, etag, last_modified, content_hash, items_json
+                FROM rss_feed_cache
+            """)
+
+            cache = {}
+            for row in cursor.fetchall():
+                try:
+                    items = json.loads(row[5])
+                except (TypeError, ValueError):
+                    continue
+                cache[row[0]] = {
+                    "feed_url": row[1],
+                    "etag": row[2] or "",
+                    "last_modified": row[3] or "",
+                    "content_hash": row[4] or "",
+                    "items": items,
+                }
+            return cache
+
+        except Exception as e:
+            print(f"[存储] 读取 RSS 缓存失败: {e}")
+            return {}
+
+    def _save_rss_feed_cache_impl(
+        self, cache: Dict[str, Dict[str, Any]], date: Optional[str] = None
+    ) -> bool:
+        """
+        保存 RSS 源的 HTTP 缓存（按 feed_id 覆盖）
+
+        Args:
+            cache: {feed_id: {feed_url, etag, last_modified, content_hash, items}}
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            是否保存成功
+        """
+        if not cache:
+            return True
+
+        try:
+            conn = self._get_connection(date, db_type="rss", write=True)
+            cursor = conn.cursor()
+
+            now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
+
+            # 满足 rss_feed_cache 的外键引用
+            cursor.executemany("""
+                INSERT OR IGNORE INTO rss_feeds (id, name, updated_at)
+                VALUES (?, ?, ?)
+            """, [(feed_id, feed_id, now_str) for feed_id in cache])
+
+            cursor.executemany("""
+                INSERT OR REPLACE INTO rss_feed_cache
+                (feed_id, feed_url, etag, last_modified, content_hash, items_json, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, [(feed_id, entry.get("feed_url", ""), entry.get("etag", ""),
+                   entry.get("last_modified", ""), entry.get("content_hash", ""),
+                   json.dumps(entry.get("items", []), ensure_ascii=False), now_str)
+                  for feed_id, entry in cache.items()])
+
+            conn.commit()
+            return True
+
+        except Exception as e:
+            print(f"[存储] 保存 RSS 缓存失败: {e}")
+            return False
+
+    # ========================================
+    # 自适应抓取调度
+    # ========================================
+
+    def _get_crawl_schedule_impl(
+        self, date: Optional[str] = None, db_type: str = "news"
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        获取自适应调度状态
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+            db_type: 数据库类型（news / rss）
+
+        Returns:
+            {source_id: {interval, churn, failures, last_crawl_at}}
+        """
+        try:
+            conn = self._get_connection(date, db_type=db_type)
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT source_id, interval_minutes, churn, consecutive_failures, last_crawl_at
+                FROM crawl_schedule
+            """)
+
+            return {
+                row[0]: {
+                    "interval": row[1] or 0.0,
+                    "churn": row[2],
+                    "failures": row[3] or 0,
+                    "last_crawl_at": row[4] or "",
+                }
+                for row in cursor.fetchall()
+            }
+
+        except Exception as e:
+            print(f"[存储] 读取调度状态失败: {e}")
+            return {}
+
+    def _save_crawl_schedule_impl(
+        self,
+        states: Dict[str, Dict[str, Any]],
+        date: Optional[str] = None,
+        db_type: str = "news",
+    ) -> bool:
+        """
+        保存自适应调度状态（按 source_id 覆盖）
+
+        Args:
+            states: {source_id: {interval, churn, failures, last_crawl_at}}
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+            db_type: 数据库类型（news / rss）
+
+        Returns:
+            是否保存成功
+        """
+        if not states:
+            return True
+
+        try:
+            conn = self._get_connection(date, db_type=db_type, write=True)
+            cursor = conn.cursor()
+
+            now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
+
+            cursor.executemany("""
+                INSERT OR REPLACE INTO crawl_schedule
+                (source_id, interval_minutes, churn, consecutive_failures,
+                 last_crawl_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, [(source_id, state.get("interval", 0.0), state.get("churn"),
+                   state.get("failures", 0), state.get("last_crawl_at", ""), now_str)
+                  for source_id, state in states.items()])
+
+            conn.commit()
+            return True
+
+        except Exception as e:
+            print(f"[存储] 保存调度状态失败: {e}")
+            return False
+
+    def _get_latest_platform_titles_impl(
+        self, platform_ids: List[str], date: Optional[str] = None
+    ) -> Dict[str, Dict]:
+        """
+        获取各平台最近一次在榜的标题（crawl_websites 结果格式）
+
+        用于自适应调度：未到期的平台沿用上次结果，保证当前榜单完整。
+
+        Args:
+            platform_ids: 平台 ID 列表
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            {platform_id: {title: {ranks, url, mobileUrl}}}
+        """
+        if not platform_ids:
+            return {}
+
+        try:
+            conn = self._get_connection(date)
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT n.platform_id, n.title, n.rank, n.url, n.mobile_url
+                FROM news_items n
+                JOIN (
+                    SELECT platform_id, MAX(last_crawl_time) AS latest_time
+                    FROM news_items
+                    GROUP BY platform_id
+                ) latest
+                  ON n.platform_id = latest.platform_id
+                 AND n.last_crawl_time = latest.latest_time
+                ORDER BY n.platform_id, n.rank
+            """)
+
+            wanted = set(platform_ids)
+            results: Dict[str, Dict] = {}
+            for platform_id, title, rank, url, mobile_url in cursor.fetchall():
+                if platform_id not in wanted:
+                    continue
+                titles = results.setdefault(platform_id, {})
+                if title in titles:
+                    titles[title]["ranks"].append(rank)
+                else:
+                    titles[title] = {
+                        "ranks": [rank],
+                        "url": url or "",
+                        "mobileUrl": mobile_url or "",
+                    }
+            return results
+
+        except Exception as e:
+            print(f"[存储] 获取平台最近数据失败: {e}")
+            return {}
+
+    # ========================================
+    # 数据源熔断
+    # ========================================
+
+    def _get_source_failure_stats_impl(
+        self, date: Optional[str] = None, db_type: str = "news"
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        统计各数据源的连续失败次数（从最近一次抓取往前数）
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+            db_type: 数据库类型（news / rss）
+
+        Returns:
+            {source_id: {failures, last_attempt}}，last_attempt 为最近一次抓取时间
+        """
+        if db_type == "rss":
+            status_table, records_table, id_column = "rss_crawl_status", "rss_crawl_records", "feed_id"
+        else:
+            status_table, records_table, id_column = "crawl_source_status", "crawl_records", "platform_id"
+
+        try:
+            conn = self._get_connection(date, db_type=db_type)
+            cursor = conn.cursor()
+
+            cursor.execute(f"""
+                SELECT s.{id_column}, r.crawl_time, s.status
+                FROM {status_table} s
+                JOIN {records_table} r ON s.crawl_record_id = r.id
+                ORDER BY r.crawl_time DESC
+            """)
+
+            stats: Dict[str, Dict[str, Any]] = {}
+            settled = set()
+            for source_id, crawl_time, status in cursor.fetchall():
+                if source_id in settled:
+                    continue
+                entry = stats.setdefault(source_id, {"failures": 0, "last_attempt": crawl_time})
+                if status == "failed":
+                    entry["failures"] += 1
+                else:
+                    settled.add(source_id)
+            return stats
+
+        except Exception as e:
+            print(f"[存储] 统计抓取失败次数失败: {e}")
+            return {}
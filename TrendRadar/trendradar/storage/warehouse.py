@@ -0,0 +1,245 @@
+# coding=utf-8
+"""
+多日合并数据库（数据仓库）
+
+按日期分库的热榜数据额外汇总到一个数据库 output/warehouse.db，
+跨日期的分析查询（趋势、时期对比、历史相关新闻）用一条 SQL 完成，无需逐日打开数据库文件。
+
+- 每次保存热榜数据后，通过 ATTACH 当日数据库重建该日期的汇总行（一个事务内完成）
+- 每个 (日期, 平台, 标题) 一行，与 MCP 按日读取的结果一致：
+  同平台同标题的多个条目以最后一条为准，排名历史按抓取时间排列
+- sources 表记录已汇总的日期，读取方据此判断查询范围是否完整覆盖
+- 配置了保留天数时，每次更新后删除超出保留天数的日期（与本地 / 远程存储的清理无关）
+
+汇总数据只是日期数据库的派生副本，删除 warehouse.db 后会在下次启用时重新导入。
+"""
+
+import re
+import sqlite3
+from datetime import datetime, timedelta
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import List, Union
+
+from trendradar.storage.archive import temporary_database
+from trendradar.storage.connection import SQLiteConnectionPool
+
+# 数据仓库文件名（位于数据目录下）
+WAREHOUSE_NAME = "warehouse.db"
+
+# 数据仓库结构版本（PRAGMA user_version）
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+-- 每个日期、平台、标题一行
+CREATE TABLE IF NOT EXISTS titles (
+    date TEXT NOT NULL,
+    platform_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    platform_name TEXT NOT NULL,
+    ranks TEXT NOT NULL,                 -- 排名历史，按抓取时间排列（如 "3,1,2"）
+    url TEXT NOT NULL DEFAULT '',
+    mobile_url TEXT NOT NULL DEFAULT '',
+    first_crawl_time TEXT NOT NULL DEFAULT '',
+    last_crawl_time TEXT NOT NULL DEFAULT '',
+    crawl_count INTEGER NOT NULL DEFAULT 1,
+    platform_seq INTEGER NOT NULL,       -- 平台在当日首次出现的顺序
+    item_seq INTEGER NOT NULL,           -- 标题在当日首次出现的顺序
+    PRIMARY KEY (date, platform_id, title)
+) WITHOUT ROWID;
+
+-- 已汇总的日期
+CREATE TABLE IF NOT EXISTS sources (
+    date TEXT PRIMARY KEY,
+    item_count INTEGER NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+# 从 ATTACH 的日期数据库（别名 day）重建某日的汇总行
+# 同平台同标题取 id 最大的条目（与按行覆盖字典的结果一致），顺序字段取首次出现的 id
+# 排名历史由 Python 按抓取时间拼接后放入临时表 item_ranks（group_concat 在 SQLite 3.44
+# 之前不支持 ORDER BY，子查询的顺序并不保证传递到聚合）
+_REFRESH_SQL = """
+INSERT INTO main.titles (
+    date, platform_id, title, platform_name, ranks, url, mobile_url,
+    first_crawl_time, last_crawl_time, crawl_count, platform_seq, item_seq
+)
+SELECT
+    :date, n.platform_id, n.title,
+    COALESCE(NULLIF(p.name, ''), n.platform_id),
+    COALESCE(h.ranks, CAST(n.rank AS TEXT)),
+    COALESCE(n.url, ''), COALESCE(n.mobile_url, ''),
+    COALESCE(n.first_crawl_time, ''), COALESCE(n.last_crawl_time, ''),
+    COALESCE(NULLIF(n.crawl_count, 0), 1),
+    ps.seq, g.first_id
+FROM (
+    SELECT platform_id, title, MIN(id) AS first_id, MAX(id) AS last_id
+    FROM day.news_items
+    GROUP BY platform_id, title
+) g
+JOIN day.news_items n ON n.id = g.last_id
+JOIN (
+    SELECT platform_id, MIN(id) AS seq FROM day.news_items GROUP BY platform_id
+) ps ON ps.platform_id = n.platform_id
+LEFT JOIN day.platforms p ON p.id = n.platform_id
+LEFT JOIN temp.item_ranks h ON h.news_item_id = n.id
+"""
+
+# 按条目、抓取时间顺序读取排名历史（走 idx_rank_history_news_time，无需临时排序）
+_RANK_HISTORY_SQL = """
+SELECT news_item_id, rank FROM day.rank_history
+ORDER BY news_item_id, crawl_time
+"""
+
+
+def get_warehouse_path(data_dir: Union[str, Path]) -> Path:
+    """获取数据目录下的数据仓库路径"""
+    return Path(data_dir) / WAREHOUSE_NAME
+
+
+def init_warehouse(conn: sqlite3.Connection) -> None:
+    """创建数据仓库表结构"""
+    conn.executescript(_SCHEMA)
+    conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+    conn.commit()
+
+
+class NewsWarehouse:
+    """热榜数据仓库（写入端）"""
+
+    def __init__(self, path: Union[str, Path], retention_days: int = 0):
+        """
+        初始化数据仓库
+
+        Args:
+            path: 数据仓库文件路径
+            retention_days: 汇总数据保留天数（0 表示不清理）
+        """
+        self.path = Path(path)
+        self.retention_days = retention_days
+        self._pool = SQLiteConnectionPool(max_connections=1)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        return self._pool.get(self.path, on_open=init_warehouse)
+
+    def refresh(self, date: str, db_path: Union[str, Path]) -> bool:
+        """
+        用日期数据库的当前内容重建该日期的汇总行
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD）
+            db_path: 该日期的热榜数据库路径
+
+        Returns:
+            是否成功（失败只打印日志，不影响数据保存）
+        """
+        conn = None
+        attached = False
+        try:
+            conn = self._get_connection()
+            conn.execute("ATTACH DATABASE ? AS day", (str(db_path),))
+            attached = True
+
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS item_ranks "
+                "(news_item_id INTEGER PRIMARY KEY, ranks TEXT NOT NULL)"
+            )
+            conn.execute("DELETE FROM temp.item_ranks")
+            history = conn.execute(_RANK_HISTORY_SQL).fetchall()
+            conn.executemany(
+                "INSERT INTO temp.item_ranks (news_item_id, ranks) VALUES (?, ?)",
+                [
+                    (news_id, ",".join(str(rank) for _, rank in rows))
+                    for news_id, rows in groupby(history, key=itemgetter(0))
+                ],
+            )
+
+            conn.execute("DELETE FROM titles WHERE date = ?", (date,))
+            item_count = conn.execute(_REFRESH_SQL, {"date": date}).rowcount
+            conn.execute(
+                "INSERT OR REPLACE INTO sources (date, item_count, updated_at) "
+                "VALUES (?, ?, CURRENT_TIMESTAMP)",
+                (date, item_count),
+            )
+            conn.execute("DELETE FROM temp.item_ranks")
+            removed = self._prune(conn, date)
+            conn.commit()
+
+            if removed > 0:
+                print(f"[数据仓库] 已删除 {removed} 天的过期数据")
+            return True
+
+        except Exception as e:
+            if conn is not None and conn.in_transaction:
+                conn.rollback()
+            print(f"[数据仓库] 更新 {date} 失败: {e}")
+            return False
+
+        finally:
+            if attached:
+                conn.execute("DETACH DATABASE day")
+
+    def get_dates(self) -> List[str]:
+        """获取已汇总的日期列表（升序）"""
+        conn = self._get_connection()
+        return [row[0] for row in conn.execute("SELECT date FROM sources ORDER BY date")]
+
+    def backfill(self, news_dir: Union[str, Path]) -> int:
+        """
+        导入尚未汇总的历史日期（首次启用或删除数据仓库后执行）
+
+        已归档的日期（{date}.db.xz）逐个解压为临时文件导入，导入后即删除，不占用解压缓存。
+
+        Args:
+            news_dir: 热榜数据库目录（output/news）
+
+        Returns:
+            导入的日期数量
+        """
+        news_dir = Path(news_dir)
+        if not news_dir.exists():
+            return 0
+
+        existing = set(self.get_dates())
+        pending = set()
+        for db_file in news_dir.glob("*.db*"):
+            date_match = re.match(r'(\d{4}-\d{2}-\d{2})\.db(?:\.xz)?$', db_file.name)
+            if date_match and date_match.group(1) not in existing:
+                pending.add(date_match.group(1))
+
+        imported = 0
+        for date in sorted(pending):
+            with temporary_database(news_dir / f"{date}.db") as db_path:
+                if db_path is not None and self.refresh(date, db_path):
+                    imported += 1
+
+        if imported > 0:
+            print(f"[数据仓库] 已导入 {imported} 天的历史数据")
+        return imported
+
+    def _prune(self, conn: sqlite3.Connection, date: str) -> int:
+        """删除相对 date 超出保留天数的汇总数据（在调用方的事务内执行），返回删除的日期数量"""
+        if self.retention_days <= 0:
+            return 0
+        cutoff_date = (datetime.strptime(date, "%Y-%m-%d") - timedelta(days=self.retention_days)).strftime("%Y-%m-%d")
+        conn.execute("DELETE FROM titles WHERE date <= ?", (cutoff_date,))
+        return conn.execute("DELETE FROM sources WHERE date <= ?", (cutoff_date,)).rowcount
+
+    def prune(self, date: str) -> int:
+        """
+        删除相对 date（通常为今天）超出保留天数的汇总数据
+
+        Returns:
+            删除的日期数量
+        """
+        conn = self._get_connection()
+        with conn:
+            return self._prune(conn, date)
+
+    def close(self) -> None:
+        """关闭数据仓库连接"""
+        self._pool.close_all()